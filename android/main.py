@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -21,7 +20,21 @@ from kivymd.uix.list import MDList, OneLineAvatarIconListItem
 from kivymd.uix.selectioncontrol import MDCheckbox
 from kivymd.uix.snackbar import Snackbar
 
-from clicker_core.model import AppConfig, ClickPoint, LoopSettings, ScreenSize, config_from_json_dict, config_to_json_dict_v2
+from clicker_core.backends import BackendError, InputBackend
+from clicker_core.configio import load_config_file, save_config_file
+from clicker_core.control import ParamBlock, RunParams
+from clicker_core.engine import BACKEND_ERROR, COMPLETED, STOPPED, RunPlan, Sequencer, SequencerObserver
+from clicker_core.model import (
+    BURST_CPS_MAX,
+    BURST_CPS_MIN,
+    AppConfig,
+    BurstSettings,
+    ClickPoint,
+    LoopSettings,
+    PointStore,
+    ScreenSize,
+)
+from clicker_core.persist import BackgroundSaver, SaveResult
 from android_bridge import (
     is_accessibility_enabled,
     open_accessibility_settings,
@@ -31,6 +44,11 @@ from android_bridge import (
 )
 
 
+# 编辑后多久无新修改才自动保存到默认配置。
+AUTOSAVE_DELAY_S = 1.5
+# 退出时等待后台保存完成的最长秒数。
+SAVE_FLUSH_TIMEOUT_S = 10.0
+
 KV = r"""
 <PointListItem>:
     text: root.text
@@ -122,6 +140,30 @@ KV = r"""
                     input_filter: "int"
                     helper_text: "间隔时间（ms，100-5000）"
                     helper_text_mode: "on_focus"
+                    disabled: burst_enabled.active
+                    on_text: app.publish_params()
+
+                MDBoxLayout:
+                    orientation: "horizontal"
+                    size_hint_y: None
+                    height: self.minimum_height
+                    spacing: "8dp"
+                    MDCheckbox:
+                        id: burst_enabled
+                        active: False
+                    MDLabel:
+                        text: "连发模式"
+                        valign: "middle"
+
+                MDTextField:
+                    id: burst_cps
+                    text: "100"
+                    mode: "rectangle"
+                    input_filter: "int"
+                    helper_text: "连发速率（次/秒，1-1000）"
+                    helper_text_mode: "on_focus"
+                    disabled: not burst_enabled.active
+                    on_text: app.publish_params()
 
                 MDBoxLayout:
                     orientation: "horizontal"
@@ -165,6 +207,7 @@ KV = r"""
                     helper_text: "循环间隔（ms）"
                     helper_text_mode: "on_focus"
                     disabled: not loop_enabled.active
+                    on_text: app.publish_params()
 
 <RecordScreen>:
     name: "record"
@@ -197,12 +240,12 @@ KV = r"""
         FileChooserListView:
             id: chooser
             path: app.user_data_dir
-            filters: ["*.json"]
+            filters: ["*.json", "*.clkb"]
         MDTextField:
             id: filename
             text: "config.json"
             mode: "rectangle"
-            helper_text: "保存时填写文件名（.json）"
+            helper_text: "保存时填写文件名（.json 或 .clkb）"
             helper_text_mode: "on_focus"
         MDBoxLayout:
             size_hint_y: None
@@ -279,10 +322,16 @@ class AndroidClickerApp(MDApp):
         self._default_path = Path(self.user_data_dir) / "config.json"
         self._running = False
         self._paused = False
-        self._cursor = 0
+        self._sequencer: Optional[Sequencer] = None
+        self._params = ParamBlock()
         self._clock_ev = None
-        self._cycle_done = 0
         self._file_mode: str = "open"
+        self._dirty = False
+        self._saver = BackgroundSaver(
+            save_config_file,
+            on_done=lambda result: Clock.schedule_once(lambda _dt: self._on_save_done(result)),
+        )
+        self._autosave_trigger = Clock.create_trigger(lambda _dt: self._autosave(), AUTOSAVE_DELAY_S)
 
     def build(self):
         self.theme_cls.primary_palette = "Blue"
@@ -316,6 +365,7 @@ class AndroidClickerApp(MDApp):
         ry = float(y) / float(max(1, screen.height - 1))
         self.points.append(ClickPoint.from_ratio(rx, ry, screen=screen))
         self._refresh_points_list()
+        self._mark_dirty()
         Snackbar(text="已添加坐标点").open()
 
     def on_item_tapped(self, item: PointListItem):
@@ -353,6 +403,7 @@ class AndroidClickerApp(MDApp):
         pts.insert(to_idx, moving)
         self.points = pts
         self._refresh_points_list()
+        self._mark_dirty()
         Snackbar(text=f"已调整顺序：{from_idx + 1} → {to_idx + 1}").open()
 
     def delete_selected(self):
@@ -371,6 +422,7 @@ class AndroidClickerApp(MDApp):
                 if 0 <= idx < len(self.points):
                     self.points.pop(idx)
             self._refresh_points_list()
+            self._mark_dirty()
 
         self._confirm("确认删除", f"确定删除选中的 {len(selected)} 个点吗？", do_delete)
 
@@ -394,7 +446,11 @@ class AndroidClickerApp(MDApp):
         loop_count = self._clamp_int(self.main_screen.ids.loop_count.text, 1, 999, 1)
         loop_interval = self._clamp_int(self.main_screen.ids.loop_interval.text, 0, 10000, 0)
         loop = LoopSettings(enabled=loop_enabled, infinite=loop_infinite, count=loop_count, interval_ms=loop_interval)
-        return AppConfig(points=list(self.points), interval_ms=interval, loop=loop)
+        burst = BurstSettings(
+            enabled=bool(self.main_screen.ids.burst_enabled.active),
+            cps=self._clamp_int(self.main_screen.ids.burst_cps.text, BURST_CPS_MIN, BURST_CPS_MAX, 100),
+        )
+        return AppConfig(points=list(self.points), interval_ms=interval, loop=loop, burst=burst)
 
     def save_default(self):
         self._save_to_path(self._default_path)
@@ -429,7 +485,7 @@ class AndroidClickerApp(MDApp):
         if not filename:
             Snackbar(text="请输入文件名").open()
             return
-        if not filename.lower().endswith(".json"):
+        if not filename.lower().endswith((".json", ".clkb")):
             filename = f"{filename}.json"
         path = Path(chooser.path) / filename
         self._save_to_path(path)
@@ -442,8 +498,7 @@ class AndroidClickerApp(MDApp):
 
     def _load_from_path(self, path: Path):
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            cfg = config_from_json_dict(data)
+            cfg = load_config_file(path)
         except Exception as exc:  # noqa: BLE001
             Snackbar(text=f"导入失败：{exc}").open()
             return
@@ -453,15 +508,45 @@ class AndroidClickerApp(MDApp):
         self.main_screen.ids.loop_infinite.active = bool(cfg.loop.infinite)
         self.main_screen.ids.loop_count.text = str(int(cfg.loop.count))
         self.main_screen.ids.loop_interval.text = str(int(cfg.loop.interval_ms))
+        self.main_screen.ids.burst_enabled.active = bool(cfg.burst.enabled)
+        self.main_screen.ids.burst_cps.text = str(int(cfg.burst.cps))
         Snackbar(text=f"已导入：{path.name}").open()
 
-    def _save_to_path(self, path: Path):
+    def _save_to_path(self, path: Path, autosave: bool = False):
+        """在后台线程序列化并原子写入，结果通过 Clock 回到界面线程。"""
         cfg = self._collect_config()
         screen = ScreenSize(width=max(1, int(Window.width)), height=max(1, int(Window.height)))
-        data = config_to_json_dict_v2(cfg, screen=screen)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-        Snackbar(text=f"已保存：{path.name}").open()
+        self._saver.save(path, cfg, screen=screen, autosave=autosave)
+
+    def _on_save_done(self, result: SaveResult):
+        name = Path(result.path).name
+        if result.error is not None:
+            Snackbar(text=f"保存失败：{result.error}").open()
+            return
+        if not result.autosave:
+            Snackbar(text=f"已保存：{name}").open()
+
+    def _mark_dirty(self):
+        """编辑后重新计时；连续编辑只触发一次自动保存。"""
+        self._dirty = True
+        self._autosave_trigger.cancel()
+        self._autosave_trigger()
+
+    def _autosave(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._save_to_path(self._default_path, autosave=True)
+
+    def on_pause(self):
+        self._autosave_trigger.cancel()
+        self._autosave()
+        return True
+
+    def on_stop(self):
+        self._autosave_trigger.cancel()
+        self._autosave()
+        self._saver.close(timeout=SAVE_FLUSH_TIMEOUT_S)
 
     def _clamp_int(self, value: str, min_v: int, max_v: int, default: int) -> int:
         try:
@@ -488,88 +573,130 @@ class AndroidClickerApp(MDApp):
             return
 
         start_foreground_service()
+        config = self._collect_config()
+        self._params.publish(self._run_params(config))
+        plan = RunPlan(points=PointStore.from_points(self.points), loop=config.loop, burst=config.burst)
+        self._sequencer = Sequencer(plan, AccessibilityBackend(self._screen_size), self._params, _KivyObserver(self))
         self._running = True
         self._paused = False
-        self._cursor = 0
         self.main_screen.ids.btn_start.disabled = True
         self.main_screen.ids.btn_pause.disabled = False
         self.main_screen.ids.btn_stop.disabled = False
         self.main_screen.ids.btn_pause.text = "暂停"
         self.main_screen.ids.status_label.text = "运行"
-        self._schedule_next(0)
+        self._schedule(self._sequencer.start())
+
+    def _run_params(self, config: AppConfig) -> RunParams:
+        return RunParams(
+            interval_ms=config.interval_ms,
+            loop_interval_ms=config.loop.interval_ms,
+            burst_cps=config.burst.cps,
+        )
+
+    def publish_params(self):
+        """运行中修改间隔/连发速率/循环间隔时实时生效。"""
+        if self._running:
+            self._params.publish(self._run_params(self._collect_config()))
+
+    def _screen_size(self) -> ScreenSize:
+        return ScreenSize(width=max(1, int(Window.width)), height=max(1, int(Window.height)))
 
     def pause_or_resume(self):
-        if not self._running:
+        if not self._running or self._sequencer is None:
             return
         self._paused = not self._paused
         self.main_screen.ids.btn_pause.text = "继续" if self._paused else "暂停"
         self.main_screen.ids.status_label.text = "暂停" if self._paused else "运行"
-        if not self._paused:
-            self._schedule_next(0)
+        if self._paused:
+            self._cancel_tick()
+            self._sequencer.pause()
+        else:
+            self._sequencer.resume()
+            self._schedule(self._sequencer.next_wake())
 
     def stop(self):
-        if not self._running:
+        if not self._running or self._sequencer is None:
             return
-        self._running = False
-        self._paused = False
-        self._cursor = 0
+        self._sequencer.stop()
+        self._finish_run()
+
+    def _cancel_tick(self):
         if self._clock_ev is not None:
             try:
                 self._clock_ev.cancel()
             except Exception:  # noqa: BLE001
                 pass
             self._clock_ev = None
+
+    def _schedule(self, deadline: Optional[float]):
+        """在 ``deadline``（引擎时钟）到期时再推进一次；None 表示运行已结束。"""
+        sequencer = self._sequencer
+        if sequencer is None:
+            return
+        if deadline is None:
+            self._finish_run()
+            return
+        delay_s = max(0.0, deadline - sequencer.clock())
+        self._clock_ev = Clock.schedule_once(self._tick, delay_s)
+
+    def _tick(self, _dt):
+        self._clock_ev = None
+        if not self._running or self._paused or self._sequencer is None:
+            return
+        self._schedule(self._sequencer.step())
+
+    def _finish_run(self):
+        sequencer = self._sequencer
+        self._sequencer = None
+        self._running = False
+        self._paused = False
+        self._cancel_tick()
         stop_foreground_service()
         self.main_screen.ids.btn_start.disabled = False
         self.main_screen.ids.btn_pause.disabled = True
         self.main_screen.ids.btn_stop.disabled = True
         self.main_screen.ids.btn_pause.text = "暂停"
-        self.main_screen.ids.status_label.text = "停止"
-        Snackbar(text="已停止").open()
-
-    def _schedule_next(self, delay_ms: int):
-        if not self._running or self._paused:
+        if sequencer is None:
             return
-        delay_s = max(0.0, float(delay_ms) / 1000.0)
-        self._clock_ev = Clock.schedule_once(lambda *_: self._do_step(), delay_s)
+        if sequencer.outcome == STOPPED:
+            self.main_screen.ids.status_label.text = "停止"
+            Snackbar(text="已停止").open()
+        elif sequencer.outcome == COMPLETED:
+            self.main_screen.ids.status_label.text = "完成"
+            Snackbar(text="循环完成" if sequencer.plan.loop.enabled else "执行完成").open()
+        elif sequencer.outcome == BACKEND_ERROR:
+            self.main_screen.ids.status_label.text = "错误"
+            Snackbar(text="点击发送失败：请确认无障碍服务已开启").open()
+        else:
+            self.main_screen.ids.status_label.text = "错误"
+            Snackbar(text=sequencer.error or "执行失败").open()
 
-    def _do_step(self):
-        if not self._running or self._paused:
-            return
-        interval = self._clamp_int(self.main_screen.ids.interval_input.text, 100, 5000, 500)
-        screen = ScreenSize(width=max(1, int(Window.width)), height=max(1, int(Window.height)))
 
-        point = self.points[self._cursor]
-        x, y = point.to_pixels(screen)
-        ok = send_click(int(x), int(y))
-        if not ok:
-            self.stop()
-            Snackbar(text="点击发送失败：请确认无障碍服务已开启").open()
-            return
+class AccessibilityBackend(InputBackend):
+    """经无障碍服务广播注入点击的安卓后端。"""
 
-        self._cursor += 1
-        if self._cursor >= len(self.points):
-            cfg = self._collect_config()
-            if not cfg.loop.enabled:
-                self.stop()
-                self.main_screen.ids.status_label.text = "完成"
-                Snackbar(text="执行完成").open()
-                return
-            self._cursor = 0
-            if cfg.loop.infinite:
-                self._schedule_next(cfg.loop.interval_ms)
-                return
-            self._cycle_done += 1
-            if self._cycle_done >= max(1, int(cfg.loop.count)):
-                self.stop()
-                self.main_screen.ids.status_label.text = "完成"
-                Snackbar(text="循环完成").open()
-                self._cycle_done = 0
-                return
-            self._schedule_next(cfg.loop.interval_ms)
-            return
+    name = "android"
+
+    def __init__(self, screen_size) -> None:
+        self._screen_size = screen_size
+
+    def screen_size(self) -> ScreenSize:
+        return self._screen_size()
+
+    def click(self, x: int, y: int) -> None:
+        if not send_click(int(x), int(y)):
+            raise BackendError("无障碍服务未响应")
+
+
+class _KivyObserver(SequencerObserver):
+    """在状态栏显示轮次进度（回调均在 Kivy 主线程中）。"""
+
+    def __init__(self, app: AndroidClickerApp) -> None:
+        self._app = app
 
-        self._schedule_next(interval)
+    def on_cycle(self, cycle: int, cycles_total: int) -> None:
+        total = "∞" if cycles_total == 0 else str(cycles_total)
+        self._app.main_screen.ids.status_label.text = f"运行（第 {cycle}/{total} 轮）"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,207 @@
+"""命令行无界面运行：``sequential-clicker run config.json``。
+
+只依赖 ``clicker_core`` 与输入后端，不导入 PyQt6，适合脚本与计划任务调用。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import signal
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from clicker_core.backends import BackendError, InputBackend, backend_names, load_backend
+from clicker_core.configio import load_config_file
+from clicker_core.control import ParamBlock, RunControl, RunParams
+from clicker_core.engine import (
+    BACKEND_ERROR,
+    COMPLETED,
+    FAILSAFE,
+    PLAN_ERROR,
+    STOPPED,
+    InstrumentObserver,
+    RunPlan,
+    Sequencer,
+    run_blocking,
+)
+from clicker_core.model import AppConfig, BURST_CPS_MAX, BURST_CPS_MIN, PointStore
+from clicker_core.telemetry import ClickTelemetry
+
+# 退出码：0 完成；2 为参数错误（argparse）；被信号停止时为 128 + 信号编号（与 shell 约定一致）
+EXIT_OK = 0
+EXIT_RUN_ERROR = 1
+EXIT_USAGE = 2
+EXIT_CONFIG = 3
+EXIT_BACKEND = 4
+EXIT_FAILSAFE = 5
+
+
+@dataclass(slots=True)
+class RunResult:
+    """一次命令行运行的结果，``--json`` 时整体输出到 stdout。"""
+
+    status: str
+    exit_code: int
+    clicks: int = 0
+    cycles: int = 0
+    elapsed_s: float = 0.0
+    message: str = ""
+    signal: Optional[int] = None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="sequential-clicker", description="顺序连点器（无界面模式）")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="按配置文件执行连点")
+    run.add_argument("config", help="配置文件（.json 或 .clkb）")
+    loops = run.add_mutually_exclusive_group()
+    loops.add_argument("--loops", type=int, metavar="N", help="循环次数（覆盖配置）")
+    loops.add_argument("--infinite", action="store_true", help="无限循环，直到收到 SIGINT/SIGTERM")
+    run.add_argument("--interval", type=int, metavar="MS", help="点击间隔毫秒（覆盖配置）")
+    run.add_argument("--loop-interval", type=int, metavar="MS", help="每轮之间的间隔毫秒（覆盖配置）")
+    run.add_argument("--burst", type=int, metavar="CPS", help=f"连发模式，目标每秒点击数（{BURST_CPS_MIN}-{BURST_CPS_MAX}）")
+    run.add_argument("--backend", choices=backend_names(), help="输入后端（默认自动选择）")
+    run.add_argument("--json", action="store_true", help="结束时在 stdout 输出一行 JSON 结果")
+    return parser
+
+
+def _apply_overrides(config: AppConfig, args: argparse.Namespace) -> AppConfig:
+    if args.interval is not None:
+        config.interval_ms = max(0, args.interval)
+    if args.loops is not None:
+        config.loop.enabled = True
+        config.loop.infinite = False
+        config.loop.count = max(1, args.loops)
+    if args.infinite:
+        config.loop.enabled = True
+        config.loop.infinite = True
+    if args.loop_interval is not None:
+        config.loop.interval_ms = max(0, args.loop_interval)
+    if args.burst is not None:
+        config.burst.enabled = True
+        config.burst.cps = min(BURST_CPS_MAX, max(BURST_CPS_MIN, args.burst))
+    return config
+
+
+class _SignalStop:
+    """把 SIGINT/SIGTERM 转为 :meth:`RunControl.request_stop`，退出时恢复原处理器。"""
+
+    def __init__(self, control: RunControl) -> None:
+        self._control = control
+        self._previous: dict[int, Any] = {}
+        self.signum: Optional[int] = None
+
+    def __enter__(self) -> "_SignalStop":
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            self._previous[signum] = signal.signal(signum, self._handle)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        for signum, handler in self._previous.items():
+            signal.signal(signum, handler)
+
+    def _handle(self, signum: int, frame: object) -> None:
+        if self.signum is None:
+            self.signum = signum
+        self._control.request_stop()
+
+
+# 执行结果 → (status, 退出码)；status 取值是 ``--json`` 输出的一部分，保持不变
+_OUTCOMES = {
+    COMPLETED: ("completed", EXIT_OK),
+    STOPPED: ("stopped", EXIT_OK),
+    FAILSAFE: ("failsafe", EXIT_FAILSAFE),
+    PLAN_ERROR: ("error", EXIT_CONFIG),
+    BACKEND_ERROR: ("error", EXIT_RUN_ERROR),
+}
+
+
+def _status(sequencer: Sequencer) -> tuple[str, int]:
+    if sequencer.outcome == BACKEND_ERROR and sequencer.screen is None:
+        # 开始时就拿不到屏幕尺寸：后端不可用
+        return "error", EXIT_BACKEND
+    return _OUTCOMES.get(sequencer.outcome, ("error", EXIT_RUN_ERROR))
+
+
+def run_config(
+    config: AppConfig,
+    backend: InputBackend,
+    control: RunControl,
+    telemetry: Optional[ClickTelemetry] = None,
+) -> RunResult:
+    """在当前线程按 ``config`` 执行，直到完成、出错或 ``control`` 被停止。"""
+    plan = RunPlan(points=PointStore.from_points(config.points), loop=config.loop, burst=config.burst)
+    params = ParamBlock(
+        RunParams(
+            interval_ms=config.interval_ms,
+            loop_interval_ms=config.loop.interval_ms,
+            burst_cps=config.burst.cps,
+        )
+    )
+    sequencer = Sequencer(plan, backend, params, InstrumentObserver(telemetry=telemetry))
+    run_blocking(sequencer, control)
+    summary = sequencer.summary()
+    status, exit_code = _status(sequencer)
+    return RunResult(
+        status=status,
+        exit_code=exit_code,
+        clicks=summary.clicks,
+        cycles=summary.cycles,
+        elapsed_s=summary.elapsed_s,
+        message=sequencer.error or "",
+    )
+
+
+def _emit(result: RunResult, as_json: bool, telemetry: ClickTelemetry) -> int:
+    if as_json:
+        stats = telemetry.summary()
+        payload = {
+            "status": result.status,
+            "exit_code": result.exit_code,
+            "clicks": result.clicks,
+            "cycles": result.cycles,
+            "elapsed_s": round(result.elapsed_s, 3),
+            "signal": result.signal,
+            "message": result.message,
+            "cps": round(stats.cps, 2),
+            "jitter_p99_ms": round(stats.jitter.p99, 3),
+            "latency_p99_ms": round(stats.latency.p99, 3),
+        }
+        sys.stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+    elif result.message:
+        sys.stderr.write(result.message + "\n")
+    return result.exit_code
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    telemetry = ClickTelemetry()
+
+    try:
+        config = _apply_overrides(load_config_file(args.config), args)
+    except (OSError, ValueError) as exc:
+        return _emit(RunResult("error", EXIT_CONFIG, message=f"读取配置失败：{exc}"), args.json, telemetry)
+
+    try:
+        backend = load_backend(args.backend)
+    except BackendError as exc:
+        return _emit(RunResult("error", EXIT_BACKEND, message=f"输入后端加载失败：{exc}"), args.json, telemetry)
+
+    control = RunControl()
+    try:
+        with _SignalStop(control) as stop:
+            result = run_config(config, backend, control, telemetry)
+    finally:
+        backend.close()
+    if stop.signum is not None:
+        result.status = "interrupted"
+        result.signal = stop.signum
+        result.exit_code = 128 + stop.signum
+    return _emit(result, args.json, telemetry)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
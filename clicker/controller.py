@@ -2,30 +2,62 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import threading
+import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from PyQt6.QtCore import QThread
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QGuiApplication
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
+from clicker_core.cache import ConfigCache
+from clicker_core.configio import FILE_FILTER, iter_config_points, save_config_file
+from clicker_core.control import ParamBlock, RunParams
+from clicker_core.engine import RunPlan
+from clicker_core.logpipe import LogPipeline, log_event
 from clicker_core.model import (
     AppConfig,
+    BurstSettings,
     ClickPoint,
     HotkeySettings,
     LoopSettings,
+    PointStore,
     ScreenSize,
-    config_from_json_dict,
-    config_to_json_dict_v2,
+    row_moves,
+    row_ranges,
+    to_absolute,
     validate_point,
+    validate_points,
 )
+from clicker_core.persist import BackgroundSaver, SaveResult
+from clicker_core.plan import PlanError, compile_plan
+from clicker_core.trace import TRACE_SUFFIX, TraceRecorder, save_trace
 from .settings import AppSettings
 from .view import MainWindow
-from .worker import ClickWorker, RunPlan
+from .worker import ClickWorker
+
+if TYPE_CHECKING:
+    from PyQt6.QtMultimedia import QSoundEffect
+
+# 进度采样周期（约 30Hz），与工作线程的点击速率解耦。
+_PROGRESS_REFRESH_MS = 33
+# 统计面板刷新周期；排序百分位的开销不必跟进度条同频。
+_STATS_REFRESH_MS = 500
+# 编辑后多久无新修改才自动保存。
+_AUTOSAVE_DELAY_MS = 1500
+# 退出时等待后台保存完成的最长秒数。
+_SAVE_FLUSH_TIMEOUT_S = 10.0
+# 退出时等待执行线程结束的最长毫秒数。
+_WORKER_SHUTDOWN_TIMEOUT_MS = 2000
+# 运行轨迹目录中保留的文件数。
+_TRACE_KEEP = 10
+# 不超过该点数的计划在界面线程预编译（纯 Python 约几毫秒），更大的交给执行线程。
+_PRECOMPILE_MAX_POINTS = 20_000
 
 
 def _app_data_dir() -> Path:
@@ -36,21 +68,38 @@ def _app_data_dir() -> Path:
     return base
 
 
-def _setup_logger() -> logging.Logger:
-    from logging.handlers import RotatingFileHandler
+_log_pipeline: Optional[LogPipeline] = None
+
 
+def _setup_logger() -> logging.Logger:
+    """history.log 经有界队列由专用线程写入，界面线程与工作线程记录日志时从不等待磁盘。"""
+    global _log_pipeline
     logger = logging.getLogger("sequential_clicker")
-    if logger.handlers:
+    if _log_pipeline is not None:
         return logger
     logger.setLevel(logging.INFO)
-    log_path = _app_data_dir() / "history.log"
-    handler = RotatingFileHandler(log_path, maxBytes=512_000, backupCount=3, encoding="utf-8")
-    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger.propagate = False
+    _log_pipeline = LogPipeline(logger, _app_data_dir() / "history.log")
     return logger
 
 
+def _shutdown_logger() -> None:
+    global _log_pipeline
+    if _log_pipeline is None:
+        return
+    if _log_pipeline.dropped:
+        logging.getLogger("sequential_clicker").warning("log_dropped_total count=%s", _log_pipeline.dropped)
+    _log_pipeline.stop()
+    _log_pipeline = None
+
+
+class _SaveRelay(QObject):
+    """把保存线程的结果转发到界面线程。"""
+
+    saved = pyqtSignal(object)
+    traced = pyqtSignal(str, str)
+
+
 class Controller:
     """连接 View 与 Model 的控制器。"""
 
@@ -60,16 +109,59 @@ class Controller:
         self.logger = _setup_logger()
 
         self._current_file: Optional[str] = None
-        self._points: list[ClickPoint] = []
-
-        self._thread: Optional[QThread] = None
-        self._worker: Optional[ClickWorker] = None
+        self._points = PointStore()
+
+        self._running = False
+        # 常驻执行线程：后端只加载一次，每次运行只经命令队列提交计划
+        self._worker = ClickWorker()
+        self._thread = QThread(self.window)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.serve)
+        self._worker.statusChanged.connect(self.window.set_state)
+        self._worker.errorOccurred.connect(self._on_worker_error)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._thread.start()
         self._paused: bool = False
         self._stop_requested: bool = False
         self._error_occurred: bool = False
+        self._watched_screen = None
+
+        self._progress_timer = QTimer(self.window)
+        self._progress_timer.setInterval(_PROGRESS_REFRESH_MS)
+        self._progress_timer.timeout.connect(self._sample_progress)
+        self._progress_version = -1
 
+        self._stats_timer = QTimer(self.window)
+        self._stats_timer.setInterval(_STATS_REFRESH_MS)
+        self._stats_timer.timeout.connect(self._sample_stats)
+
+        self._params = ParamBlock()
+        self._run_info: dict[str, object] = {}
+
+        self._config_cache = ConfigCache(
+            budget_bytes=self.settings.cache_budget_mb() << 20,
+            persist_dir=_app_data_dir() / "cache",
+        )
+        for path in self.settings.pinned_files():
+            self._config_cache.pin(path)
+        self._config_cache.prewarm(self.settings.pinned_files() + self.settings.recent_files())
+
+        self._save_relay = _SaveRelay()
+        self._save_relay.saved.connect(self._on_save_done)
+        self._save_relay.traced.connect(self._on_trace_saved)
+        self._trace_runs = self.settings.trace_enabled()
+        self._trace_threads: list[threading.Thread] = []
+        self._trace_seq = 0
+        self._saver = BackgroundSaver(save_config_file, on_done=self._save_relay.saved.emit)
+        self._autosave = self.settings.autosave_enabled()
+        self._autosave_timer = QTimer(self.window)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.setInterval(_AUTOSAVE_DELAY_MS)
+        self._autosave_timer.timeout.connect(self._autosave_now)
+
+        # QtMultimedia 较重，首次需要播放提示音时才加载
         self._sound: Optional[QSoundEffect] = None
-        self._init_sound()
+        self._sound_loaded = False
 
         self._hotkeys_enabled = False
         self._keyboard = None
@@ -78,28 +170,39 @@ class Controller:
         max_x, max_y = self._screen_max_xy()
         self.window.set_point_bounds(max_x, max_y)
         self._connect_screen_signals()
+        self._on_burst_ui_changed()
         self._refresh_recent_menu()
         self.window.update_points(self._points)
+        self.window.action_autosave.setChecked(self._autosave)
+        self.window.action_trace.setChecked(self._trace_runs)
+        # 事件循环开始（窗口已显示）后再预热输入后端
+        QTimer.singleShot(0, self._worker.warm)
+
+    def _sound_effect(self) -> Optional[QSoundEffect]:
+        if not self._sound_loaded:
+            self._sound_loaded = True
+            try:
+                from PyQt6.QtMultimedia import QSoundEffect
 
-    def _init_sound(self) -> None:
-        try:
-            from PyQt6.QtMultimedia import QSoundEffect
-
-            effect = QSoundEffect(self.window)
-            self._sound = effect
-        except Exception:  # noqa: BLE001
-            self._sound = None
+                self._sound = QSoundEffect(self.window)
+            except Exception:  # noqa: BLE001
+                self._sound = None
+        return self._sound
 
     def _connect_signals(self) -> None:
         w = self.window
         w.addPointRequested.connect(self.add_point)
         w.deletePointsRequested.connect(self.delete_points_by_rows)
-        w.table.orderChanged.connect(self.on_table_order_changed)
-        w.table.itemChanged.connect(self.on_table_item_changed)
+        w.table.rowsMoveRequested.connect(self.on_table_order_changed)
+        w.points_model.pointEditRequested.connect(self.on_table_item_changed)
 
         w.loadRequested.connect(self.open_config_dialog)
+        w.runFileRequested.connect(self.run_file_dialog)
         w.saveRequested.connect(self.save_config)
         w.saveAsRequested.connect(self.save_config_as)
+        w.autosaveToggled.connect(self._on_autosave_toggled)
+        w.traceToggled.connect(self._on_trace_toggled)
+        w.pinToggled.connect(self._on_pin_toggled)
         w.recentFileRequested.connect(self.open_recent_file)
 
         w.startRequested.connect(self.start)
@@ -107,27 +210,57 @@ class Controller:
         w.resumeRequested.connect(self.resume)
         w.stopRequested.connect(self.stop)
 
+        w.intervalChanged.connect(lambda *_: self._publish_params())
+        w.intervalChanged.connect(lambda *_: self._mark_dirty())
+        w.loopUiChanged.connect(self._mark_dirty)
+        w.burstUiChanged.connect(self._mark_dirty)
         w.loopUiChanged.connect(self._on_loop_ui_changed)
+        w.burstUiChanged.connect(self._on_burst_ui_changed)
         w.hotkeyUiChanged.connect(self._on_hotkey_ui_changed)
 
     def _connect_screen_signals(self) -> None:
         app = QGuiApplication.instance()
         if app is None:
             return
+        app.aboutToQuit.connect(self._on_about_to_quit)
         try:
             app.screenAdded.connect(lambda *_: self._on_screens_changed())
             app.screenRemoved.connect(lambda *_: self._on_screens_changed())
-            app.primaryScreenChanged.connect(lambda *_: self._on_screens_changed())
+            app.primaryScreenChanged.connect(lambda *_: self._on_primary_screen_changed())
         except Exception:  # noqa: BLE001
             return
+        self._watch_primary_screen()
+
+    def _watch_primary_screen(self) -> None:
+        screen = QGuiApplication.primaryScreen()
+        if screen is None or screen is self._watched_screen:
+            return
+        if self._watched_screen is not None:
+            try:
+                self._watched_screen.geometryChanged.disconnect(self._on_screen_geometry_changed)
+            except Exception:  # noqa: BLE001
+                pass
+        screen.geometryChanged.connect(self._on_screen_geometry_changed)
+        self._watched_screen = screen
+
+    def _on_primary_screen_changed(self) -> None:
+        self._watch_primary_screen()
+        self._on_screens_changed()
+
+    def _on_screen_geometry_changed(self, *_) -> None:
+        self._on_screens_changed()
 
     def _on_screens_changed(self) -> None:
         max_x, max_y = self._screen_max_xy()
         self.window.set_point_bounds(max_x, max_y)
+        if self._running:
+            self._worker.notify_screen_changed()
         self.logger.info("screens_changed max_x=%s max_y=%s", max_x, max_y)
 
     def _refresh_recent_menu(self) -> None:
-        self.window.update_recent_files(self.settings.recent_files())
+        self.window.update_recent_files(self.settings.recent_files(), self.settings.pinned_files())
+        current = self._current_file
+        self.window.set_pin_state(bool(current), bool(current) and current in self.settings.pinned_files())
 
     def _screen_max_xy(self) -> tuple[int, int]:
         screen = QGuiApplication.primaryScreen()
@@ -150,66 +283,96 @@ class Controller:
         if not ok:
             self.window.show_error(msg)
             return
-        self._points.append(point)
-        self.window.update_points(self._points)
+        row = len(self._points)
+        with self.window.points_model.inserting(row):
+            self._points.append(point)
+        self._mark_dirty()
         self.logger.info("add_point x=%s y=%s", x, y)
 
     def delete_points_by_rows(self, rows: list[int]) -> None:
-        for row in sorted(set(rows), reverse=True):
-            if 0 <= row < len(self._points):
-                self._points.pop(row)
-        self.window.update_points(self._points)
+        model = self.window.points_model
+        for first, last in row_ranges(rows, len(self._points)):
+            with model.removing(first, last):
+                self._points.remove_rows(range(first, last + 1))
+        self._mark_dirty()
         self.logger.info("delete_points count=%s", len(rows))
 
-    def on_table_order_changed(self) -> None:
-        self._points = self.window.points_from_table()
-        self.window.refresh_indices()
-        self.logger.info("reorder_points")
-
-    def on_table_item_changed(self) -> None:
-        points = self.window.points_from_table()
-        screen = self._screen_size()
-        for p in points:
-            ok, _ = validate_point(p, screen)
-            if not ok:
-                self.window.show_error("坐标值无效，已回退到上一次有效值")
-                self.window.update_points(self._points)
-                return
-        self._points = points
-        self.window.refresh_indices()
+    def on_table_order_changed(self, rows: list[int], dest: int) -> None:
+        moves = row_moves(rows, dest)
+        if not moves:
+            return
+        model = self.window.points_model
+        for first, last, to in moves:
+            with model.moving(first, last, to):
+                self._points.move(first, last, to)
+        self._mark_dirty()
+        self.logger.info("reorder_points count=%s dest=%s", len(rows), dest)
+
+    def on_table_item_changed(self, row: int, x: int, y: int) -> None:
+        if not 0 <= row < len(self._points):
+            return
+        old = self._points[row]
+        point = ClickPoint.from_abs(x, y, screen=old.screen)
+        ok, _ = validate_point(point, self._screen_size())
+        if not ok:
+            self.window.show_error("坐标值无效，已回退到上一次有效值")
+            return
+        self._points[row] = point
+        self.window.points_model.point_changed(row)
+        self._mark_dirty()
 
     def open_config_dialog(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
             self.window,
             "打开配置",
             "",
-            "JSON Files (*.json);;All Files (*.*)",
+            FILE_FILTER,
         )
         if not path:
             return
         self.open_file(path)
 
+    def run_file_dialog(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(
+            self.window,
+            "边读取边运行",
+            "",
+            FILE_FILTER,
+        )
+        if not path:
+            return
+        self.run_file(path)
+
+    def run_file(self, path: str) -> None:
+        """不载入编辑表格，直接按当前界面设置流式执行文件中的坐标点。"""
+        if self._running:
+            return
+        config = self._collect_config()
+        plan = RunPlan(points=PointStore(), loop=config.loop, burst=config.burst, source=iter_config_points(path))
+        self._start_worker(plan, total=0)
+        self._run_info = {
+            "source": "file",
+            "path": path,
+            "burst": config.burst.enabled,
+            "cps": config.burst.cps,
+            "interval_ms": config.interval_ms,
+            "loop": config.loop.enabled,
+            "loop_count": 0 if config.loop.infinite else config.loop.count,
+        }
+        self.logger.info("run_file path=%s burst=%s", path, config.burst.enabled)
+
     def open_recent_file(self, path: str) -> None:
         if path:
             self.open_file(path)
 
     def open_file(self, path: str) -> None:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            config = config_from_json_dict(data)
+            config = self._config_cache.get(path)
+            points = to_absolute(PointStore.from_points(config.points), self._screen_size())
         except Exception as exc:  # noqa: BLE001
             self.window.show_error(f"打开失败：{exc}")
             return
 
-        screen = self._screen_size()
-        points: list[ClickPoint] = []
-        for p in list(config.points):
-            if p.mode == "ratio":
-                px, py = p.to_pixels(screen)
-                points.append(ClickPoint.from_abs(px, py, screen=screen))
-            else:
-                points.append(ClickPoint.from_abs(int(round(p.x)), int(round(p.y)), screen=p.screen or screen))
         self._points = points
         self.window.update_points(self._points)
         self.window.spin_interval.setValue(int(config.interval_ms))
@@ -217,11 +380,14 @@ class Controller:
         self.window.chk_infinite.setChecked(bool(config.loop.infinite))
         self.window.spin_loop_count.setValue(int(max(1, config.loop.count)))
         self.window.spin_loop_interval.setValue(int(max(0, config.loop.interval_ms)))
+        self.window.chk_burst.setChecked(bool(config.burst.enabled))
+        self.window.spin_burst_cps.setValue(int(config.burst.cps))
         self.window.chk_hotkeys.setChecked(bool(config.hotkeys.enabled))
         self.window.edit_hotkey_start.setText(config.hotkeys.start)
         self.window.edit_hotkey_pause.setText(config.hotkeys.pause)
         self.window.edit_hotkey_stop.setText(config.hotkeys.stop)
 
+        self._autosave_timer.stop()
         self._current_file = path
         self.settings.push_recent_file(path)
         self._refresh_recent_menu()
@@ -240,11 +406,11 @@ class Controller:
             self.window,
             "另存为",
             self._current_file or "",
-            "JSON Files (*.json);;All Files (*.*)",
+            FILE_FILTER,
         )
         if not path:
             return
-        if not path.lower().endswith(".json"):
+        if not path.lower().endswith((".json", ".clkb")):
             path = f"{path}.json"
         self._current_file = path
         self._save_to_path(path)
@@ -254,6 +420,7 @@ class Controller:
     def _collect_config(self) -> AppConfig:
         loop_ui = self.window.loop_ui_state()
         hotkeys_ui = self.window.hotkey_ui_state()
+        burst_ui = self.window.burst_ui_state()
         loop = LoopSettings(
             enabled=loop_ui.enabled,
             infinite=loop_ui.infinite,
@@ -266,32 +433,136 @@ class Controller:
             pause=hotkeys_ui.pause,
             stop=hotkeys_ui.stop,
         )
-        return AppConfig(points=list(self._points), interval_ms=int(self.window.spin_interval.value()), loop=loop, hotkeys=hotkeys)
+        burst = BurstSettings(enabled=burst_ui.enabled, cps=burst_ui.cps)
+        return AppConfig(
+            points=self._points.snapshot(),
+            interval_ms=int(self.window.spin_interval.value()),
+            loop=loop,
+            hotkeys=hotkeys,
+            burst=burst,
+        )
 
-    def _save_to_path(self, path: str) -> None:
-        config = self._collect_config()
-        data = config_to_json_dict_v2(config, screen=self._screen_size())
+    def _save_to_path(self, path: str, autosave: bool = False) -> None:
+        """在后台线程序列化并原子写入；结果经 :meth:`_on_save_done` 回到界面线程。"""
+        if not autosave:
+            self._autosave_timer.stop()
         try:
-            Path(os.path.dirname(path) or ".").mkdir(parents=True, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self._saver.save(path, self._collect_config(), screen=self._screen_size(), autosave=autosave)
         except Exception as exc:  # noqa: BLE001
             self.window.show_error(f"保存失败：{exc}")
+
+    def _on_save_done(self, result: SaveResult) -> None:
+        if result.error is not None:
+            self.logger.error("save_failed path=%s autosave=%s error=%s", result.path, result.autosave, result.error)
+            if result.autosave:
+                self.window.notify_info(f"自动保存失败：{result.error}")
+            else:
+                self.window.show_error(f"保存失败：{result.error}")
+            return
+        self._config_cache.invalidate(result.path)
+        if not result.autosave:
+            self.window.notify_info("配置已保存")
+        self.logger.info(
+            "save_file path=%s autosave=%s elapsed_ms=%.1f",
+            result.path,
+            result.autosave,
+            result.elapsed * 1000.0,
+        )
+
+    def _mark_dirty(self) -> None:
+        """编辑后重新计时；连续编辑只触发一次自动保存。"""
+        if self._autosave and self._current_file:
+            self._autosave_timer.start()
+
+    def _autosave_now(self) -> None:
+        if self._autosave and self._current_file:
+            self._save_to_path(self._current_file, autosave=True)
+
+    def _on_autosave_toggled(self, enabled: bool) -> None:
+        self._autosave = bool(enabled)
+        self.settings.set_autosave_enabled(self._autosave)
+        if not self._autosave:
+            self._autosave_timer.stop()
+
+    def _on_trace_toggled(self, enabled: bool) -> None:
+        self._trace_runs = bool(enabled)
+        self.settings.set_trace_enabled(self._trace_runs)
+
+    def _export_trace(self, trace: TraceRecorder, metadata: dict[str, object]) -> None:
+        """在后台线程写出本次运行的轨迹文件，并只保留最近 ``_TRACE_KEEP`` 份。"""
+        directory = _app_data_dir() / "traces"
+        # 毫秒 + 序号：同一秒内的多次短运行不会互相覆盖，且按文件名排序即按时间排序
+        now = time.time()
+        self._trace_seq += 1
+        stamp = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now * 1000) % 1000:03d}"
+        path = directory / f"run-{stamp}-{self._trace_seq:03d}{TRACE_SUFFIX}"
+        relay = self._save_relay
+
+        def write() -> None:
+            error = ""
+            try:
+                save_trace(path, trace, metadata)
+                stale = sorted(directory.glob(f"run-*{TRACE_SUFFIX}"), reverse=True)[_TRACE_KEEP:]
+                for old in stale:
+                    # 并发的写出线程可能已删除同一文件
+                    old.unlink(missing_ok=True)
+            except Exception as exc:  # noqa: BLE001
+                error = str(exc) or exc.__class__.__name__
+            relay.traced.emit(str(path), error)
+
+        thread = threading.Thread(target=write, name="clicker-trace", daemon=True)
+        self._trace_threads = [t for t in self._trace_threads if t.is_alive()]
+        self._trace_threads.append(thread)
+        thread.start()
+
+    def _on_trace_saved(self, path: str, error: str) -> None:
+        if error:
+            self.logger.error("trace_failed path=%s error=%s", path, error)
+            self.window.notify_info(f"运行轨迹保存失败：{error}")
+            return
+        self.logger.info("trace_saved path=%s", path)
+        self.window.notify_info(f"运行轨迹已保存：{path}")
+
+    def _on_pin_toggled(self, pinned: bool) -> None:
+        path = self._current_file
+        if not path:
             return
-        self.window.notify_info("配置已保存")
-        self.logger.info("save_file path=%s", path)
+        self.settings.set_pinned(path, pinned)
+        if pinned:
+            self._config_cache.pin(path)
+            self._config_cache.prewarm([path])
+        else:
+            self._config_cache.unpin(path)
+        self._refresh_recent_menu()
+        self.logger.info("pin_file path=%s pinned=%s", path, pinned)
+
+    def _on_about_to_quit(self) -> None:
+        if self._autosave_timer.isActive():
+            self._autosave_timer.stop()
+            self._autosave_now()
+        if not self._saver.close(timeout=_SAVE_FLUSH_TIMEOUT_S):
+            self.logger.error("save_flush_timeout")
+        deadline = time.monotonic() + _SAVE_FLUSH_TIMEOUT_S
+        for thread in self._trace_threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._worker.shutdown()
+        self._thread.quit()
+        self._thread.wait(_WORKER_SHUTDOWN_TIMEOUT_MS)
+        self._config_cache.close()
+        _shutdown_logger()
 
     def _validate_points_before_run(self) -> bool:
         screen = self._screen_size()
-        for i, p in enumerate(self._points, start=1):
-            ok, msg = validate_point(p, screen)
-            if not ok:
-                QMessageBox.critical(self.window, "坐标无效", f"第 {i} 个点无效：{msg}")
-                return False
+        _, failures = validate_points(self._points, screen, limit=1)
+        if failures:
+            i = failures[0]
+            _, msg = validate_point(self._points[i], screen)
+            QMessageBox.critical(self.window, "坐标无效", f"第 {i + 1} 个点无效：{msg}")
+            return False
         return True
 
     def start(self) -> None:
-        if self._thread is not None:
+        if self._running:
             return
         if not self._points:
             self.window.show_error("请先添加至少一个坐标点")
@@ -301,40 +572,51 @@ class Controller:
             self.window.set_state("准备")
             return
 
+        config = self._collect_config()
+        plan = RunPlan(points=self._points.snapshot(), loop=config.loop, burst=config.burst)
+        self._start_worker(plan, total=len(self._points))
+        self._run_info = {
+            "source": "table",
+            "points": len(self._points),
+            "burst": config.burst.enabled,
+            "cps": config.burst.cps,
+            "interval_ms": config.interval_ms,
+            "loop": config.loop.enabled,
+            "loop_count": 0 if config.loop.infinite else config.loop.count,
+        }
+        self.logger.info(
+            "start_run points=%s burst=%s cps=%s",
+            len(self._points),
+            config.burst.enabled,
+            config.burst.cps,
+        )
+
+    def _start_worker(self, plan: RunPlan, total: int) -> None:
         self.window.set_running_controls(True, paused=False)
         self.window.set_state("运行")
-        self.window.set_progress(0, len(self._points))
+        self.window.set_progress(0, total)
         self._paused = False
         self._stop_requested = False
         self._error_occurred = False
 
-        thread = QThread(self.window)
-        worker = ClickWorker()
-        plan = RunPlan(points=list(self._points), loop=self._collect_config().loop)
-        worker.configure(
-            plan=plan,
-            interval_provider=lambda: int(self.window.spin_interval.value()),
-            loop_interval_provider=lambda: int(self.window.spin_loop_interval.value()),
-        )
-        worker.moveToThread(thread)
-
-        thread.started.connect(worker.run)
-        worker.progressChanged.connect(self._on_progress)
-        worker.cycleChanged.connect(self.window.set_cycle)
-        worker.statusChanged.connect(self.window.set_state)
-        worker.errorOccurred.connect(self._on_worker_error)
-        worker.finished.connect(self._on_worker_finished)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-
-        self._thread = thread
-        self._worker = worker
-        thread.start()
-        self.logger.info("start_run points=%s", len(self._points))
+        # 小计划按执行线程已知的后端屏幕尺寸在此预编译，执行线程尺寸一致时直接使用；
+        # 大计划交给执行线程编译，避免阻塞界面
+        screen = self._worker.screen
+        if plan.source is None and screen is not None and len(plan.points) <= _PRECOMPILE_MAX_POINTS:
+            try:
+                plan = replace(plan, compiled=compile_plan(plan.points, screen))
+            except PlanError:
+                pass
+
+        self._running = True
+        self._progress_version = -1
+        self._progress_timer.start()
+        self.window.clear_stats()
+        self._stats_timer.start()
+        self._worker.submit(plan, self._params, trace=self._trace_runs)
 
     def pause(self) -> None:
-        if self._worker is None or self._paused:
+        if not self._running or self._paused:
             return
         self._paused = True
         self._worker.request_pause()
@@ -342,7 +624,7 @@ class Controller:
         self.logger.info("pause")
 
     def resume(self) -> None:
-        if self._worker is None or not self._paused:
+        if not self._running or not self._paused:
             return
         self._paused = False
         self._worker.request_resume()
@@ -350,7 +632,7 @@ class Controller:
         self.logger.info("resume")
 
     def stop(self) -> None:
-        if self._worker is None:
+        if not self._running:
             self.window.set_state("停止")
             self.window.set_running_controls(False)
             self.window.set_progress(0, 0)
@@ -359,8 +641,24 @@ class Controller:
         self._worker.request_stop()
         self.logger.info("stop")
 
-    def _on_progress(self, current: int, total: int) -> None:
-        self.window.set_progress(current, total)
+    def _sample_progress(self) -> None:
+        if not self._running:
+            return
+        snap = self._worker.progress.snapshot()
+        if snap.version == self._progress_version:
+            return
+        self._progress_version = snap.version
+        if snap.total > 0:
+            self.window.set_progress(snap.step, snap.total)
+        if snap.cycle > 0:
+            self.window.set_cycle(snap.cycle, snap.cycles_total)
+        if snap.rate > 0:
+            self.window.set_rate(snap.rate, snap.target_rate)
+
+    def _sample_stats(self) -> None:
+        if not self._running:
+            return
+        self.window.set_stats(self._worker.telemetry.window())
 
     def _on_worker_error(self, message: str) -> None:
         self.logger.error("worker_error %s", message)
@@ -368,25 +666,29 @@ class Controller:
         self.window.show_error(message)
 
     def _play_done_sound(self) -> None:
-        if self._sound is None:
+        wav = (_app_data_dir() / "done.wav").as_posix()
+        # 没有自定义提示音时直接蜂鸣，不必加载 QtMultimedia
+        sound = self._sound_effect() if os.path.exists(wav) else None
+        if sound is None:
             QApplication.beep()
             return
         try:
             from PyQt6.QtCore import QUrl
 
-            wav = (_app_data_dir() / "done.wav").as_posix()
-            if os.path.exists(wav):
-                self._sound.setSource(QUrl.fromLocalFile(wav))
-                self._sound.setVolume(0.8)
-                self._sound.play()
-            else:
-                QApplication.beep()
+            sound.setSource(QUrl.fromLocalFile(wav))
+            sound.setVolume(0.8)
+            sound.play()
         except Exception:  # noqa: BLE001
             QApplication.beep()
 
     def _on_worker_finished(self) -> None:
-        self._thread = None
-        self._worker = None
+        stop_latency_ms = self._worker.stop_latency_ms()
+        summary = self._worker.summary
+        stats = self._worker.telemetry.summary()
+        trace = self._worker.trace
+        self._progress_timer.stop()
+        self._stats_timer.stop()
+        self._running = False
         self._paused = False
         self.window.set_running_controls(False)
         if self._stop_requested:
@@ -394,23 +696,64 @@ class Controller:
         else:
             self.window.set_state("准备")
         self.window.clear_cycle()
+        self.window.clear_rate()
         self.window.set_progress(0, 0)
+        self.window.set_stats(stats)
         if not self._stop_requested and not self._error_occurred:
             self.window.notify_info("执行完成")
             self._play_done_sound()
-            self.logger.info("finished")
+            outcome = "completed"
         else:
-            self.logger.info("finished stop=%s error=%s", self._stop_requested, self._error_occurred)
+            outcome = "error" if self._error_occurred else "stopped"
+        elapsed = summary.elapsed_s
+        log_event(
+            self.logger,
+            "run_summary",
+            outcome=outcome,
+            clicks=summary.clicks,
+            cycles=summary.cycles,
+            elapsed_s=round(elapsed, 3),
+            rate=round(summary.clicks / elapsed, 2) if elapsed > 0 else 0.0,
+            stop_latency_ms=None if stop_latency_ms is None else round(stop_latency_ms, 2),
+            cps=round(stats.cps, 2),
+            jitter_p50_ms=round(stats.jitter.p50, 3),
+            jitter_p95_ms=round(stats.jitter.p95, 3),
+            jitter_p99_ms=round(stats.jitter.p99, 3),
+            jitter_max_ms=round(stats.max_jitter, 3),
+            latency_p50_ms=round(stats.latency.p50, 3),
+            latency_p95_ms=round(stats.latency.p95, 3),
+            latency_p99_ms=round(stats.latency.p99, 3),
+            **self._run_info,
+        )
+        if trace is not None and len(trace):
+            self._export_trace(trace, dict(self._run_info, outcome=outcome, clicks=summary.clicks))
+        self._run_info = {}
         self._stop_requested = False
         self._error_occurred = False
 
+    def _publish_params(self) -> None:
+        self._params.publish(
+            RunParams(
+                interval_ms=int(self.window.spin_interval.value()),
+                loop_interval_ms=int(self.window.spin_loop_interval.value()),
+                burst_cps=int(self.window.spin_burst_cps.value()),
+            )
+        )
+
     def _on_loop_ui_changed(self) -> None:
+        self._publish_params()
         ui = self.window.loop_ui_state()
         enabled = ui.enabled
         self.window.chk_infinite.setEnabled(enabled)
         self.window.spin_loop_count.setEnabled(enabled and not ui.infinite)
         self.window.spin_loop_interval.setEnabled(enabled)
 
+    def _on_burst_ui_changed(self) -> None:
+        self._publish_params()
+        ui = self.window.burst_ui_state()
+        self.window.spin_interval.setEnabled(not ui.enabled)
+        self.window.spin_burst_cps.setEnabled(ui.enabled)
+
     def _on_hotkey_ui_changed(self) -> None:
         ui = self.window.hotkey_ui_state()
         self.window.edit_hotkey_start.setEnabled(ui.enabled)
@@ -3,26 +3,65 @@
 from __future__ import annotations
 
 import sys
+from contextlib import nullcontext
+from typing import Optional, Sequence
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QGuiApplication
-from PyQt6.QtWidgets import QApplication
+_PROFILE_FLAG = "--profile-startup"
 
-from .controller import Controller
-from .view import MainWindow
 
+def _run_gui(argv: list[str], profile_startup: bool = False) -> int:
+    profile = None
+    if profile_startup:
+        from clicker_core.startup import StartupProfile
+
+        profile = StartupProfile()
+        profile.install_import_hook()
+
+    phase = profile.phase if profile is not None else (lambda name: nullcontext())
+
+    with phase("import PyQt6"):
+        from PyQt6.QtCore import Qt, QTimer
+        from PyQt6.QtGui import QGuiApplication
+        from PyQt6.QtWidgets import QApplication
+    with phase("import view/controller"):
+        from .controller import Controller
+        from .view import MainWindow
 
-def main() -> int:
     QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    Controller(window)
-    window.show()
+    with phase("QApplication"):
+        app = QApplication([sys.argv[0], *argv])
+    with phase("MainWindow"):
+        window = MainWindow()
+    with phase("Controller"):
+        Controller(window)
+    with phase("show"):
+        window.show()
+
+    if profile is not None:
+
+        def report() -> None:
+            profile.mark("event loop")
+            profile.remove_import_hook()
+            sys.stderr.write(profile.report() + "\n")
+
+        QTimer.singleShot(0, report)
     return app.exec()
 
 
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    # 子命令走无界面路径，不导入 PyQt6
+    if args and args[0] in ("run", "-h", "--help"):
+        from .cli import main as cli_main
+
+        return cli_main(args)
+    profile_startup = _PROFILE_FLAG in args
+    if profile_startup:
+        args.remove(_PROFILE_FLAG)
+    return _run_gui(args, profile_startup)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
-
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from clicker_core.model import (  # noqa: F401
     AppConfig,
+    BurstSettings,
     ClickPoint,
     HotkeySettings,
     LoopSettings,
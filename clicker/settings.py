@@ -26,3 +26,40 @@ class AppSettings:
         files.insert(0, path)
         self._settings.setValue("recent_files", files[:3])
 
+    def pinned_files(self) -> list[str]:
+        value = self._settings.value("pinned_files", [])
+        if isinstance(value, list):
+            return [str(x) for x in value]
+        if isinstance(value, str) and value:
+            return [value]
+        return []
+
+    def set_pinned(self, path: str, pinned: bool) -> None:
+        files = [p for p in self.pinned_files() if p != path]
+        if pinned and path:
+            files.append(path)
+        self._settings.setValue("pinned_files", files)
+
+    def cache_budget_mb(self) -> int:
+        try:
+            return max(0, int(self._settings.value("cache_budget_mb", 64)))
+        except (TypeError, ValueError):
+            return 64
+
+    def autosave_enabled(self) -> bool:
+        value = self._settings.value("autosave", False)
+        if isinstance(value, str):
+            return value.lower() in ("1", "true")
+        return bool(value)
+
+    def set_autosave_enabled(self, enabled: bool) -> None:
+        self._settings.setValue("autosave", bool(enabled))
+
+    def trace_enabled(self) -> bool:
+        value = self._settings.value("trace_runs", False)
+        if isinstance(value, str):
+            return value.lower() in ("1", "true")
+        return bool(value)
+
+    def set_trace_enabled(self, enabled: bool) -> None:
+        self._settings.setValue("trace_runs", bool(enabled))
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
+from typing import Iterator
 
-from PyQt6.QtCore import QEvent, Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import QAbstractTableModel, QEvent, QModelIndex, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QCloseEvent, QIcon
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -25,13 +27,13 @@ from PyQt6.QtWidgets import (
     QSplitter,
     QStatusBar,
     QSystemTrayIcon,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from clicker_core.model import ClickPoint
+from clicker_core.model import BURST_CPS_MAX, BURST_CPS_MIN, PointStore
+from clicker_core.telemetry import TelemetryStats
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,6 +44,12 @@ class LoopUiState:
     interval_ms: int
 
 
+@dataclass(frozen=True, slots=True)
+class BurstUiState:
+    enabled: bool
+    cps: int
+
+
 @dataclass(frozen=True, slots=True)
 class HotkeyUiState:
     enabled: bool
@@ -50,14 +58,130 @@ class HotkeyUiState:
     stop: str
 
 
-class PointsTableWidget(QTableWidget):
-    """支持拖拽排序的表格。"""
+class PointsTableModel(QAbstractTableModel):
+    """坐标点表格模型：直接展示控制器的列式存储，按需取数。
+
+    存储只由控制器修改；修改时包在 :meth:`inserting` / :meth:`removing` /
+    :meth:`moving` 中，表格只收到受影响行区间的通知。
+    """
 
-    orderChanged = pyqtSignal()
+    HEADERS = ("序号", "X", "Y")
+
+    pointEditRequested = pyqtSignal(int, int, int)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._points = PointStore()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._points)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):  # type: ignore[override]  # noqa: N802
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        row = index.row()
+        col = index.column()
+        if col == 0:
+            return row + 1
+        if col == 1:
+            return int(round(self._points.x_at(row)))
+        return int(round(self._points.y_at(row)))
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsDragEnabled
+        if index.column() in (1, 2):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:  # type: ignore[override]  # noqa: N802
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole or index.column() not in (1, 2):
+            return False
+        row = index.row()
+        old = self._points[row]
+        try:
+            v = int(value)
+        except (TypeError, ValueError):
+            return False
+        x = v if index.column() == 1 else int(round(old.x))
+        y = v if index.column() == 2 else int(round(old.y))
+        # 只提交修改请求，由控制器校验该点后写回并调用 point_changed
+        self.pointEditRequested.emit(row, x, y)
+        return True
+
+    def supportedDropActions(self) -> Qt.DropAction:  # noqa: N802
+        return Qt.DropAction.MoveAction
+
+    def set_points(self, points: PointStore) -> None:
+        """改为展示 ``points``；不复制，之后由控制器修改它并经下列方法通知表格。"""
+        self.beginResetModel()
+        self._points = points
+        self.endResetModel()
+
+    def point_changed(self, row: int) -> None:
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 2))
+
+    @contextmanager
+    def inserting(self, row: int, count: int = 1) -> Iterator[None]:
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        try:
+            yield
+        finally:
+            self.endInsertRows()
+
+    @contextmanager
+    def removing(self, first: int, last: int) -> Iterator[None]:
+        self.beginRemoveRows(QModelIndex(), first, last)
+        try:
+            yield
+        finally:
+            self.endRemoveRows()
+
+    @contextmanager
+    def moving(self, first: int, last: int, dest: int) -> Iterator[None]:
+        """一步 :func:`row_moves` 移动；结束后刷新受影响区间的序号列。"""
+        self.beginMoveRows(QModelIndex(), first, last, QModelIndex(), dest)
+        try:
+            yield
+        finally:
+            self.endMoveRows()
+            top = min(first, dest)
+            bottom = max(last, dest - 1)
+            self.dataChanged.emit(self.index(top, 0), self.index(bottom, 0), [Qt.ItemDataRole.DisplayRole])
+
+
+class PointsTableView(QTableView):
+    """支持拖拽排序的表格视图；放下时只发出移动请求，不经过 MIME 拷贝与删除。"""
+
+    rowsMoveRequested = pyqtSignal(list, int)
 
     def dropEvent(self, event) -> None:  # type: ignore[override]
-        super().dropEvent(event)
-        self.orderChanged.emit()
+        model = self.model()
+        if event.source() is not self or not isinstance(model, PointsTableModel):
+            super().dropEvent(event)
+            return
+        index = self.indexAt(event.position().toPoint())
+        if not index.isValid():
+            dest = model.rowCount()
+        elif self.dropIndicatorPosition() == QAbstractItemView.DropIndicatorPosition.BelowItem:
+            dest = index.row() + 1
+        else:
+            dest = index.row()
+        rows = sorted({idx.row() for idx in self.selectionModel().selectedRows()})
+        # 以 CopyAction 结束拖拽，避免视图在拖拽完成后再删除源行
+        event.setDropAction(Qt.DropAction.CopyAction)
+        event.accept()
+        if rows:
+            self.rowsMoveRequested.emit(rows, dest)
 
 
 class PointSpinDelegate(QStyledItemDelegate):
@@ -97,8 +221,12 @@ class MainWindow(QMainWindow):
     addPointRequested = pyqtSignal(int, int)
     deletePointsRequested = pyqtSignal(list)
     loadRequested = pyqtSignal()
+    runFileRequested = pyqtSignal()
     saveRequested = pyqtSignal()
     saveAsRequested = pyqtSignal()
+    autosaveToggled = pyqtSignal(bool)
+    traceToggled = pyqtSignal(bool)
+    pinToggled = pyqtSignal(bool)
     recentFileRequested = pyqtSignal(str)
     startRequested = pyqtSignal()
     pauseRequested = pyqtSignal()
@@ -106,6 +234,7 @@ class MainWindow(QMainWindow):
     stopRequested = pyqtSignal()
     intervalChanged = pyqtSignal(int)
     loopUiChanged = pyqtSignal()
+    burstUiChanged = pyqtSignal()
     hotkeyUiChanged = pyqtSignal()
 
     def __init__(self) -> None:
@@ -115,6 +244,7 @@ class MainWindow(QMainWindow):
 
         self._base_state = "准备"
         self._cycle_text = ""
+        self._progress_text = ""
         self._max_x = 99999
         self._max_y = 99999
         self._force_quit = False
@@ -125,13 +255,25 @@ class MainWindow(QMainWindow):
 
     def _build_actions(self) -> None:
         self.action_open = QAction("打开", self)
+        self.action_run_file = QAction("边读取边运行…", self)
         self.action_save = QAction("保存", self)
         self.action_save_as = QAction("另存为", self)
+        self.action_autosave = QAction("编辑后自动保存", self)
+        self.action_autosave.setCheckable(True)
+        self.action_trace = QAction("记录运行轨迹（Chrome trace）", self)
+        self.action_trace.setCheckable(True)
+        self.action_pin = QAction("固定当前配置（常驻缓存）", self)
+        self.action_pin.setCheckable(True)
+        self.action_pin.setEnabled(False)
         self.action_exit = QAction("退出", self)
 
         self.action_open.triggered.connect(self.loadRequested.emit)
+        self.action_run_file.triggered.connect(self.runFileRequested.emit)
         self.action_save.triggered.connect(self.saveRequested.emit)
         self.action_save_as.triggered.connect(self.saveAsRequested.emit)
+        self.action_autosave.toggled.connect(self.autosaveToggled.emit)
+        self.action_trace.toggled.connect(self.traceToggled.emit)
+        self.action_pin.toggled.connect(self.pinToggled.emit)
         self.action_exit.triggered.connect(self.request_quit)
 
         menubar = self.menuBar()
@@ -139,9 +281,14 @@ class MainWindow(QMainWindow):
         file_menu.addAction(self.action_open)
         file_menu.addAction(self.action_save)
         file_menu.addAction(self.action_save_as)
+        file_menu.addAction(self.action_autosave)
+        file_menu.addSeparator()
+        file_menu.addAction(self.action_run_file)
+        file_menu.addAction(self.action_trace)
         file_menu.addSeparator()
         self.recent_menu = QMenu("最近打开", self)
         file_menu.addMenu(self.recent_menu)
+        file_menu.addAction(self.action_pin)
         file_menu.addSeparator()
         file_menu.addAction(self.action_exit)
 
@@ -172,8 +319,9 @@ class MainWindow(QMainWindow):
         input_row.addStretch(1)
         left_layout.addLayout(input_row)
 
-        self.table = PointsTableWidget(0, 3, self)
-        self.table.setHorizontalHeaderLabels(["序号", "X", "Y"])
+        self.points_model = PointsTableModel(self)
+        self.table = PointsTableView(self)
+        self.table.setModel(self.points_model)
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
@@ -185,6 +333,7 @@ class MainWindow(QMainWindow):
         self.table.setAcceptDrops(True)
         self.table.setDropIndicatorShown(True)
         self.table.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self.table.setDragDropOverwriteMode(False)
         self.table.setDefaultDropAction(Qt.DropAction.MoveAction)
         self.table.setColumnWidth(0, 70)
         left_layout.addWidget(self.table, 1)
@@ -217,6 +366,19 @@ class MainWindow(QMainWindow):
         self.spin_interval.setSuffix(" ms")
         params_layout.addRow("间隔时间", self.spin_interval)
 
+        self.chk_burst = QCheckBox("连发模式")
+        self.spin_burst_cps = QSpinBox()
+        self.spin_burst_cps.setRange(BURST_CPS_MIN, BURST_CPS_MAX)
+        self.spin_burst_cps.setSingleStep(10)
+        self.spin_burst_cps.setValue(100)
+        self.spin_burst_cps.setSuffix(" 次/秒")
+        burst_row = QWidget()
+        burst_row_layout = QHBoxLayout(burst_row)
+        burst_row_layout.setContentsMargins(0, 0, 0, 0)
+        burst_row_layout.addWidget(self.chk_burst)
+        burst_row_layout.addWidget(self.spin_burst_cps)
+        params_layout.addRow("连发设置", burst_row)
+
         self.chk_loop = QCheckBox("启用循环")
         self.chk_infinite = QCheckBox("无限循环")
         self.spin_loop_count = QSpinBox()
@@ -254,6 +416,16 @@ class MainWindow(QMainWindow):
 
         right_layout.addWidget(group_params, 1)
 
+        group_stats = QGroupBox("运行统计")
+        stats_layout = QFormLayout(group_stats)
+        self.label_stats_jitter = QLabel("-")
+        self.label_stats_latency = QLabel("-")
+        self.label_stats_cps = QLabel("-")
+        stats_layout.addRow("定时偏差 p50/p95/p99", self.label_stats_jitter)
+        stats_layout.addRow("后端耗时 p50/p95/p99", self.label_stats_latency)
+        stats_layout.addRow("实际速率", self.label_stats_cps)
+        right_layout.addWidget(group_stats)
+
         splitter.addWidget(left)
         splitter.addWidget(right)
         splitter.setStretchFactor(0, 3)
@@ -267,7 +439,9 @@ class MainWindow(QMainWindow):
         self.progress.setRange(0, 100)
         self.progress.setValue(0)
         self.progress.setTextVisible(True)
+        self.label_rate = QLabel("")
         status.addWidget(self.label_status, 1)
+        status.addPermanentWidget(self.label_rate)
         status.addPermanentWidget(self.progress, 1)
         self.setStatusBar(status)
 
@@ -284,6 +458,9 @@ class MainWindow(QMainWindow):
         self.spin_loop_count.valueChanged.connect(self.loopUiChanged.emit)
         self.spin_loop_interval.valueChanged.connect(self.loopUiChanged.emit)
 
+        self.chk_burst.stateChanged.connect(self.burstUiChanged.emit)
+        self.spin_burst_cps.valueChanged.connect(self.burstUiChanged.emit)
+
         self.chk_hotkeys.stateChanged.connect(self.hotkeyUiChanged.emit)
         self.edit_hotkey_start.textChanged.connect(self.hotkeyUiChanged.emit)
         self.edit_hotkey_pause.textChanged.connect(self.hotkeyUiChanged.emit)
@@ -395,18 +572,8 @@ class MainWindow(QMainWindow):
             self.raise_()
             self.activateWindow()
 
-    def update_points(self, points: list[ClickPoint]) -> None:
-        self.table.blockSignals(True)
-        self.table.setRowCount(0)
-        for i, p in enumerate(points, start=1):
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            item_index = QTableWidgetItem(str(i))
-            item_index.setFlags(item_index.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 0, item_index)
-            self.table.setItem(row, 1, QTableWidgetItem(str(int(round(p.x)))))
-            self.table.setItem(row, 2, QTableWidgetItem(str(int(round(p.y)))))
-        self.table.blockSignals(False)
+    def update_points(self, points: PointStore) -> None:
+        self.points_model.set_points(points)
 
     def set_point_bounds(self, max_x: int, max_y: int) -> None:
         self._max_x = max(0, int(max_x))
@@ -417,30 +584,11 @@ class MainWindow(QMainWindow):
     def point_edit_bounds(self) -> tuple[int, int]:
         return self._max_x, self._max_y
 
-    def points_from_table(self) -> list[ClickPoint]:
-        points: list[ClickPoint] = []
-        for row in range(self.table.rowCount()):
-            x_item = self.table.item(row, 1)
-            y_item = self.table.item(row, 2)
-            try:
-                x = int(x_item.text()) if x_item else 0
-                y = int(y_item.text()) if y_item else 0
-            except ValueError:
-                x, y = 0, 0
-            points.append(ClickPoint.from_abs(x=x, y=y))
-        return points
-
-    def refresh_indices(self) -> None:
-        for row in range(self.table.rowCount()):
-            item_index = self.table.item(row, 0)
-            if item_index is not None:
-                item_index.setText(str(row + 1))
-
     def set_state(self, state: str) -> None:
         self._base_state = state
         self._refresh_status_label()
         self.tray.setIcon(self._icon_for_state(state))
-        self.tray.setToolTip(f"顺序连点器 - {state}")
+        self._refresh_tray_tooltip()
 
     def set_cycle(self, current: int, total: int) -> None:
         if total > 0:
@@ -455,12 +603,18 @@ class MainWindow(QMainWindow):
 
     def _refresh_status_label(self) -> None:
         self.label_status.setText(f"{self._base_state}{self._cycle_text}")
+        self._refresh_tray_tooltip()
+
+    def _refresh_tray_tooltip(self) -> None:
+        progress = f" {self._progress_text}" if self._progress_text else ""
+        self.tray.setToolTip(f"顺序连点器 - {self._base_state}{progress}{self._cycle_text}")
 
     def set_running_controls(self, running: bool, paused: bool = False) -> None:
         self.btn_start.setEnabled(not running)
         self.btn_stop.setEnabled(running)
         self.btn_pause.setEnabled(running)
         self.btn_pause.setText("继续" if paused else "暂停")
+        self.action_run_file.setEnabled(not running)
 
         self.tray_action_start.setEnabled(not running)
         self.tray_action_stop.setEnabled(running)
@@ -471,23 +625,65 @@ class MainWindow(QMainWindow):
         if total <= 0:
             self.progress.setValue(0)
             self.progress.setFormat("")
+            self._progress_text = ""
+            self._refresh_tray_tooltip()
             return
         percent = int((current / total) * 100)
         self.progress.setValue(percent)
-        self.progress.setFormat(f"{current}/{total}")
+        self._progress_text = f"{current}/{total}"
+        self.progress.setFormat(self._progress_text)
+        self._refresh_tray_tooltip()
 
-    def update_recent_files(self, paths: list[str]) -> None:
+    def set_rate(self, achieved: float, target: float) -> None:
+        if target > 0:
+            self.label_rate.setText(f"{achieved:.0f}/{target:.0f} 次/秒")
+        else:
+            self.label_rate.setText(f"{achieved:.1f} 次/秒")
+
+    def clear_rate(self) -> None:
+        self.label_rate.setText("")
+
+    def set_stats(self, stats: TelemetryStats) -> None:
+        if stats.count == 0:
+            self.clear_stats()
+            return
+        j = stats.jitter
+        lat = stats.latency
+        self.label_stats_jitter.setText(f"{j.p50:.2f} / {j.p95:.2f} / {j.p99:.2f} ms")
+        self.label_stats_latency.setText(f"{lat.p50:.2f} / {lat.p95:.2f} / {lat.p99:.2f} ms")
+        self.label_stats_cps.setText(f"{stats.cps:.1f} 次/秒（共 {stats.count} 次）")
+
+    def clear_stats(self) -> None:
+        self.label_stats_jitter.setText("-")
+        self.label_stats_latency.setText("-")
+        self.label_stats_cps.setText("-")
+
+    def update_recent_files(self, paths: list[str], pinned: list[str] | None = None) -> None:
         self.recent_menu.clear()
-        if not paths:
+        pinned = pinned or []
+        recent = [p for p in paths if p not in pinned]
+        if not recent and not pinned:
             action = QAction("(空)", self)
             action.setEnabled(False)
             self.recent_menu.addAction(action)
             return
-        for p in paths:
+        for p in pinned:
+            act = QAction(f"[固定] {p}", self)
+            act.triggered.connect(lambda _, x=p: self.recentFileRequested.emit(x))
+            self.recent_menu.addAction(act)
+        if pinned and recent:
+            self.recent_menu.addSeparator()
+        for p in recent:
             act = QAction(p, self)
             act.triggered.connect(lambda _, x=p: self.recentFileRequested.emit(x))
             self.recent_menu.addAction(act)
 
+    def set_pin_state(self, available: bool, pinned: bool) -> None:
+        self.action_pin.blockSignals(True)
+        self.action_pin.setEnabled(available)
+        self.action_pin.setChecked(pinned)
+        self.action_pin.blockSignals(False)
+
     def loop_ui_state(self) -> LoopUiState:
         return LoopUiState(
             enabled=self.chk_loop.isChecked(),
@@ -496,6 +692,12 @@ class MainWindow(QMainWindow):
             interval_ms=int(self.spin_loop_interval.value()),
         )
 
+    def burst_ui_state(self) -> BurstUiState:
+        return BurstUiState(
+            enabled=self.chk_burst.isChecked(),
+            cps=int(self.spin_burst_cps.value()),
+        )
+
     def hotkey_ui_state(self) -> HotkeyUiState:
         return HotkeyUiState(
             enabled=self.chk_hotkeys.isChecked(),
@@ -2,162 +2,171 @@
 
 from __future__ import annotations
 
-import threading
+import queue
 import time
 from dataclasses import dataclass
-from typing import Callable
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from clicker_core.model import ClickPoint, LoopSettings, ScreenSize
+from clicker_core.backends import InputBackend, load_backend
+from clicker_core.control import ParamBlock, ProgressBlock, RunControl, RunSummary
+from clicker_core.engine import BACKEND_ERROR, InstrumentObserver, RunPlan, Sequencer, run_blocking
+from clicker_core.model import ScreenSize
+from clicker_core.telemetry import ClickTelemetry
+from clicker_core.trace import TraceRecorder
 
 
 @dataclass(frozen=True, slots=True)
-class RunPlan:
-    """一次运行计划。"""
+class _RunJob:
+    plan: RunPlan
+    params: ParamBlock
+    control: RunControl
+    trace: bool
 
-    points: list[ClickPoint]
-    loop: LoopSettings
+
+# 命令队列中的特殊命令
+_WARM = "warm"
+_SHUTDOWN = "shutdown"
 
 
 class ClickWorker(QObject):
-    """在工作线程中执行顺序连点。"""
+    """常驻工作线程中的顺序连点执行器。
+
+    :meth:`serve` 在专用线程中循环处理命令队列：输入后端只加载一次并保持可用，
+    每次运行只需 :meth:`submit` 一个计划，无需新建线程或重新导入后端。
+    ``finished`` 在每次运行结束时发出。
+    """
 
     statusChanged = pyqtSignal(str)
-    progressChanged = pyqtSignal(int, int)
-    cycleChanged = pyqtSignal(int, int)
     finished = pyqtSignal()
     errorOccurred = pyqtSignal(str)
 
-    def __init__(self) -> None:
+    def __init__(self, backend_name: str | None = None) -> None:
         super().__init__()
-        self._pause_event = threading.Event()
-        self._stop_event = threading.Event()
-        self._pause_event.set()
-        self._interval_provider: Callable[[], int] | None = None
-        self._loop_interval_provider: Callable[[], int] | None = None
-        self._plan: RunPlan | None = None
-
-    def configure(
-        self,
-        plan: RunPlan,
-        interval_provider: Callable[[], int],
-        loop_interval_provider: Callable[[], int],
-    ) -> None:
-        self._plan = plan
-        self._interval_provider = interval_provider
-        self._loop_interval_provider = loop_interval_provider
+        self._control = RunControl()
+        self.progress = ProgressBlock()
+        self.summary = RunSummary()
+        self.telemetry = ClickTelemetry()
+        self.trace: TraceRecorder | None = None
+        self._sequencer: Sequencer | None = None
+        self._commands: queue.SimpleQueue = queue.SimpleQueue()
+        self._backend_name = backend_name
+        self._backend: InputBackend | None = None
+        self.screen: ScreenSize | None = None
+
+    def submit(self, plan: RunPlan, params: ParamBlock, trace: bool = False) -> None:
+        """由 GUI 线程调用：重置本次运行的状态块并把计划放入命令队列。
+
+        调用方须等上一次运行的 ``finished`` 之后再提交。
+        """
+        control = RunControl()
+        self._control = control
+        self.progress = ProgressBlock()
+        self.summary = RunSummary()
+        self.telemetry = ClickTelemetry()
+        self.trace = None
+        self._commands.put(_RunJob(plan=plan, params=params, control=control, trace=trace))
+
+    def warm(self) -> None:
+        """请求工作线程提前加载输入后端。"""
+        self._commands.put(_WARM)
+
+    def shutdown(self) -> None:
+        """停止当前运行并让 :meth:`serve` 在关闭后端后返回。"""
+        self._control.request_stop()
+        self._commands.put(_SHUTDOWN)
+
+    def serve(self) -> None:
+        while True:
+            command = self._commands.get()
+            if command is _SHUTDOWN:
+                self._drop_backend()
+                return
+            if command is _WARM:
+                try:
+                    self._ensure_backend()
+                except Exception:  # noqa: BLE001
+                    self._drop_backend()
+                continue
+            self._execute(command)
 
     def request_pause(self) -> None:
-        self._pause_event.clear()
+        self._control.request_pause()
         self.statusChanged.emit("暂停")
 
     def request_resume(self) -> None:
-        self._pause_event.set()
+        self._control.request_resume()
         self.statusChanged.emit("运行")
 
     def request_stop(self) -> None:
-        self._stop_event.set()
-        self._pause_event.set()
+        self._control.request_stop()
         self.statusChanged.emit("停止")
 
-    def run(self) -> None:
-        plan = self._plan
-        interval_provider = self._interval_provider
-        loop_interval_provider = self._loop_interval_provider
-        if plan is None or interval_provider is None or loop_interval_provider is None:
-            self.errorOccurred.emit("任务未配置")
-            self.finished.emit()
-            return
-
+    def notify_screen_changed(self) -> None:
+        """屏幕几何变化时由 GUI 线程调用；工作线程在下一步之前重新编译计划。"""
+        sequencer = self._sequencer
+        if sequencer is not None:
+            sequencer.notify_screen_changed()
+
+    def stop_latency_ms(self) -> float | None:
+        latency = self._control.stop_latency
+        return None if latency is None else latency * 1000.0
+
+    def _ensure_backend(self) -> InputBackend:
+        if self._backend is None:
+            self._backend = load_backend(self._backend_name)
+            self.screen = self._backend.screen_size()
+        return self._backend
+
+    def _drop_backend(self) -> None:
+        backend, self._backend = self._backend, None
+        if backend is not None:
+            try:
+                backend.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+    def _execute(self, job: _RunJob) -> None:
+        control = job.control
         try:
-            import pyautogui
+            backend = self._ensure_backend()
         except Exception as exc:  # noqa: BLE001
-            self.errorOccurred.emit(f"pyautogui 导入失败：{exc}")
+            self._drop_backend()
+            self.errorOccurred.emit(f"输入后端加载失败：{exc}")
             self.finished.emit()
             return
 
+        observer = _WorkerObserver(self, job.trace)
+        self.trace = observer.trace
+        sequencer = Sequencer(job.plan, backend, job.params, observer)
+        self._sequencer = sequencer
+        self.statusChanged.emit("运行")
         try:
-            FailSafeException = pyautogui.FailSafeException
-        except Exception:  # noqa: BLE001
-            FailSafeException = Exception
-
-        points = list(plan.points)
-        if not points:
+            run_blocking(sequencer, control)
+        except Exception as exc:  # noqa: BLE001
+            # 先报告错误再发出 finished，界面据此区分出错与正常结束
+            self.errorOccurred.emit(f"运行出错：{exc}")
+        finally:
+            self._sequencer = None
+            sequencer.close()
+            if sequencer.screen is not None:
+                self.screen = sequencer.screen
+            if sequencer.outcome == BACKEND_ERROR:
+                # 后端可能已失效，下次运行时重新加载
+                self._drop_backend()
+            self.summary = sequencer.summary()
             self.finished.emit()
-            return
 
-        def sleep_ms(ms: int) -> None:
-            end = time.time() + (max(0, ms) / 1000.0)
-            while time.time() < end:
-                if self._stop_event.is_set():
-                    return
-                if not self._pause_event.is_set():
-                    self._pause_event.wait(0.1)
-                time.sleep(0.01)
-
-        self.statusChanged.emit("运行")
 
-        cycles_total = 1
-        if plan.loop.enabled and plan.loop.infinite:
-            cycles_total = 0
-        elif plan.loop.enabled:
-            cycles_total = max(1, int(plan.loop.count))
+class _WorkerObserver(InstrumentObserver):
+    def __init__(self, worker: ClickWorker, trace: bool) -> None:
+        super().__init__(
+            progress=worker.progress,
+            telemetry=worker.telemetry,
+            trace=TraceRecorder(time.perf_counter()) if trace else None,
+        )
+        self._worker = worker
 
-        cycle_index = 0
-        try:
-            while True:
-                if self._stop_event.is_set():
-                    break
-
-                cycle_index += 1
-                if cycles_total > 0:
-                    self.cycleChanged.emit(cycle_index, cycles_total)
-                else:
-                    self.cycleChanged.emit(cycle_index, 0)
-
-                total = len(points)
-                for i, p in enumerate(points, start=1):
-                    if self._stop_event.is_set():
-                        break
-                    if not self._pause_event.is_set():
-                        self._pause_event.wait()
-
-                    self.progressChanged.emit(i, total)
-
-                    try:
-                        size = pyautogui.size()
-                        screen = ScreenSize(width=int(size.width), height=int(size.height))
-                        px, py = p.to_pixels(screen)
-                        max_x = int(screen.width) - 1
-                        max_y = int(screen.height) - 1
-                        if px < 0 or py < 0 or px > max_x or py > max_y:
-                            self.errorOccurred.emit(
-                                f"屏幕分辨率变更导致坐标越界：({px},{py})，当前最大({max_x},{max_y})"
-                            )
-                            self._stop_event.set()
-                            break
-                        pyautogui.moveTo(px, py)
-                        pyautogui.click(px, py)
-                    except FailSafeException:
-                        self.errorOccurred.emit("触发 FailSafe：鼠标移动到屏幕角落，已停止")
-                        self._stop_event.set()
-                        break
-                    except Exception as exc:  # noqa: BLE001
-                        self.errorOccurred.emit(f"点击失败：{exc}")
-                        self._stop_event.set()
-                        break
-
-                    sleep_ms(int(interval_provider()))
-
-                if self._stop_event.is_set():
-                    break
-
-                if not plan.loop.enabled:
-                    break
-                if plan.loop.enabled and not plan.loop.infinite and cycle_index >= cycles_total:
-                    break
-
-                sleep_ms(int(loop_interval_provider()))
-        finally:
-            self.finished.emit()
+    def on_error(self, message: str, at: float) -> None:
+        super().on_error(message, at)
+        self._worker.errorOccurred.emit(message)
@@ -0,0 +1,195 @@
+"""多序列并发执行：在一个 asyncio 事件循环上同时驱动多个 :class:`Sequencer`。
+
+每个序列只占一个 ``loop.call_at`` 定时器，不占线程、不轮询；到期的序列进入统一的
+注入队列，由单一消费者按到期顺序逐个调用 :meth:`Sequencer.step`，因此各序列的点击
+严格串行，不会在一次点击中途交错。后端按接口约定不含隐式等待，直接在事件循环
+线程调用即可。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+from .backends import InputBackend
+from .control import ParamBlock, RunSummary
+from .engine import FAILSAFE, RunPlan, Sequencer, SequencerObserver
+
+# 截止时间不超过该秒数时原地自旋等待，而不是交给 call_at。
+SPIN_S = 0.001
+
+
+class SequenceHandle:
+    """:class:`AsyncRunner` 中的一个序列。
+
+    方法须在事件循环线程调用；其他线程请经 ``loop.call_soon_threadsafe`` 转发。
+    ``done`` 在序列结束时得到其 :attr:`Sequencer.outcome`。
+    """
+
+    def __init__(self, runner: "AsyncRunner", sequencer: Sequencer, name: str) -> None:
+        self.name = name
+        self.sequencer = sequencer
+        self.done: asyncio.Future[str] = runner.loop.create_future()
+        self._runner = runner
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def outcome(self) -> str:
+        return self.sequencer.outcome
+
+    @property
+    def running(self) -> bool:
+        return self.sequencer.running
+
+    @property
+    def paused(self) -> bool:
+        return self.sequencer.paused
+
+    def summary(self) -> RunSummary:
+        return self.sequencer.summary()
+
+    def pause(self) -> None:
+        if self.sequencer.running and not self.sequencer.paused:
+            self.sequencer.pause()
+            self._cancel_timer()
+
+    def resume(self) -> None:
+        if self.sequencer.paused:
+            self.sequencer.resume()
+            self._runner._arm(self, self.sequencer.next_wake())
+
+    def stop(self) -> None:
+        self._cancel_timer()
+        self.sequencer.stop()
+        self._runner._settle(self)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+class AsyncRunner:
+    """在同一事件循环上调度多个序列，共用一个输入后端。
+
+    各序列使用 ``loop.time()`` 作为时钟，截止时间交给 ``loop.call_at``。asyncio 会把
+    一个时钟分辨率之内的定时器视为已到期（Windows 上约 15.6ms），因此不足一个分辨率
+    的等待加上余量、不足 :data:`SPIN_S` 的等待原地自旋，避免被提前唤醒后空转。
+    任一序列触发 FailSafe 时停止全部序列。``backend`` 由调用方负责关闭。
+    """
+
+    def __init__(self, backend: InputBackend, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self._backend = backend
+        self._loop = loop
+        self._handles: list[SequenceHandle] = []
+        self._ready: deque[SequenceHandle] = deque()
+        self._draining = False
+        self._count = 0
+        # 与 asyncio 判断定时器到期时使用的分辨率一致
+        self._resolution = time.get_clock_info("monotonic").resolution
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    @property
+    def handles(self) -> list[SequenceHandle]:
+        """尚未结束的序列。"""
+        return list(self._handles)
+
+    def start(
+        self,
+        plan: RunPlan,
+        params: Optional[ParamBlock] = None,
+        observer: Optional[SequencerObserver] = None,
+        name: str = "",
+    ) -> SequenceHandle:
+        """开始一个新序列；计划为空或立即出错时返回的句柄已经结束。"""
+        self._count += 1
+        sequencer = Sequencer(plan, self._backend, params, observer, clock=self.loop.time)
+        handle = SequenceHandle(self, sequencer, name or f"seq-{self._count}")
+        self._handles.append(handle)
+        self._arm(handle, sequencer.start())
+        return handle
+
+    def pause_all(self) -> None:
+        for handle in self.handles:
+            handle.pause()
+
+    def resume_all(self) -> None:
+        for handle in self.handles:
+            handle.resume()
+
+    def stop_all(self) -> None:
+        for handle in self.handles:
+            handle.stop()
+
+    def notify_screen_changed(self) -> None:
+        for handle in self._handles:
+            handle.sequencer.notify_screen_changed()
+
+    async def join(self) -> list[str]:
+        """等待当前所有序列结束，返回各自的结果。"""
+        return list(await asyncio.gather(*(h.done for h in self.handles)))
+
+    # ---- 调度 ----
+
+    def _arm(self, handle: SequenceHandle, deadline: Optional[float]) -> None:
+        if deadline is None:
+            if not handle.sequencer.paused:
+                self._settle(handle)
+            return
+        loop = self.loop
+        remaining = deadline - loop.time()
+        if 0.0 < remaining <= SPIN_S:
+            # 极近的截止时间原地自旋：交给 call_at 会被提前触发，随后反复空转事件循环
+            while loop.time() < deadline:
+                pass
+        elif 0.0 < remaining < self._resolution:
+            # call_at 最多提前一个时钟分辨率触发；加上余量保证不早于截止时间
+            deadline += self._resolution
+        handle._timer = loop.call_at(deadline, self._due, handle)
+
+    def _due(self, handle: SequenceHandle) -> None:
+        handle._timer = None
+        self._ready.append(handle)
+        if not self._draining:
+            self._draining = True
+            self.loop.call_soon(self._drain)
+
+    def _drain(self) -> None:
+        """注入队列的唯一消费者：同一轮到期的序列按到期顺序逐个点击。"""
+        ready = self._ready
+        try:
+            while ready:
+                handle = ready.popleft()
+                sequencer = handle.sequencer
+                if not sequencer.running or sequencer.paused:
+                    continue
+                try:
+                    deadline = sequencer.step()
+                except Exception as exc:  # noqa: BLE001
+                    sequencer.stop()
+                    self._settle(handle, exc)
+                    continue
+                self._arm(handle, deadline)
+        finally:
+            self._draining = False
+
+    def _settle(self, handle: SequenceHandle, exc: Optional[BaseException] = None) -> None:
+        if handle.done.done():
+            return
+        try:
+            self._handles.remove(handle)
+        except ValueError:
+            pass
+        if exc is not None:
+            handle.done.set_exception(exc)
+        else:
+            handle.done.set_result(handle.outcome)
+        if handle.outcome == FAILSAFE:
+            self.stop_all()
@@ -0,0 +1,97 @@
+"""输入注入后端：统一接口与按需加载的注册表。"""
+
+from __future__ import annotations
+
+import importlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from ..model import ScreenSize
+
+
+class BackendError(RuntimeError):
+    """输入后端调用失败。"""
+
+
+class BackendUnavailable(BackendError):
+    """当前环境无法使用该后端（缺少依赖、平台不符等）。"""
+
+
+class FailSafeError(BackendError):
+    """触发 FailSafe（鼠标位于屏幕角落），应立即停止。"""
+
+
+class InputBackend(ABC):
+    """输入注入后端接口。
+
+    ``click`` 应在一次调用内完成移动与单击，且不得附带任何隐式等待。
+    ``screen_size`` 每次都应返回最新尺寸，执行方在屏幕变化后会重新调用它。
+    """
+
+    name = ""
+
+    @abstractmethod
+    def screen_size(self) -> ScreenSize:
+        ...
+
+    @abstractmethod
+    def click(self, x: int, y: int) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+@dataclass(frozen=True, slots=True)
+class _BackendEntry:
+    name: str
+    target: str
+    priority: int
+
+
+_REGISTRY: dict[str, _BackendEntry] = {}
+
+
+def register_backend(name: str, target: str, priority: int = 100) -> None:
+    """注册后端。``target`` 形如 ``"package.module:ClassName"``，首次使用时才导入。
+
+    ``priority`` 越小越优先，用于自动选择。
+    """
+    _REGISTRY[name] = _BackendEntry(name=name, target=target, priority=int(priority))
+
+
+def backend_names() -> list[str]:
+    """按优先级返回已注册的后端名称。"""
+    return [e.name for e in sorted(_REGISTRY.values(), key=lambda e: e.priority)]
+
+
+def _instantiate(entry: _BackendEntry) -> InputBackend:
+    module_name, _, attr = entry.target.partition(":")
+    try:
+        module = importlib.import_module(module_name)
+        factory = getattr(module, attr)
+    except ImportError as exc:
+        raise BackendUnavailable(f"{entry.name}: {exc}") from exc
+    return factory()
+
+
+def load_backend(name: Optional[str] = None) -> InputBackend:
+    """加载指定后端；``name`` 为空时按优先级返回第一个可用的后端。"""
+    if name:
+        entry = _REGISTRY.get(name)
+        if entry is None:
+            raise BackendUnavailable(f"未知的输入后端：{name}")
+        return _instantiate(entry)
+
+    errors: list[str] = []
+    for backend in backend_names():
+        try:
+            return _instantiate(_REGISTRY[backend])
+        except BackendUnavailable as exc:
+            errors.append(str(exc))
+    raise BackendUnavailable("没有可用的输入后端：" + "；".join(errors))
+
+
+register_backend("xtest", "clicker_core.backends.xtest:XTestBackend", priority=10)
+register_backend("pyautogui", "clicker_core.backends.pyautogui_backend:PyAutoGuiBackend", priority=50)
@@ -0,0 +1,35 @@
+"""基于 pyautogui 的通用后端（Windows/macOS/Linux）。"""
+
+from __future__ import annotations
+
+from ..model import ScreenSize
+from . import BackendUnavailable, FailSafeError, InputBackend
+
+
+class PyAutoGuiBackend(InputBackend):
+    """pyautogui 后端。
+
+    关闭全局 ``PAUSE``（默认每次调用后额外睡眠 0.1s），并用一次 ``click(x, y)``
+    完成移动与单击。
+    """
+
+    name = "pyautogui"
+
+    def __init__(self) -> None:
+        try:
+            import pyautogui
+        except Exception as exc:  # noqa: BLE001
+            raise BackendUnavailable(f"pyautogui 导入失败：{exc}") from exc
+        pyautogui.PAUSE = 0
+        self._gui = pyautogui
+        self._failsafe_exc = getattr(pyautogui, "FailSafeException", ())
+
+    def screen_size(self) -> ScreenSize:
+        size = self._gui.size()
+        return ScreenSize(width=int(size.width), height=int(size.height))
+
+    def click(self, x: int, y: int) -> None:
+        try:
+            self._gui.click(x, y)
+        except self._failsafe_exc as exc:
+            raise FailSafeError(str(exc)) from exc
@@ -0,0 +1,133 @@
+"""通过 ctypes 直接调用 X11 XTest 扩展的后端（Linux/X11）。"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import sys
+
+from ..model import ScreenSize
+from . import BackendUnavailable, FailSafeError, InputBackend
+
+_BUTTON_LEFT = 1
+_FAILSAFE_MARGIN = 0
+
+
+def _load(name: str) -> ctypes.CDLL:
+    path = ctypes.util.find_library(name)
+    if not path:
+        raise BackendUnavailable(f"未找到 lib{name}")
+    try:
+        return ctypes.CDLL(path)
+    except OSError as exc:
+        raise BackendUnavailable(f"lib{name} 加载失败：{exc}") from exc
+
+
+class XTestBackend(InputBackend):
+    """XTest 后端：一次移动 + 按下/抬起，只在末尾 ``XFlush`` 一次。
+
+    与 pyautogui 一致，指针位于屏幕四角时触发 FailSafe；每次点击只多一次
+    ``XQueryPointer``，屏幕尺寸取自缓存。
+    """
+
+    name = "xtest"
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux") or not os.environ.get("DISPLAY"):
+            raise BackendUnavailable("xtest: 需要 Linux X11 显示环境")
+        x11 = _load("X11")
+        xtst = _load("Xtst")
+
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XDefaultScreen.restype = ctypes.c_int
+        x11.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayWidth.restype = ctypes.c_int
+        x11.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayHeight.restype = ctypes.c_int
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        x11.XQueryPointer.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_ulong,
+            ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_uint),
+        ]
+        xtst.XTestFakeMotionEvent.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_ulong,
+        ]
+        xtst.XTestFakeButtonEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong]
+
+        display = x11.XOpenDisplay(None)
+        if not display:
+            raise BackendUnavailable("xtest: 无法连接 X 显示")
+        self._x11 = x11
+        self._xtst = xtst
+        self._display = display
+        self._screen = x11.XDefaultScreen(display)
+        self._root = x11.XDefaultRootWindow(display)
+        self._size = self.screen_size()
+
+    def screen_size(self) -> ScreenSize:
+        """查询当前尺寸并刷新 FailSafe 检测使用的缓存。"""
+        self._size = ScreenSize(
+            width=int(self._x11.XDisplayWidth(self._display, self._screen)),
+            height=int(self._x11.XDisplayHeight(self._display, self._screen)),
+        )
+        return self._size
+
+    def _check_failsafe(self) -> None:
+        root = ctypes.c_ulong()
+        child = ctypes.c_ulong()
+        rx = ctypes.c_int()
+        ry = ctypes.c_int()
+        wx = ctypes.c_int()
+        wy = ctypes.c_int()
+        mask = ctypes.c_uint()
+        ok = self._x11.XQueryPointer(
+            self._display,
+            self._root,
+            ctypes.byref(root),
+            ctypes.byref(child),
+            ctypes.byref(rx),
+            ctypes.byref(ry),
+            ctypes.byref(wx),
+            ctypes.byref(wy),
+            ctypes.byref(mask),
+        )
+        if not ok:
+            return
+        # 使用缓存的屏幕尺寸；执行方在屏幕变化后会调用 screen_size() 刷新
+        size = self._size
+        max_x = size.width - 1 - _FAILSAFE_MARGIN
+        max_y = size.height - 1 - _FAILSAFE_MARGIN
+        x = rx.value
+        y = ry.value
+        if (x <= _FAILSAFE_MARGIN or x >= max_x) and (y <= _FAILSAFE_MARGIN or y >= max_y):
+            raise FailSafeError(f"pointer at corner ({x},{y})")
+
+    def click(self, x: int, y: int) -> None:
+        self._check_failsafe()
+        dpy = self._display
+        self._xtst.XTestFakeMotionEvent(dpy, self._screen, int(x), int(y), 0)
+        self._xtst.XTestFakeButtonEvent(dpy, _BUTTON_LEFT, 1, 0)
+        self._xtst.XTestFakeButtonEvent(dpy, _BUTTON_LEFT, 0, 0)
+        self._x11.XFlush(dpy)
+
+    def close(self) -> None:
+        if self._display:
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
@@ -0,0 +1,217 @@
+"""紧凑二进制配置格式（.clkb）：定长列块，内存映射后零拷贝读取。
+
+文件布局（小端）::
+
+    0   magic "CLKB" | u16 版本 | u16 保留 | u32 头部长度 | u32 屏幕数 | u64 点数
+    24  头部 JSON（settings/meta，UTF-8），补齐到 8 字节
+        屏幕表：每项 i32 宽 + i32 高
+        xs：f64 × 点数
+        ys：f64 × 点数
+        屏幕下标：i32 × 点数（-1 表示无）
+        模式：u8 × 点数（0=abs，1=ratio）
+
+各列按自身宽度对齐，读取时直接把映射区 ``cast`` 为对应类型作为
+:class:`~clicker_core.model.PointStore` 的列，打开文件为 O(1)，之后只有缺页开销。
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+
+from .model import (
+    AppConfig,
+    PointStore,
+    ScreenSize,
+    _screen_from_any,
+    config_from_json_dict,
+    config_to_json_dict_v2,
+    settings_to_json,
+)
+from .stream import ConfigStream
+
+MAGIC = b"CLKB"
+FORMAT_VERSION = 1
+SUFFIX = ".clkb"
+
+# 小于该字节数的文件直接读入内存；只有更大的文件才映射。
+MMAP_MIN_BYTES = 32 << 20
+# Windows 上被映射的文件无法 os.replace/删除，会挡住“保存覆盖”与缓存清理，因此不映射
+_CAN_MAP = not sys.platform.startswith("win")
+
+_PREAMBLE = struct.Struct("<4sHHIIQ")
+_SCREEN = struct.Struct("<ii")
+_NATIVE_LE = sys.byteorder == "little"
+
+PathLike = Union[str, Path]
+
+
+class ClkbError(ValueError):
+    """不是合法的 .clkb 文件，或版本不受支持。"""
+
+
+def _pad8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _le_bytes(column: Any, typecode: str) -> Any:
+    """返回可直接写入文件的小端缓冲区。"""
+    if _NATIVE_LE:
+        return memoryview(column).cast("B")
+    swapped = array(typecode, column)
+    swapped.byteswap()
+    return swapped
+
+
+def write_clkb(
+    fp: BinaryIO,
+    config: AppConfig,
+    screen: Optional[ScreenSize] = None,
+    extra: Optional[dict[str, Any]] = None,
+) -> None:
+    """把 ``config`` 写为 .clkb；各列直接从 :class:`PointStore` 缓冲区写出。
+
+    ``extra`` 中的键原样写入头部，读取时由 :func:`read_clkb` 返回。
+    """
+    store = PointStore.from_points(config.points)
+    header: dict[str, Any] = dict(extra or {})
+    header["settings"] = settings_to_json(config)
+    if screen is not None:
+        header["meta"] = {"screen": {"w": int(screen.width), "h": int(screen.height)}}
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    screens = store.screens
+
+    fp.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header_bytes), len(screens), len(store)))
+    fp.write(header_bytes)
+    fp.write(b"\0" * (_pad8(len(header_bytes)) - len(header_bytes)))
+    for sc in screens:
+        fp.write(_SCREEN.pack(int(sc.width), int(sc.height)))
+    fp.write(_le_bytes(store.xs, "d"))
+    fp.write(_le_bytes(store.ys, "d"))
+    fp.write(_le_bytes(store.screen_ids, "i"))
+    fp.write(bytes(store.modes))
+
+
+def save_clkb(path: PathLike, config: AppConfig, screen: Optional[ScreenSize] = None) -> None:
+    with open(path, "wb") as f:
+        write_clkb(f, config, screen)
+
+
+def is_clkb(path: PathLike) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _meta_screen(header: dict[str, Any]) -> Optional[ScreenSize]:
+    meta = header.get("meta")
+    if not isinstance(meta, dict):
+        return None
+    return _screen_from_any(meta.get("screen"))
+
+
+def _parse(buf: Any, validate: bool) -> tuple[AppConfig, dict[str, Any]]:
+    view = memoryview(buf)
+    if len(view) < _PREAMBLE.size:
+        raise ClkbError("文件过短")
+    magic, version, _, header_len, n_screens, n = _PREAMBLE.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ClkbError("不是 .clkb 文件")
+    if version != FORMAT_VERSION:
+        raise ClkbError(f"不支持的 .clkb 版本：{version}")
+
+    offset = _PREAMBLE.size
+    try:
+        header = json.loads(bytes(view[offset : offset + header_len]).decode("utf-8"))
+    except ValueError as exc:
+        raise ClkbError(f"头部损坏：{exc}") from exc
+    if not isinstance(header, dict):
+        raise ClkbError("头部损坏")
+    offset += _pad8(header_len)
+
+    screens = [ScreenSize(*_SCREEN.unpack_from(view, offset + i * _SCREEN.size)) for i in range(n_screens)]
+    offset += n_screens * _SCREEN.size
+
+    end = offset + n * (8 + 8 + 4 + 1)
+    if end > len(view):
+        raise ClkbError("文件被截断")
+
+    def column(size: int, typecode: str) -> Any:
+        nonlocal offset
+        raw = view[offset : offset + n * size]
+        offset += n * size
+        if typecode == "B":
+            return raw
+        if _NATIVE_LE:
+            return raw.cast(typecode)
+        col = array(typecode)
+        col.frombytes(raw)
+        col.byteswap()
+        return col
+
+    xs = column(8, "d")
+    ys = column(8, "d")
+    screen_ids = column(4, "i")
+    modes = column(1, "B")
+    store = PointStore.from_columns(xs, ys, modes, screen_ids, screens)
+    if validate:
+        corrupt = store.find_corrupt()
+        if corrupt >= 0:
+            raise ClkbError(f"第 {corrupt + 1} 个点的模式或屏幕下标损坏")
+
+    base = config_from_json_dict({"version": 2, **header})
+    return replace(base, points=store), header
+
+
+def read_clkb(path: PathLike, use_mmap: Optional[bool] = None) -> tuple[AppConfig, dict[str, Any]]:
+    """同 :func:`load_clkb`，额外返回解析后的头部。"""
+    with open(path, "rb") as f:
+        if use_mmap is None:
+            use_mmap = _CAN_MAP and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES
+        if not use_mmap:
+            return _parse(f.read(), validate=True)
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 空文件无法映射
+            raise ClkbError("文件过短") from None
+    # 映射路径保持 O(1) 打开：模式与屏幕下标留到取点或编译计划时再校验
+    return _parse(mapped, validate=False)
+
+
+def load_clkb(path: PathLike, use_mmap: Optional[bool] = None) -> AppConfig:
+    """读取 .clkb；坐标列直接引用读入的缓冲区，对其修改会先复制为私有数组。
+
+    ``use_mmap`` 为 None 时，不小于 :data:`MMAP_MIN_BYTES` 的文件以只读方式映射
+    （Windows 除外），映射区随返回的 :class:`PointStore` 存活；较小的文件整体读入。
+    整体读入时立即校验模式与屏幕下标，损坏则抛出 :class:`ClkbError`；映射时不逐点
+    扫描，损坏的点在取值时抛出 ``ValueError``、在 :func:`~clicker_core.plan.compile_plan`
+    时抛出 :class:`~clicker_core.plan.PlanError`。
+    """
+    return read_clkb(path, use_mmap)[0]
+
+
+def json_to_clkb(src: PathLike, dst: PathLike) -> None:
+    """把 JSON 配置转换为 .clkb（增量读取，不构建完整 dict 树）。"""
+    with open(src, "r", encoding="utf-8") as f:
+        stream = ConfigStream(f)
+        store = PointStore()
+        store.extend(stream.points())
+        config = stream.config(store)
+    save_clkb(dst, config, _meta_screen(stream.header))
+
+
+def clkb_to_json(src: PathLike, dst: PathLike) -> None:
+    """把 .clkb 转换为 JSON v2，供不支持二进制格式的一端读取。"""
+    config, header = read_clkb(src)
+    with open(dst, "w", encoding="utf-8") as f:
+        json.dump(config_to_json_dict_v2(config, _meta_screen(header)), f, ensure_ascii=False)
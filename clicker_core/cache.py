@@ -0,0 +1,213 @@
+"""已解析配置的缓存：最近/固定文件切换时免去重复解析。"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+from .binfmt import SUFFIX as CLKB_SUFFIX
+from .binfmt import ClkbError, is_clkb, read_clkb, write_clkb
+from .configio import load_config_file
+from .model import AppConfig, PointStore
+from .persist import atomic_write
+
+PathLike = Union[str, Path]
+
+DEFAULT_BUDGET_BYTES = 64 << 20
+# 每个缓存项除坐标列外的估算开销（设置、屏幕表等）
+_ENTRY_OVERHEAD = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class CacheKey:
+    """缓存有效性依据：规范化路径 + 修改时间 + 文件大小。"""
+
+    path: str
+    mtime_ns: int
+    size: int
+
+    @classmethod
+    def for_path(cls, path: PathLike) -> "CacheKey":
+        norm = os.path.normcase(os.path.abspath(os.fspath(path)))
+        st = os.stat(norm)
+        return cls(path=norm, mtime_ns=st.st_mtime_ns, size=st.st_size)
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    key: CacheKey
+    config: AppConfig
+    nbytes: int
+
+
+def _share(config: AppConfig) -> AppConfig:
+    return replace(config, points=PointStore.from_points(config.points))
+
+
+class ConfigCache:
+    """按 :class:`CacheKey` 校验的 LRU 配置缓存。
+
+    坐标点以 :class:`PointStore` 保存，命中时返回写时复制快照（O(1)）。总占用超过
+    ``budget_bytes`` 时按最近最少使用淘汰，固定（pinned）的文件不被淘汰。给定
+    ``persist_dir`` 时，JSON 配置解析后会在后台另存一份 .clkb，下次启动直接映射读取。
+    线程安全：:meth:`prewarm` 在后台线程加载，界面线程可同时调用 :meth:`get`。
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int = DEFAULT_BUDGET_BYTES,
+        persist_dir: Optional[PathLike] = None,
+        loader: Callable[[str], AppConfig] = load_config_file,
+        max_persisted: int = 8,
+    ) -> None:
+        self._budget = max(0, int(budget_bytes))
+        self._persist_dir = Path(persist_dir) if persist_dir is not None else None
+        self._loader = loader
+        self._max_persisted = max(0, int(max_persisted))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._pinned: set[str] = set()
+        self._nbytes = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_budget(self, budget_bytes: int) -> None:
+        with self._lock:
+            self._budget = max(0, int(budget_bytes))
+            self._evict()
+
+    def pin(self, path: PathLike) -> None:
+        with self._lock:
+            self._pinned.add(os.path.normcase(os.path.abspath(os.fspath(path))))
+
+    def unpin(self, path: PathLike) -> None:
+        with self._lock:
+            self._pinned.discard(os.path.normcase(os.path.abspath(os.fspath(path))))
+            self._evict()
+
+    def invalidate(self, path: PathLike) -> None:
+        norm = os.path.normcase(os.path.abspath(os.fspath(path)))
+        with self._lock:
+            entry = self._entries.pop(norm, None)
+            if entry is not None:
+                self._nbytes -= entry.nbytes
+
+    def get(self, path: PathLike) -> AppConfig:
+        """返回 ``path`` 的配置；缓存失效或未命中时重新读取并放入缓存。"""
+        key = CacheKey.for_path(path)
+        with self._lock:
+            entry = self._entries.get(key.path)
+            if entry is not None and entry.key == key:
+                self._entries.move_to_end(key.path)
+                self.hits += 1
+                return _share(entry.config)
+            self.misses += 1
+
+        config = self._load_persisted(key)
+        if config is None:
+            config = self._loader(key.path)
+            if self._persist_dir is not None and not is_clkb(key.path):
+                self._submit(self._persist, key, _share(config))
+        self._put(key, config)
+        return _share(config)
+
+    def prewarm(self, paths: Iterable[PathLike]) -> list[Future]:
+        """在后台线程依次加载 ``paths``（跳过不存在或读取失败的文件）。"""
+        return [self._submit(self._prewarm_one, p) for p in paths if p]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _prewarm_one(self, path: PathLike) -> None:
+        try:
+            self.get(path)
+        except (OSError, ValueError):
+            pass
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clicker-cache")
+            executor = self._executor
+        return executor.submit(fn, *args)
+
+    def _put(self, key: CacheKey, config: AppConfig) -> None:
+        store = PointStore.from_points(config.points)
+        entry = _Entry(key=key, config=replace(config, points=store), nbytes=store.nbytes + _ENTRY_OVERHEAD)
+        with self._lock:
+            old = self._entries.pop(key.path, None)
+            if old is not None:
+                self._nbytes -= old.nbytes
+            self._entries[key.path] = entry
+            self._nbytes += entry.nbytes
+            self._evict()
+
+    def _evict(self) -> None:
+        if self._nbytes <= self._budget:
+            return
+        for path in list(self._entries):
+            if self._nbytes <= self._budget:
+                break
+            if path in self._pinned:
+                continue
+            entry = self._entries.pop(path)
+            self._nbytes -= entry.nbytes
+
+    # ---- 磁盘缓存 ----
+
+    def _persist_path(self, key: CacheKey) -> Path:
+        assert self._persist_dir is not None
+        digest = hashlib.sha1(key.path.encode("utf-8")).hexdigest()[:20]
+        return self._persist_dir / f"{digest}{CLKB_SUFFIX}"
+
+    def _load_persisted(self, key: CacheKey) -> Optional[AppConfig]:
+        if self._persist_dir is None:
+            return None
+        path = self._persist_path(key)
+        if not path.exists():
+            return None
+        try:
+            config, header = read_clkb(path)
+        except (OSError, ClkbError):
+            return None
+        source = header.get("source")
+        if source != {"path": key.path, "mtime_ns": key.mtime_ns, "size": key.size}:
+            return None
+        return config
+
+    def _persist(self, key: CacheKey, config: AppConfig) -> None:
+        path = self._persist_path(key)
+        source = {"path": key.path, "mtime_ns": key.mtime_ns, "size": key.size}
+        try:
+            atomic_write(path, lambda f: write_clkb(f, config, extra={"source": source}), binary=True)
+        except OSError:
+            return
+        self._prune_persisted()
+
+    def _prune_persisted(self) -> None:
+        assert self._persist_dir is not None
+        try:
+            files = sorted(self._persist_dir.glob(f"*{CLKB_SUFFIX}"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+        except OSError:
+            return
+        for stale in files[self._max_persisted :]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,40 @@
+"""按文件内容/扩展名选择配置格式（JSON 或 .clkb）。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from .binfmt import SUFFIX as CLKB_SUFFIX
+from .binfmt import is_clkb, load_clkb, write_clkb
+from .model import AppConfig, ClickPoint, ScreenSize
+from .persist import atomic_write
+from .stream import iter_points, load_config_streaming, write_config_json
+
+PathLike = Union[str, Path]
+
+# 文件对话框使用的过滤器
+FILE_FILTER = "Clicker 配置 (*.json *.clkb);;JSON Files (*.json);;二进制配置 (*.clkb);;All Files (*.*)"
+
+
+def load_config_file(path: PathLike) -> AppConfig:
+    """读取配置；.clkb 按文件头识别，其余按 JSON 增量读取。"""
+    if is_clkb(path):
+        return load_clkb(path)
+    return load_config_streaming(path)
+
+
+def iter_config_points(path: PathLike) -> Iterator[ClickPoint]:
+    """逐个产出配置文件中的坐标点（供边读取边运行）。"""
+    if is_clkb(path):
+        yield from load_clkb(path).points
+        return
+    yield from iter_points(path)
+
+
+def save_config_file(path: PathLike, config: AppConfig, screen: Optional[ScreenSize] = None) -> None:
+    """按扩展名原子保存：``.clkb`` 写二进制，其余流式写 JSON v3。"""
+    if Path(path).suffix.lower() == CLKB_SUFFIX:
+        atomic_write(path, lambda f: write_clkb(f, config, screen), binary=True)
+        return
+    atomic_write(path, lambda f: write_config_json(f, config, screen))
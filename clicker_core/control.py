@@ -0,0 +1,187 @@
+"""运行控制：暂停/继续/停止信号与共享进度计数。"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from .timing import Clock
+
+
+class RunControl:
+    """基于条件变量的运行控制块。
+
+    执行方在间隔内只做一次可超时等待，``request_pause``/``request_resume``/
+    ``request_stop`` 会立即唤醒它，无需周期性轮询。停止请求到执行方确认之间的
+    延迟会被记录，便于度量。
+    """
+
+    def __init__(self, clock: Clock = time.perf_counter) -> None:
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._paused = False
+        self._stopped = False
+        self._stop_requested_at: Optional[float] = None
+        self._stop_latency: Optional[float] = None
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    @property
+    def stop_latency(self) -> Optional[float]:
+        """最近一次停止请求被执行方确认所用的秒数；未停止时为 None。"""
+        return self._stop_latency
+
+    def request_pause(self) -> None:
+        with self._cond:
+            if self._stopped:
+                return
+            self._paused = True
+            self._cond.notify_all()
+
+    def request_resume(self) -> None:
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def request_stop(self) -> None:
+        with self._cond:
+            if not self._stopped:
+                self._stopped = True
+                self._stop_requested_at = self._clock()
+            self._paused = False
+            self._cond.notify_all()
+
+    def wait(self, timeout: float) -> bool:
+        """最多等待 ``timeout`` 秒；被暂停或停止打断时返回 True。"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._stopped or self._paused, max(0.0, timeout))
+
+    def wait_while_paused(self) -> float:
+        """暂停期间阻塞，直到继续或停止；返回本次暂停的秒数。"""
+        with self._cond:
+            if not self._paused or self._stopped:
+                return 0.0
+            started = self._clock()
+            self._cond.wait_for(lambda: self._stopped or not self._paused)
+            return self._clock() - started
+
+    def acknowledge_stop(self) -> None:
+        """执行方观察到停止后调用，记录停止延迟。"""
+        with self._cond:
+            if self._stop_requested_at is not None and self._stop_latency is None:
+                self._stop_latency = max(0.0, self._clock() - self._stop_requested_at)
+
+
+@dataclass(frozen=True, slots=True)
+class RunParams:
+    """运行中可实时修改的参数。"""
+
+    interval_ms: int = 500
+    loop_interval_ms: int = 0
+    burst_cps: int = 100
+
+
+class ParamBlock:
+    """界面线程发布、执行方读取的参数块。
+
+    发布时整体替换不可变的 :class:`RunParams`，读写都只是一次引用赋值，
+    执行方无需加锁，也不会触碰任何界面控件。
+    """
+
+    __slots__ = ("_current",)
+
+    def __init__(self, params: Optional[RunParams] = None) -> None:
+        self._current = params if params is not None else RunParams()
+
+    @property
+    def current(self) -> RunParams:
+        return self._current
+
+    def publish(self, params: RunParams) -> None:
+        self._current = params
+
+
+@dataclass(frozen=True, slots=True)
+class RunSummary:
+    """一次运行结束时由执行方填写的统计。"""
+
+    clicks: int = 0
+    cycles: int = 0
+    elapsed_s: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class ProgressSnapshot:
+    """进度块在某一时刻的一致快照。"""
+
+    version: int = 0
+    step: int = 0
+    total: int = 0
+    cycle: int = 0
+    cycles_total: int = 0
+    rate: float = 0.0
+    target_rate: float = 0.0
+
+
+class ProgressBlock:
+    """执行方写、界面方采样的共享进度计数。
+
+    单一写者只做整数/浮点赋值，不发送任何跨线程消息；读者按自己的刷新频率调用
+    :meth:`snapshot`。写入前后各递增一次序号（奇数表示写入中），读者据此重试，
+    得到字段间一致的快照。
+    """
+
+    __slots__ = ("_seq", "step", "total", "cycle", "cycles_total", "rate", "target_rate")
+
+    def __init__(self) -> None:
+        self._seq = 0
+        self.step = 0
+        self.total = 0
+        self.cycle = 0
+        self.cycles_total = 0
+        self.rate = 0.0
+        self.target_rate = 0.0
+
+    def set_step(self, step: int, total: int) -> None:
+        self._seq += 1
+        self.step = step
+        self.total = total
+        self._seq += 1
+
+    def set_cycle(self, cycle: int, cycles_total: int) -> None:
+        self._seq += 1
+        self.cycle = cycle
+        self.cycles_total = cycles_total
+        self._seq += 1
+
+    def set_rate(self, rate: float, target_rate: float) -> None:
+        self._seq += 1
+        self.rate = rate
+        self.target_rate = target_rate
+        self._seq += 1
+
+    def snapshot(self) -> ProgressSnapshot:
+        while True:
+            seq = self._seq
+            if seq & 1:
+                time.sleep(0)
+                continue
+            snap = ProgressSnapshot(
+                version=seq,
+                step=self.step,
+                total=self.total,
+                cycle=self.cycle,
+                cycles_total=self.cycles_total,
+                rate=self.rate,
+                target_rate=self.target_rate,
+            )
+            if self._seq == seq:
+                return snap
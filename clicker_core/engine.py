@@ -0,0 +1,435 @@
+"""顺序连点的执行引擎：桌面端、命令行与安卓共用同一个状态机。
+
+:class:`Sequencer` 只负责"现在该做什么、下次何时醒来"：游标、轮次、间隔与连发
+限速都在这里。它不自己等待，由驱动方决定如何睡眠——桌面端与命令行使用阻塞的
+:func:`run_blocking`，安卓端在 Kivy ``Clock`` 回调中调用 :meth:`Sequencer.step`。
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from .backends import FailSafeError, InputBackend
+from .control import ParamBlock, ProgressBlock, RunControl, RunSummary
+from .model import BurstSettings, ClickPoint, LoopSettings, PointStore, ScreenSize
+from .plan import CompiledPlan, PlanError, StreamingPlan, compile_plan
+from .stream import prefetch
+from .telemetry import ClickTelemetry
+from .timing import Clock, PrecisionTimer, RateMeter, Schedule, TokenBucket
+from .trace import TraceRecorder
+
+# 连发模式允许的瞬时突发量（秒），用于吸收系统调度抖动。
+BURST_SLACK_S = 0.02
+
+# 运行结果
+RUNNING = "running"
+COMPLETED = "completed"
+STOPPED = "stopped"
+FAILSAFE = "failsafe"
+PLAN_ERROR = "plan_error"
+BACKEND_ERROR = "backend_error"
+
+
+@dataclass(frozen=True, slots=True)
+class RunPlan:
+    """一次运行计划（原始坐标点，开始时按屏幕尺寸预编译）。
+
+    给定 ``source`` 时忽略 ``points``：首轮经预取队列边读取边执行，之后各轮复用
+    首轮读到的点。``compiled`` 为调用方预先编译的结果，屏幕尺寸一致时直接使用。
+    """
+
+    points: PointStore
+    loop: LoopSettings
+    burst: BurstSettings = field(default_factory=BurstSettings)
+    source: Iterable[ClickPoint] | None = None
+    compiled: CompiledPlan | None = None
+
+
+class SequencerObserver:
+    """执行过程的回调接口，默认全部为空操作。
+
+    回调在驱动 :class:`Sequencer` 的线程中同步调用，应保持轻量；时间参数均来自
+    ``Sequencer`` 注入的时钟。
+    """
+
+    def on_cycle(self, cycle: int, cycles_total: int) -> None:
+        """新一轮开始；``cycles_total`` 为 0 表示无限循环。"""
+
+    def on_step(self, step: int, total: int) -> None:
+        """即将点击第 ``step`` 个点（从 1 开始）；``total`` 为 0 表示总数未知。"""
+
+    def on_click(self, index: int, scheduled: float, sent: float, done: float) -> None:
+        """一次点击完成：计划时间与后端调用起止时间。"""
+
+    def on_rate(self, rate: float, target: float) -> None:
+        """实际点击速率更新（约每秒一次）；``target`` 为 0 表示非连发模式。"""
+
+    def on_pause(self, start: float, end: float) -> None:
+        """一段暂停结束。"""
+
+    def on_screen(self, screen: ScreenSize, at: float) -> None:
+        """按新的屏幕尺寸（重新）编译了计划。"""
+
+    def on_error(self, message: str, at: float) -> None:
+        """执行因错误结束。"""
+
+
+class Sequencer:
+    """单次运行的顺序连点状态机。
+
+    典型驱动方式::
+
+        deadline = seq.start()
+        while deadline is not None:
+            等待到 deadline（可被暂停/停止打断）
+            deadline = seq.step()
+
+    :meth:`step` 在未到期时不做任何事、只返回下次醒来的时间；到期时最多点击一次。
+    除 :meth:`notify_screen_changed` 外，所有方法都应在同一线程调用。
+    """
+
+    def __init__(
+        self,
+        plan: RunPlan,
+        backend: InputBackend,
+        params: Optional[ParamBlock] = None,
+        observer: Optional[SequencerObserver] = None,
+        clock: Clock = time.perf_counter,
+    ) -> None:
+        self.plan = plan
+        self.clock = clock
+        self._backend = backend
+        self._params = params or ParamBlock()
+        self._observer = observer or SequencerObserver()
+        self._screen_changed = threading.Event()
+        self._program: CompiledPlan | StreamingPlan | None = None
+        self._streaming: StreamingPlan | None = None
+        self._steps: Iterator[int] = iter(())
+        self._next_index: Optional[int] = None
+        self._total = 0
+        self._schedule: Optional[Schedule] = None
+        self._bucket: Optional[TokenBucket] = None
+        self._target_cps = 0.0
+        self._meter = RateMeter()
+        self._due: Optional[float] = None
+        self._gate: Optional[float] = None
+        self._paused_at: Optional[float] = None
+        self._started: Optional[float] = None
+        self._ended: Optional[float] = None
+        self.outcome = ""
+        self.error: Optional[str] = None
+        self.screen: Optional[ScreenSize] = None
+        self.clicks = 0
+        self.cycle = 0
+        loop = plan.loop
+        if loop.enabled and loop.infinite:
+            self.cycles_total = 0
+        elif loop.enabled:
+            self.cycles_total = max(1, int(loop.count))
+        else:
+            self.cycles_total = 1
+
+    @property
+    def running(self) -> bool:
+        return self.outcome == RUNNING
+
+    @property
+    def paused(self) -> bool:
+        return self._paused_at is not None
+
+    def summary(self) -> RunSummary:
+        if self._started is None:
+            return RunSummary()
+        end = self._ended if self._ended is not None else self.clock()
+        return RunSummary(clicks=self.clicks, cycles=self.cycle, elapsed_s=end - self._started)
+
+    def notify_screen_changed(self) -> None:
+        """屏幕几何变化时可由任意线程调用；下一次点击前按新尺寸重新编译。"""
+        self._screen_changed.set()
+
+    # ---- 生命周期 ----
+
+    def start(self) -> Optional[float]:
+        """编译计划并进入第一轮；返回首次醒来时间，立即结束时返回 None。"""
+        now = self.clock()
+        self._started = now
+        self.outcome = RUNNING
+        plan = self.plan
+        if not plan.points and plan.source is None:
+            return self._finish(COMPLETED)
+        if plan.source is not None:
+            self._screen_changed.clear()
+            screen = self._screen_size()
+            if screen is None:
+                return None
+            self.screen = screen
+            self._observer.on_screen(screen, now)
+            # 不循环时读过的点不会再执行，流式计划不必保留历史
+            self._streaming = StreamingPlan(prefetch(plan.source), screen, keep=plan.loop.enabled)
+            self._program = self._streaming
+        elif not self._compile("坐标超出屏幕范围", plan.compiled):
+            return None
+
+        self._schedule = Schedule(now)
+        self._target_cps = float(self._params.current.burst_cps)
+        if plan.burst.enabled:
+            cps = self._target_cps
+            self._bucket = TokenBucket(cps, now, capacity=cps * BURST_SLACK_S)
+        return self._begin_cycle(now)
+
+    def step(self) -> Optional[float]:
+        """推进到当前时间：到期则点击一次。返回下次醒来时间，结束时返回 None。"""
+        if self.outcome != RUNNING or self._paused_at is not None:
+            return None
+        now = self.clock()
+        if self._gate is not None:
+            if now < self._gate:
+                return self._gate
+            self._gate = None
+            return self._begin_cycle(now)
+        due = self._reserve(now)
+        if now < due:
+            return due
+        return self._click(due)
+
+    def next_wake(self) -> Optional[float]:
+        """不点击，只返回下次醒来时间。"""
+        if self.outcome != RUNNING or self._paused_at is not None:
+            return None
+        if self._gate is not None:
+            return self._gate
+        return self._reserve(self.clock())
+
+    def pause(self) -> None:
+        if self.outcome == RUNNING and self._paused_at is None:
+            self._paused_at = self.clock()
+
+    def resume(self) -> None:
+        """结束暂停：后续截止时间整体顺延暂停时长。"""
+        if self._paused_at is None:
+            return
+        now = self.clock()
+        start, self._paused_at = self._paused_at, None
+        paused = now - start
+        if self._schedule is not None:
+            self._schedule.shift(paused)
+        if self._gate is not None:
+            self._gate += paused
+        if self._bucket is not None:
+            self._bucket.reset(now)
+        self._due = None
+        self._observer.on_pause(start, now)
+
+    def stop(self) -> None:
+        if self.outcome == RUNNING:
+            if self._paused_at is not None:
+                self.resume()
+            self._finish(STOPPED)
+
+    def close(self) -> None:
+        """释放流式读取等资源（结束时会自动调用）。"""
+        if self._streaming is not None:
+            self._streaming.close()
+
+    # ---- 内部 ----
+
+    def _compile(self, prefix: str, compiled: CompiledPlan | None = None) -> bool:
+        self._screen_changed.clear()
+        screen = self._screen_size()
+        if screen is None:
+            return False
+        self.screen = screen
+        self._observer.on_screen(screen, self.clock())
+        try:
+            if self._streaming is not None:
+                self._streaming.rescreen(screen)
+            elif compiled is not None and compiled.screen == screen:
+                self._program = compiled
+            else:
+                self._program = compile_plan(self.plan.points, screen)
+        except PlanError as exc:
+            self._fail(f"{prefix}：{exc}", PLAN_ERROR)
+            return False
+        except (ValueError, OverflowError) as exc:
+            self._fail(f"坐标无效：{exc}", PLAN_ERROR)
+            return False
+        return True
+
+    def _screen_size(self) -> Optional[ScreenSize]:
+        """查询后端屏幕尺寸；失败时以 BACKEND_ERROR 结束并返回 None。"""
+        try:
+            return self._backend.screen_size()
+        except Exception as exc:  # noqa: BLE001
+            self._fail(f"获取屏幕尺寸失败：{exc}", BACKEND_ERROR)
+            return None
+
+    def _begin_cycle(self, now: float) -> Optional[float]:
+        self.cycle += 1
+        self._observer.on_cycle(self.cycle, self.cycles_total)
+        streaming = self._streaming
+        if streaming is not None and not streaming.done:
+            self._total = 0
+            self._steps = streaming.steps()
+        else:
+            assert self._program is not None
+            self._total = len(self._program)
+            self._steps = iter(range(self._total))
+        return self._advance(now)
+
+    def _advance(self, now: float) -> Optional[float]:
+        """取下一个点；本轮已完时决定结束或等待轮间隔。"""
+        try:
+            self._next_index = next(self._steps, None)
+        except PlanError as exc:
+            return self._fail(f"坐标超出屏幕范围：{exc}", PLAN_ERROR)
+        except Exception as exc:  # noqa: BLE001
+            return self._fail(f"读取坐标失败：{exc}", PLAN_ERROR)
+        if self._next_index is not None:
+            return self._reserve(now)
+
+        assert self._program is not None and self._schedule is not None
+        if not self.plan.loop.enabled or not len(self._program):
+            return self._finish(COMPLETED)
+        if self.cycles_total and self.cycle >= self.cycles_total:
+            return self._finish(COMPLETED)
+        if self._bucket is not None:
+            self._schedule.reset(now)
+        self._gate = self._schedule.advance(self._params.current.loop_interval_ms / 1000.0, now)
+        return self._gate
+
+    def _reserve(self, now: float) -> float:
+        if self._due is None:
+            bucket = self._bucket
+            if bucket is not None:
+                cps = float(self._params.current.burst_cps)
+                if cps != self._target_cps:
+                    self._target_cps = cps
+                    bucket.set_rate(cps)
+                self._due = bucket.reserve(now)
+            else:
+                assert self._schedule is not None
+                self._due = self._schedule.deadline
+        return self._due
+
+    def _click(self, due: float) -> Optional[float]:
+        i = self._next_index
+        assert i is not None and self._schedule is not None
+        self._due = None
+        observer = self._observer
+        observer.on_step(i + 1, self._total)
+        try:
+            if self._screen_changed.is_set() and not self._compile("屏幕分辨率变更导致坐标越界"):
+                return None
+            program = self._program
+            assert program is not None
+            x, y = program.pixel(i)
+            sent = self.clock()
+            self._backend.click(x, y)
+            done = self.clock()
+        except FailSafeError:
+            return self._fail("触发 FailSafe：鼠标移动到屏幕角落，已停止", FAILSAFE)
+        except Exception as exc:  # noqa: BLE001
+            return self._fail(f"点击失败：{exc}", BACKEND_ERROR)
+
+        self.clicks += 1
+        observer.on_click(i, due, sent, done)
+        if self._meter.tick(done):
+            observer.on_rate(self._meter.rate, self._target_cps if self._bucket is not None else 0.0)
+        if self._bucket is None:
+            self._schedule.advance(self._params.current.interval_ms / 1000.0, done)
+        return self._advance(done)
+
+    def _fail(self, message: str, outcome: str) -> None:
+        if self.outcome != RUNNING:
+            return None
+        self.error = message
+        self._observer.on_error(message, self.clock())
+        return self._finish(outcome)
+
+    def _finish(self, outcome: str) -> None:
+        # 已有结果时忽略（例如回调中先停止、随后本轮又自然结束）
+        if self.outcome != RUNNING:
+            return None
+        self.outcome = outcome
+        self._ended = self.clock()
+        self._due = None
+        self._gate = None
+        self.close()
+        return None
+
+
+def run_blocking(sequencer: Sequencer, control: RunControl, timer: Optional[PrecisionTimer] = None) -> str:
+    """在当前线程驱动 ``sequencer`` 直到结束，暂停/停止由 ``control`` 控制。
+
+    返回 :attr:`Sequencer.outcome`。
+    """
+    timer = timer or PrecisionTimer(sequencer.clock)
+    deadline = sequencer.start()
+    while deadline is not None:
+        if control.stopped:
+            sequencer.stop()
+            break
+        if control.paused:
+            sequencer.pause()
+            control.wait_while_paused()
+            sequencer.resume()
+            deadline = sequencer.next_wake()
+            continue
+        if timer.wait_until(deadline, control.wait) and not control.stopped:
+            deadline = sequencer.step()
+    if control.stopped:
+        control.acknowledge_stop()
+    return sequencer.outcome
+
+
+class InstrumentObserver(SequencerObserver):
+    """把执行过程写入共享进度块、点击遥测与运行轨迹（均可省略）。"""
+
+    def __init__(
+        self,
+        progress: Optional[ProgressBlock] = None,
+        telemetry: Optional[ClickTelemetry] = None,
+        trace: Optional[TraceRecorder] = None,
+    ) -> None:
+        self.progress = progress
+        self.telemetry = telemetry
+        self.trace = trace
+        self._last_done: Optional[float] = None
+
+    def on_cycle(self, cycle: int, cycles_total: int) -> None:
+        if self.progress is not None:
+            self.progress.set_cycle(cycle, cycles_total)
+
+    def on_step(self, step: int, total: int) -> None:
+        if self.progress is not None:
+            self.progress.set_step(step, total)
+
+    def on_click(self, index: int, scheduled: float, sent: float, done: float) -> None:
+        if self.telemetry is not None:
+            self.telemetry.record(scheduled, sent, done)
+        trace = self.trace
+        if trace is not None:
+            # 等待区间：上一次点击结束到本次发出，期间的暂停区间嵌套其中
+            if self._last_done is not None:
+                trace.span("wait", self._last_done, sent)
+            trace.span("click", sent, done, index)
+            self._last_done = done
+
+    def on_rate(self, rate: float, target: float) -> None:
+        if self.progress is not None:
+            self.progress.set_rate(rate, target)
+
+    def on_pause(self, start: float, end: float) -> None:
+        if self.trace is not None:
+            self.trace.span("pause", start, end)
+
+    def on_screen(self, screen: ScreenSize, at: float) -> None:
+        if self.trace is not None:
+            self.trace.instant("screen", at, width=screen.width, height=screen.height)
+
+    def on_error(self, message: str, at: float) -> None:
+        if self.trace is not None:
+            self.trace.instant("error", at, message=message)
@@ -0,0 +1,100 @@
+"""非阻塞日志管线：调用线程只入队，专用线程负责格式化落盘与轮转。"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any, Union
+
+DEFAULT_CAPACITY = 4096
+LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+
+
+class DroppingQueueHandler(QueueHandler):
+    """有界队列的 :class:`QueueHandler`：队列满时丢弃记录并计数，从不阻塞调用方。
+
+    丢弃后首次入队成功时，先补一条 ``log_dropped`` 警告说明丢了多少条。
+    """
+
+    def __init__(self, q: queue.Queue) -> None:
+        super().__init__(q)
+        self.dropped = 0
+        self._unreported = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Handler.handle 已持有处理器锁，计数无需额外同步
+        if self._unreported:
+            notice = logging.makeLogRecord(
+                {
+                    "name": record.name,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": f"log_dropped count={self._unreported}",
+                }
+            )
+            try:
+                self.queue.put_nowait(notice)
+            except queue.Full:
+                self._drop()
+                return
+            self._unreported = 0
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._drop()
+
+    def _drop(self) -> None:
+        self.dropped += 1
+        self._unreported += 1
+
+
+class _BlockingSentinelListener(QueueListener):
+    # 默认实现用 put_nowait 放入结束标记，有界队列已满时会失败；写入线程仍在消费，阻塞等待即可
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class LogPipeline:
+    """把 ``logger`` 的输出改为经有界队列交给写入线程的 ``RotatingFileHandler``。"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        path: Union[str, Path],
+        max_bytes: int = 512_000,
+        backup_count: int = 3,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        self._logger = logger
+        file_handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.handler = DroppingQueueHandler(queue.Queue(maxsize=max(1, int(capacity))))
+        self.listener = _BlockingSentinelListener(self.handler.queue, file_handler, respect_handler_level=True)
+        self._file_handler = file_handler
+        self._running = True
+        logger.addHandler(self.handler)
+        self.listener.start()
+
+    @property
+    def dropped(self) -> int:
+        return self.handler.dropped
+
+    def stop(self) -> None:
+        """写完队列中剩余的记录后停止写入线程。"""
+        if not self._running:
+            return
+        self._running = False
+        self._logger.removeHandler(self.handler)
+        self.listener.stop()
+        self._file_handler.close()
+
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields: Any) -> None:
+    """写一条结构化记录：消息为 ``event`` 加一行 JSON，字段另存于 ``record.fields``。"""
+    if not logger.isEnabledFor(level):
+        return
+    payload = json.dumps(fields, ensure_ascii=False, sort_keys=True, default=str)
+    logger.log(level, "%s %s", event, payload, extra={"fields": fields})
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import math
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Literal, Optional
+from typing import Any, Iterable, Iterator, Literal, Optional, Sequence, Union
 
 PointMode = Literal["abs", "ratio"]
 
@@ -39,6 +41,215 @@ class ClickPoint:
         return ClickPoint(mode="ratio", x=float(x), y=float(y), screen=screen)
 
 
+_MODES: tuple[PointMode, ...] = ("abs", "ratio")
+_MODE_CODES: dict[str, int] = {"abs": 0, "ratio": 1}
+_NO_SCREEN = -1
+
+
+class PointStore:
+    """列式坐标点存储。
+
+    x/y 存于 ``array('d')``，模式存于 ``bytearray``（0=abs，1=ratio），
+    每点的 ``ScreenSize`` 存为驻留表下标（-1 表示无）。每点约 21 字节。
+
+    :meth:`snapshot` 为写时复制：快照与原对象共享缓冲区，任一方首次修改时才复制，
+    因此控制器、工作线程与序列化可以共用同一份数据而无需逐点拷贝。
+    """
+
+    __slots__ = ("_xs", "_ys", "_modes", "_screen_ids", "_screens", "_screen_lookup", "_shared")
+
+    def __init__(self) -> None:
+        self._xs = array("d")
+        self._ys = array("d")
+        self._modes = bytearray()
+        self._screen_ids = array("i")
+        self._screens: list[ScreenSize] = []
+        self._screen_lookup: dict[ScreenSize, int] = {}
+        self._shared = False
+
+    @classmethod
+    def from_points(cls, points: Iterable[ClickPoint]) -> "PointStore":
+        if isinstance(points, PointStore):
+            return points.snapshot()
+        store = cls()
+        store.extend(points)
+        return store
+
+    @classmethod
+    def from_columns(
+        cls,
+        xs: Any,
+        ys: Any,
+        modes: Any,
+        screen_ids: Any,
+        screens: Sequence[ScreenSize] = (),
+    ) -> "PointStore":
+        """直接包装已有的列缓冲区（不复制）；首次修改时才复制为私有数组。"""
+        store = cls.__new__(cls)
+        store._xs = xs
+        store._ys = ys
+        store._modes = modes
+        store._screen_ids = screen_ids
+        store._screens = list(screens)
+        store._screen_lookup = {sc: i for i, sc in enumerate(store._screens)}
+        store._shared = True
+        return store
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __iter__(self) -> Iterator[ClickPoint]:
+        for i in range(len(self._xs)):
+            yield self._point_at(i)
+
+    def __getitem__(self, index: int) -> ClickPoint:
+        n = len(self._xs)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("point index out of range")
+        return self._point_at(index)
+
+    def __setitem__(self, index: int, point: ClickPoint) -> None:
+        self._own()
+        self._xs[index] = float(point.x)
+        self._ys[index] = float(point.y)
+        self._modes[index] = _MODE_CODES.get(point.mode, 0)
+        self._screen_ids[index] = self._intern(point.screen)
+
+    def _point_at(self, i: int) -> ClickPoint:
+        mode = self._modes[i]
+        sid = self._screen_ids[i]
+        if mode > 1 or not _NO_SCREEN <= sid < len(self._screens):
+            # 外部列（如映射的 .clkb）不在加载时逐点校验，取值时发现损坏
+            raise ValueError(f"第 {i + 1} 个点数据损坏")
+        return ClickPoint(
+            mode=_MODES[mode],
+            x=self._xs[i],
+            y=self._ys[i],
+            screen=None if sid == _NO_SCREEN else self._screens[sid],
+        )
+
+    @property
+    def xs(self) -> array:
+        return self._xs
+
+    @property
+    def ys(self) -> array:
+        return self._ys
+
+    @property
+    def modes(self) -> bytearray:
+        return self._modes
+
+    @property
+    def screen_ids(self) -> array:
+        return self._screen_ids
+
+    @property
+    def screens(self) -> tuple[ScreenSize, ...]:
+        return tuple(self._screens)
+
+    @property
+    def nbytes(self) -> int:
+        n = len(self._xs)
+        return n * (self._xs.itemsize + self._ys.itemsize + 1 + self._screen_ids.itemsize)
+
+    def x_at(self, i: int) -> float:
+        return self._xs[i]
+
+    def y_at(self, i: int) -> float:
+        return self._ys[i]
+
+    def mode_at(self, i: int) -> PointMode:
+        return _MODES[self._modes[i]]
+
+    def find_corrupt(self) -> int:
+        """返回第一个模式或屏幕下标损坏的点的下标，全部合法时返回 -1（O(n)）。"""
+        n = len(self._xs)
+        if not n:
+            return -1
+        modes = self._modes
+        sids = self._screen_ids
+        n_screens = len(self._screens)
+        if not bytes(modes).translate(None, b"\x00\x01") and _NO_SCREEN <= min(sids) and max(sids) < n_screens:
+            return -1
+        for i in range(n):
+            if modes[i] > 1 or not _NO_SCREEN <= sids[i] < n_screens:
+                return i
+        return -1
+
+    def snapshot(self) -> "PointStore":
+        """返回共享缓冲区的写时复制快照（O(1)）。"""
+        snap = PointStore.__new__(PointStore)
+        snap._xs = self._xs
+        snap._ys = self._ys
+        snap._modes = self._modes
+        snap._screen_ids = self._screen_ids
+        snap._screens = self._screens
+        snap._screen_lookup = self._screen_lookup
+        snap._shared = True
+        self._shared = True
+        return snap
+
+    def _own(self) -> None:
+        if not self._shared:
+            return
+        self._xs = array("d", self._xs)
+        self._ys = array("d", self._ys)
+        self._modes = bytearray(self._modes)
+        self._screen_ids = array("i", self._screen_ids)
+        self._screens = list(self._screens)
+        self._screen_lookup = dict(self._screen_lookup)
+        self._shared = False
+
+    def _intern(self, screen: Optional[ScreenSize]) -> int:
+        if screen is None:
+            return _NO_SCREEN
+        sid = self._screen_lookup.get(screen)
+        if sid is None:
+            sid = len(self._screens)
+            self._screens.append(screen)
+            self._screen_lookup[screen] = sid
+        return sid
+
+    def append(self, point: ClickPoint) -> None:
+        self._own()
+        self._xs.append(float(point.x))
+        self._ys.append(float(point.y))
+        self._modes.append(_MODE_CODES.get(point.mode, 0))
+        self._screen_ids.append(self._intern(point.screen))
+
+    def extend(self, points: Iterable[ClickPoint]) -> None:
+        for p in points:
+            self.append(p)
+
+    def remove_rows(self, rows: Iterable[int]) -> None:
+        """删除给定下标（越界下标被忽略）。"""
+        ranges = row_ranges(rows, len(self._xs))
+        if not ranges:
+            return
+        self._own()
+        for first, last in ranges:
+            for column in (self._xs, self._ys, self._modes, self._screen_ids):
+                del column[first : last + 1]
+
+    def move(self, first: int, last: int, dest: int) -> None:
+        """按 :func:`row_moves` 的一步移动连续区间。"""
+        self._own()
+        for column in (self._xs, self._ys, self._modes, self._screen_ids):
+            apply_row_move(column, first, last, dest)
+
+    def clear(self) -> None:
+        self._xs = array("d")
+        self._ys = array("d")
+        self._modes = bytearray()
+        self._screen_ids = array("i")
+        self._screens = []
+        self._screen_lookup = {}
+        self._shared = False
+
+
 @dataclass(slots=True)
 class LoopSettings:
     enabled: bool = False
@@ -55,12 +266,79 @@ class HotkeySettings:
     stop: str = "ctrl+shift+x"
 
 
+@dataclass(slots=True)
+class BurstSettings:
+    """连发模式：忽略间隔时间，按目标每秒点击数（CPS）背靠背发送。"""
+
+    enabled: bool = False
+    cps: int = 100
+
+
+BURST_CPS_MIN = 1
+BURST_CPS_MAX = 1000
+
+
 @dataclass(slots=True)
 class AppConfig:
-    points: list[ClickPoint]
+    points: Union[PointStore, Sequence[ClickPoint]]
     interval_ms: int = 500
     loop: LoopSettings = field(default_factory=LoopSettings)
     hotkeys: HotkeySettings = field(default_factory=HotkeySettings)
+    burst: BurstSettings = field(default_factory=BurstSettings)
+
+
+def row_ranges(rows: Iterable[int], n: int) -> list[tuple[int, int]]:
+    """把待删除的行拆成连续区间 ``(first, last)``，自下而上排列，越界下标被忽略。
+
+    按返回顺序逐个删除时，前面的删除不会改变后面区间的下标。
+    """
+    valid = sorted({r for r in rows if 0 <= r < n}, reverse=True)
+    ranges: list[tuple[int, int]] = []
+    i = 0
+    while i < len(valid):
+        last = first = valid[i]
+        while i + 1 < len(valid) and valid[i + 1] == first - 1:
+            i += 1
+            first = valid[i]
+        ranges.append((first, last))
+        i += 1
+    return ranges
+
+
+def row_moves(rows: list[int], dest: int) -> list[tuple[int, int, int]]:
+    """把“选中行整体移到 ``dest`` 之前”拆成依次执行的连续块移动。
+
+    返回 ``(first, last, dest)`` 列表，语义与 ``QAbstractItemModel.beginMoveRows``
+    一致，已跳过不改变顺序的移动。选中行移动后保持原有相对顺序并连续排列。
+    """
+    selected = sorted(set(rows))
+    blocks: list[list[int]] = []
+    for r in selected:
+        if blocks and r == blocks[-1][1] + 1 and r != dest:
+            blocks[-1][1] = r
+        else:
+            blocks.append([r, r])
+
+    moves: list[tuple[int, int, int]] = []
+    ins = dest
+    for first, last in reversed([b for b in blocks if b[1] < dest]):
+        if ins != last + 1:
+            moves.append((first, last, ins))
+        ins -= last - first + 1
+    ins = dest
+    for first, last in (b for b in blocks if b[0] >= dest):
+        if ins != first:
+            moves.append((first, last, ins))
+        ins += last - first + 1
+    return moves
+
+
+def apply_row_move(seq: Any, first: int, last: int, dest: int) -> None:
+    """按 :func:`row_moves` 的一步原地移动序列元素（list/array/bytearray）。"""
+    block = seq[first : last + 1]
+    del seq[first : last + 1]
+    at = dest - len(block) if dest > last else dest
+    seq[at:at] = block
 
 
 def validate_point(point: ClickPoint, screen: ScreenSize) -> tuple[bool, str]:
@@ -69,6 +347,8 @@ def validate_point(point: ClickPoint, screen: ScreenSize) -> tuple[bool, str]:
             return False, "比例坐标必须在 0.0–1.0 范围内"
         return True, ""
 
+    if not (math.isfinite(point.x) and math.isfinite(point.y)):
+        return False, "坐标必须是有限数值"
     x = int(round(point.x))
     y = int(round(point.y))
     max_x = max(0, int(screen.width) - 1)
@@ -80,6 +360,151 @@ def validate_point(point: ClickPoint, screen: ScreenSize) -> tuple[bool, str]:
     return True, ""
 
 
+_numpy_module: Any = None
+
+
+def _numpy() -> Any:
+    """按需导入 NumPy；不可用时返回 None，调用方退回纯 Python 实现。"""
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_module = False
+        else:
+            _numpy_module = numpy
+    return _numpy_module or None
+
+
+def validate_points(store: PointStore, screen: ScreenSize, limit: int = 10) -> tuple[Any, list[int]]:
+    """批量校验，规则与 :func:`validate_point` 一致。
+
+    返回 ``(mask, failures)``：``mask`` 中 1/True 表示该点有效（NumPy 可用时为布尔数组，
+    否则为 ``bytearray``）；``failures`` 为前 ``limit`` 个无效点的下标。
+    """
+    max_x = max(0, int(screen.width) - 1)
+    max_y = max(0, int(screen.height) - 1)
+    np = _numpy()
+    if np is not None and len(store):
+        xs = np.frombuffer(store.xs, dtype=np.float64)
+        ys = np.frombuffer(store.ys, dtype=np.float64)
+        ratio = np.frombuffer(store.modes, dtype=np.uint8) == 1
+        ok_ratio = (xs >= 0.0) & (xs <= 1.0) & (ys >= 0.0) & (ys <= 1.0)
+        rx = np.rint(xs)
+        ry = np.rint(ys)
+        ok_abs = (rx >= 0) & (ry >= 0) & (rx <= max_x) & (ry <= max_y)
+        mask = np.where(ratio, ok_ratio, ok_abs)
+        failures = np.flatnonzero(~mask)[: max(0, limit)].tolist()
+        return mask, failures
+
+    mask = bytearray(len(store))
+    failures: list[int] = []
+    xs = store.xs
+    ys = store.ys
+    modes = store.modes
+    for i in range(len(store)):
+        x = xs[i]
+        y = ys[i]
+        if modes[i] == 1:
+            ok = 0.0 <= x <= 1.0 and 0.0 <= y <= 1.0
+        elif math.isfinite(x) and math.isfinite(y):
+            rx = round(x)
+            ry = round(y)
+            ok = 0 <= rx <= max_x and 0 <= ry <= max_y
+        else:
+            # NaN/无穷无法取整，与 NumPy 实现一样记为无效
+            ok = False
+        if ok:
+            mask[i] = 1
+        elif len(failures) < limit:
+            failures.append(i)
+    return mask, failures
+
+
+_INT_MIN = -(2**31)
+_INT_MAX = 2**31 - 1
+
+
+def _pixel_overflow() -> OverflowError:
+    return OverflowError("像素坐标超出 32 位整数范围")
+
+
+def resolve_pixels(store: PointStore, screen: ScreenSize) -> tuple[array, array]:
+    """批量换算为像素坐标，结果与逐点 :meth:`ClickPoint.to_pixels` 一致。
+
+    结果超出 32 位整数范围（含 NaN/无穷）时，两种实现都抛出 :class:`OverflowError`。
+    """
+    max_x = max(0, int(screen.width) - 1)
+    max_y = max(0, int(screen.height) - 1)
+    out_x = array("i")
+    out_y = array("i")
+    np = _numpy()
+    if np is not None and len(store):
+        xs = np.frombuffer(store.xs, dtype=np.float64)
+        ys = np.frombuffer(store.ys, dtype=np.float64)
+        ratio = np.frombuffer(store.modes, dtype=np.uint8) == 1
+        fx = np.rint(np.where(ratio, xs * max_x, xs))
+        fy = np.rint(np.where(ratio, ys * max_y, ys))
+        # astype 遇到越界/NaN 会静默回绕，先检查（NaN 比较为 False，同样判为越界）
+        if not (np.all((fx >= _INT_MIN) & (fx <= _INT_MAX)) and np.all((fy >= _INT_MIN) & (fy <= _INT_MAX))):
+            raise _pixel_overflow()
+        px = fx.astype(np.intc)
+        py = fy.astype(np.intc)
+        out_x.frombytes(px.tobytes())
+        out_y.frombytes(py.tobytes())
+        return out_x, out_y
+
+    xs = store.xs
+    ys = store.ys
+    modes = store.modes
+    try:
+        for i in range(len(store)):
+            if modes[i] == 1:
+                out_x.append(int(round(xs[i] * max_x)))
+                out_y.append(int(round(ys[i] * max_y)))
+            else:
+                out_x.append(int(round(xs[i])))
+                out_y.append(int(round(ys[i])))
+    except (OverflowError, ValueError):
+        # round(nan) 抛 ValueError，round(inf) 与 array 溢出抛 OverflowError
+        raise _pixel_overflow() from None
+    return out_x, out_y
+
+
+def to_absolute(store: PointStore, screen: ScreenSize) -> PointStore:
+    """把全部点换算为像素绝对坐标；比例点及缺少屏幕信息的点记为 ``screen``。"""
+    px, py = resolve_pixels(store, screen)
+    screens = list(store.screens)
+    if screen in screens:
+        target = screens.index(screen)
+    else:
+        target = len(screens)
+        screens.append(screen)
+    np = _numpy()
+    if np is not None and len(store):
+        sids = np.frombuffer(store.screen_ids, dtype=np.intc)
+        ratio = np.frombuffer(store.modes, dtype=np.uint8) == 1
+        new_sids = np.where(ratio | (sids == _NO_SCREEN), target, sids).astype(np.intc)
+        screen_ids = array("i")
+        screen_ids.frombytes(new_sids.tobytes())
+        xs = array("d")
+        ys = array("d")
+        xs.frombytes(np.frombuffer(px, dtype=np.intc).astype(np.float64).tobytes())
+        ys.frombytes(np.frombuffer(py, dtype=np.intc).astype(np.float64).tobytes())
+    else:
+        modes = store.modes
+        old_sids = store.screen_ids
+        screen_ids = array(
+            "i",
+            (target if modes[i] == 1 or old_sids[i] == _NO_SCREEN else old_sids[i] for i in range(len(store))),
+        )
+        xs = array("d", map(float, px))
+        ys = array("d", map(float, py))
+    result = PointStore.from_columns(xs, ys, bytearray(len(store)), screen_ids, screens)
+    result._shared = False
+    return result
+
+
 def _screen_from_any(data: Any) -> Optional[ScreenSize]:
     if not isinstance(data, dict):
         return None
@@ -101,31 +526,38 @@ def config_to_json_dict_v2(config: AppConfig, screen: Optional[ScreenSize] = Non
             item["screen"] = {"w": p.screen.width, "h": p.screen.height}
         points.append(item)
 
-    data: dict[str, Any] = {
-        "version": 2,
-        "points": points,
-        "settings": {
-            "interval_ms": int(config.interval_ms),
-            "loop": {
-                "enabled": bool(config.loop.enabled),
-                "infinite": bool(config.loop.infinite),
-                "count": int(config.loop.count),
-                "interval_ms": int(config.loop.interval_ms),
-            },
-            "hotkeys": {
-                "enabled": bool(config.hotkeys.enabled),
-                "start": str(config.hotkeys.start),
-                "pause": str(config.hotkeys.pause),
-                "stop": str(config.hotkeys.stop),
-            },
-        },
-    }
+    # settings/meta 写在 points 之前，流式读取时可先拿到设置
+    data: dict[str, Any] = {"version": 2, "settings": settings_to_json(config)}
 
     if screen is not None:
         data["meta"] = {"screen": {"w": int(screen.width), "h": int(screen.height)}}
+    data["points"] = points
     return data
 
 
+def settings_to_json(config: AppConfig) -> dict[str, Any]:
+    """配置中除坐标点以外的部分（各格式共用的 ``settings`` 对象）。"""
+    return {
+        "interval_ms": int(config.interval_ms),
+        "loop": {
+            "enabled": bool(config.loop.enabled),
+            "infinite": bool(config.loop.infinite),
+            "count": int(config.loop.count),
+            "interval_ms": int(config.loop.interval_ms),
+        },
+        "hotkeys": {
+            "enabled": bool(config.hotkeys.enabled),
+            "start": str(config.hotkeys.start),
+            "pause": str(config.hotkeys.pause),
+            "stop": str(config.hotkeys.stop),
+        },
+        "burst": {
+            "enabled": bool(config.burst.enabled),
+            "cps": int(config.burst.cps),
+        },
+    }
+
+
 def config_from_json_dict(data: dict[str, Any]) -> AppConfig:
     version = int(data.get("version", 1))
     settings = data.get("settings") or {}
@@ -148,34 +580,69 @@ def config_from_json_dict(data: dict[str, Any]) -> AppConfig:
         stop=str(hotkeys_raw.get("stop", "ctrl+shift+x")),
     )
 
-    points: list[ClickPoint] = []
-    points_raw = data.get("points") or []
+    burst_raw = settings.get("burst") or {}
+    burst = BurstSettings(
+        enabled=bool(burst_raw.get("enabled", False)),
+        cps=max(BURST_CPS_MIN, min(BURST_CPS_MAX, int(burst_raw.get("cps", 100)))),
+    )
 
-    if version <= 1:
-        for item in points_raw:
-            if not isinstance(item, dict):
-                continue
-            try:
-                x = int(item.get("x"))
-                y = int(item.get("y"))
-            except (TypeError, ValueError):
-                continue
-            points.append(ClickPoint.from_abs(x, y))
-        return AppConfig(points=points, interval_ms=interval_ms, loop=loop, hotkeys=hotkeys)
-
-    for item in points_raw:
-        if not isinstance(item, dict):
-            continue
-        mode = item.get("mode", "abs")
-        if mode not in ("abs", "ratio"):
-            mode = "abs"
+    screens = screens_from_json(data.get("screens")) if version >= 3 else ()
+    points = PointStore()
+    for item in data.get("points") or []:
+        point = point_from_json(item, version, screens)
+        if point is not None:
+            points.append(point)
+
+    return AppConfig(points=points, interval_ms=interval_ms, loop=loop, hotkeys=hotkeys, burst=burst)
+
+
+def screens_from_json(data: Any) -> list[Optional[ScreenSize]]:
+    """解析 v3 的 ``screens`` 表；不合法的项记为 None。"""
+    if not isinstance(data, list):
+        return []
+    return [_screen_from_any(item) for item in data]
+
+
+def point_from_json(
+    item: Any,
+    version: int,
+    screens: Sequence[Optional[ScreenSize]] = (),
+) -> Optional[ClickPoint]:
+    """解析 ``points`` 数组中的单个元素；格式不合法时返回 None。
+
+    v3 的点为 ``[x, y, 模式, 屏幕下标]``（模式 0=abs、1=ratio，下标 -1 表示无），
+    屏幕下标指向 ``screens`` 表。
+    """
+    if version >= 3 and isinstance(item, list):
+        if len(item) < 2:
+            return None
         try:
-            x = float(item.get("x"))
-            y = float(item.get("y"))
+            x = float(item[0])
+            y = float(item[1])
+            code = int(item[2]) if len(item) > 2 else 0
+            sid = int(item[3]) if len(item) > 3 else _NO_SCREEN
         except (TypeError, ValueError):
-            continue
-        screen_item = _screen_from_any(item.get("screen"))
-        points.append(ClickPoint(mode=mode, x=x, y=y, screen=screen_item))
+            return None
+        screen = screens[sid] if 0 <= sid < len(screens) else None
+        return ClickPoint(mode=_MODES[code] if code in (0, 1) else "abs", x=x, y=y, screen=screen)
 
-    return AppConfig(points=points, interval_ms=interval_ms, loop=loop, hotkeys=hotkeys)
+    if not isinstance(item, dict):
+        return None
 
+    if version <= 1:
+        try:
+            x = int(item.get("x"))
+            y = int(item.get("y"))
+        except (TypeError, ValueError):
+            return None
+        return ClickPoint.from_abs(x, y)
+
+    mode = item.get("mode", "abs")
+    if mode not in ("abs", "ratio"):
+        mode = "abs"
+    try:
+        x = float(item.get("x"))
+        y = float(item.get("y"))
+    except (TypeError, ValueError):
+        return None
+    return ClickPoint(mode=mode, x=x, y=y, screen=_screen_from_any(item.get("screen")))
@@ -0,0 +1,189 @@
+"""原子写入与后台保存：序列化与磁盘 I/O 不占用界面线程。"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import IO, Callable, Optional, Union
+
+from .model import AppConfig, PointStore, ScreenSize
+
+PathLike = Union[str, Path]
+
+
+def _read_umask() -> int:
+    # 只能通过设置来读取；在导入时读一次，避免之后与其他线程创建文件竞争
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _read_umask() if os.name == "posix" else 0
+
+
+def atomic_write(path: PathLike, write: Callable[[IO], None], binary: bool = False) -> None:
+    """先写同目录临时文件并 fsync，再 ``os.replace`` 覆盖目标。
+
+    写入中途崩溃只会留下临时文件，原文件保持完整。覆盖已有文件时沿用其权限，
+    新文件按 umask 设置权限（``mkstemp`` 默认只有 0600）。
+    """
+    target = Path(path)
+    directory = target.parent if str(target.parent) else Path(".")
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=directory)
+    try:
+        if binary:
+            f: IO = os.fdopen(fd, "wb")
+        else:
+            f = os.fdopen(fd, "w", encoding="utf-8", newline="\n")
+        with f:
+            write(f)
+            f.flush()
+            if os.name == "posix":
+                os.fchmod(f.fileno(), _target_mode(target))
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+
+def _target_mode(target: Path) -> int:
+    try:
+        return target.stat().st_mode & 0o7777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def _fsync_dir(directory: Path) -> None:
+    # 目录项的持久化仅在 POSIX 上可用
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@dataclass(frozen=True, slots=True)
+class SaveResult:
+    """一次后台保存的结果；``error`` 为 None 表示成功。"""
+
+    path: str
+    error: Optional[str]
+    elapsed: float
+    autosave: bool
+
+
+@dataclass(frozen=True, slots=True)
+class _Job:
+    config: AppConfig
+    screen: Optional[ScreenSize]
+    autosave: bool
+
+
+def _snapshot(config: AppConfig) -> AppConfig:
+    """冻结坐标点（写时复制快照，O(1)），之后界面线程的修改不影响本次保存。"""
+    return replace(config, points=PointStore.from_points(config.points))
+
+
+class BackgroundSaver:
+    """单线程后台保存队列。
+
+    同一路径尚未开始写入的请求会被后来的请求覆盖，只写最新的内容。``on_done``
+    在保存线程中调用，调用方负责转发到自己的界面线程；编辑后的防抖由调用方
+    用各自的定时器完成。
+    """
+
+    def __init__(
+        self,
+        save: Callable[[str, AppConfig, Optional[ScreenSize]], None],
+        on_done: Optional[Callable[[SaveResult], None]] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._save = save
+        self._on_done = on_done
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._pending: dict[str, _Job] = {}
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="clicker-saver", daemon=True)
+        self._thread.start()
+
+    def save(
+        self,
+        path: PathLike,
+        config: AppConfig,
+        screen: Optional[ScreenSize] = None,
+        autosave: bool = False,
+    ) -> None:
+        job = _Job(config=_snapshot(config), screen=screen, autosave=autosave)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("保存队列已关闭")
+            previous = self._pending.pop(str(path), None)
+            if previous is not None and not previous.autosave:
+                job = _Job(config=job.config, screen=job.screen, autosave=False)
+            self._pending[str(path)] = job
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """等待排队中的保存全部完成；超时返回 False。"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """写出剩余内容后停止保存线程。"""
+        done = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return done
+
+    def _next_job(self) -> Optional[tuple[str, _Job]]:
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending or self._closed)
+            if not self._pending:
+                return None
+            path = next(iter(self._pending))
+            job = self._pending.pop(path)
+            self._busy = True
+            return path, job
+
+    def _run(self) -> None:
+        while True:
+            item = self._next_job()
+            if item is None:
+                return
+            path, job = item
+            started = self._clock()
+            error: Optional[str] = None
+            try:
+                self._save(path, job.config, job.screen)
+            except Exception as exc:  # noqa: BLE001
+                error = str(exc) or exc.__class__.__name__
+            result = SaveResult(path=path, error=error, elapsed=self._clock() - started, autosave=job.autosave)
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+            if self._on_done is not None:
+                try:
+                    self._on_done(result)
+                except Exception:  # noqa: BLE001
+                    pass
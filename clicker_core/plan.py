@@ -0,0 +1,140 @@
+"""运行计划预编译：把坐标点一次性解析为紧凑的像素数组。"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Union
+
+from .model import ClickPoint, PointStore, ScreenSize, resolve_pixels, validate_points
+
+
+class PlanError(ValueError):
+    """预编译时发现坐标越界或数据损坏。"""
+
+    def __init__(self, message: str, index: int) -> None:
+        super().__init__(message)
+        self.index = index
+
+    @classmethod
+    def out_of_range(cls, index: int, px: int, py: int, screen: ScreenSize) -> "PlanError":
+        max_x = int(screen.width) - 1
+        max_y = int(screen.height) - 1
+        return cls(f"第 {index + 1} 个点坐标越界：({px},{py})，当前最大({max_x},{max_y})", index)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPlan:
+    """按某一屏幕尺寸解析好的点击程序。
+
+    ``xs``/``ys`` 为 ``array('i')``，已完成越界校验；执行时只需按下标取值。
+    步间延时仍由运行参数提供，以保证运行中修改间隔实时生效。
+    """
+
+    xs: array
+    ys: array
+    screen: ScreenSize
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def pixel(self, i: int) -> tuple[int, int]:
+        return self.xs[i], self.ys[i]
+
+
+def compile_plan(points: Union[PointStore, Iterable[ClickPoint]], screen: ScreenSize) -> CompiledPlan:
+    """按 ``screen`` 批量解析全部坐标点；存在越界点时抛出 :class:`PlanError`。"""
+    store = PointStore.from_points(points)
+    corrupt = store.find_corrupt()
+    if corrupt >= 0:
+        raise PlanError(f"第 {corrupt + 1} 个点数据损坏", corrupt)
+    _, failures = validate_points(store, screen, limit=1)
+    if failures:
+        i = failures[0]
+        point = store[i]
+        if not (math.isfinite(point.x) and math.isfinite(point.y)):
+            raise PlanError(f"第 {i + 1} 个点坐标无效：({point.x},{point.y})", i)
+        px, py = point.to_pixels(screen)
+        raise PlanError.out_of_range(i, px, py, screen)
+    xs, ys = resolve_pixels(store, screen)
+    return CompiledPlan(xs=xs, ys=ys, screen=screen)
+
+
+class StreamingPlan:
+    """边读取边编译的计划。
+
+    首轮执行时 :meth:`steps` 每从源中取到一个点就校验、解析并追加到 ``xs``/``ys``，
+    随后产出其下标；读取完成后与 :class:`CompiledPlan` 一样按下标取值。
+
+    ``keep`` 为 False 时（不循环执行，读过的点不会再用到）只保留最近读取的一个点，
+    内存占用与点数无关；此时只能用 :meth:`pixel` 取该点，:meth:`rescreen` 也只重新
+    解析它。
+    """
+
+    def __init__(self, source: Iterable[ClickPoint], screen: ScreenSize, keep: bool = True) -> None:
+        self.points = PointStore()
+        self.xs = array("i")
+        self.ys = array("i")
+        self.screen = screen
+        self.keep = keep
+        self._source = iter(source)
+        self._base = 0
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def __len__(self) -> int:
+        """已读取的点数（不保留历史时也计入已丢弃的点）。"""
+        return self._base + len(self.xs)
+
+    def pixel(self, i: int) -> tuple[int, int]:
+        j = i - self._base
+        return self.xs[j], self.ys[j]
+
+    def steps(self) -> Iterator[int]:
+        """逐个读取坐标点并产出下标；越界时抛出 :class:`PlanError`。"""
+        for point in self._source:
+            i = len(self)
+            px, py = _resolve(i, point, self.screen)
+            if not self.keep and self.xs:
+                self.points.clear()
+                self.xs = array("i")
+                self.ys = array("i")
+                self._base = i
+            self.points.append(point)
+            self.xs.append(px)
+            self.ys.append(py)
+            yield i
+        self._done = True
+
+    def rescreen(self, screen: ScreenSize) -> None:
+        """按新的屏幕尺寸重新解析保留的点；之后读取的点也按新尺寸解析。"""
+        if self.keep:
+            compiled = compile_plan(self.points, screen)
+            self.xs = compiled.xs
+            self.ys = compiled.ys
+        else:
+            xs = array("i")
+            ys = array("i")
+            for j, point in enumerate(self.points):
+                px, py = _resolve(self._base + j, point, screen)
+                xs.append(px)
+                ys.append(py)
+            self.xs = xs
+            self.ys = ys
+        self.screen = screen
+
+    def close(self) -> None:
+        close = getattr(self._source, "close", None)
+        if close is not None:
+            close()
+
+
+def _resolve(i: int, point: ClickPoint, screen: ScreenSize) -> tuple[int, int]:
+    px, py = point.to_pixels(screen)
+    if not (0 <= px < screen.width and 0 <= py < screen.height):
+        raise PlanError.out_of_range(i, px, py, screen)
+    return px, py
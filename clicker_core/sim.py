@@ -0,0 +1,186 @@
+"""确定性仿真：虚拟时钟 + 记录型后端，远快于实时地跑完数小时的运行。
+
+:class:`Sequencer` 的时钟与后端、:func:`~clicker_core.engine.run_blocking` 的控制块
+与计时器都可注入，桌面端、命令行与安卓执行的正是这一套逻辑。把
+:class:`VirtualClock`、:class:`RecordingBackend` 与 :class:`VirtualControl` 交给它们，
+就能在不睡眠、不移动鼠标的情况下复现暂停、停止、改参数与屏幕变化等场景，结果
+逐位可复现。
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .backends import FailSafeError, InputBackend
+from .control import RunControl
+from .engine import Sequencer, run_blocking
+from .model import ScreenSize
+from .timing import PrecisionTimer
+
+
+class VirtualClock:
+    """手动推进的单调时钟（秒），可在指定时刻触发回调。
+
+    实例可直接作为 ``clock`` 传入（调用即返回当前时间）；:meth:`sleep` 符合
+    ``Waiter`` 约定，可交给 :class:`~clicker_core.timing.PrecisionTimer`。
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = float(start)
+        self._events: list[tuple[float, int, Callable[[], None]]] = []
+        self._seq = 0
+
+    def __call__(self) -> float:
+        return self._now
+
+    @property
+    def now(self) -> float:
+        return self._now
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> None:
+        """在虚拟时间到达 ``when`` 时调用 ``callback``；同一时刻按登记顺序。"""
+        self._seq += 1
+        heapq.heappush(self._events, (float(when), self._seq, callback))
+
+    def next_event(self) -> Optional[float]:
+        return self._events[0][0] if self._events else None
+
+    def skip(self, delta: float) -> None:
+        """推进 ``delta`` 秒但不触发回调；到期的回调留给下一次 :meth:`advance_to`。"""
+        self._now += max(0.0, float(delta))
+
+    def catch_up(self) -> bool:
+        """触发所有已到期（不晚于当前时间）的回调。"""
+        return self.advance_to(self._now)
+
+    def advance(self, delta: float) -> bool:
+        return self.advance_to(self._now + max(0.0, float(delta)))
+
+    def advance_to(self, when: float) -> bool:
+        """推进到 ``when``，途中依次触发到期回调；有回调触发时返回 True。"""
+        fired = False
+        events = self._events
+        while events and events[0][0] <= when:
+            at, _, callback = heapq.heappop(events)
+            self._now = max(self._now, at)
+            callback()
+            fired = True
+        self._now = max(self._now, float(when))
+        return fired
+
+    def sleep(self, timeout: float) -> bool:
+        """推进 ``timeout`` 秒；途中有回调触发时视为被打断，停在该回调时刻。"""
+        target = self._now + max(0.0, float(timeout))
+        nxt = self.next_event()
+        if nxt is not None and nxt <= target:
+            return self.advance_to(nxt)
+        self._now = target
+        return False
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedClick:
+    at: float
+    x: int
+    y: int
+
+
+class RecordingBackend(InputBackend):
+    """记录每次点击的虚拟时间与坐标，不产生任何真实输入。
+
+    ``click_cost`` 为每次点击消耗的虚拟秒数（模拟后端调用耗时）；
+    ``failsafe_after`` 为非负数时，第 N 次点击抛出 :class:`FailSafeError`。
+    """
+
+    name = "recording"
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        screen: ScreenSize = ScreenSize(1920, 1080),
+        click_cost: float = 0.0,
+        failsafe_after: int = -1,
+    ) -> None:
+        self.clock = clock
+        self.screen = screen
+        self.click_cost = max(0.0, float(click_cost))
+        self.failsafe_after = failsafe_after
+        self.clicks: list[RecordedClick] = []
+        self.closed = False
+
+    def screen_size(self) -> ScreenSize:
+        return self.screen
+
+    def set_screen(self, screen: ScreenSize) -> None:
+        self.screen = screen
+
+    def click(self, x: int, y: int) -> None:
+        if len(self.clicks) == self.failsafe_after:
+            raise FailSafeError("仿真：触发 FailSafe")
+        self.clicks.append(RecordedClick(self.clock(), int(x), int(y)))
+        if self.click_cost:
+            # 点击途中不触发回调：执行引擎不可重入，由驱动方在点击之后补发
+            self.clock.skip(self.click_cost)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class VirtualControl(RunControl):
+    """以虚拟时钟代替条件变量的 :class:`RunControl`。
+
+    等待即推进时钟，途中到期的 ``clock.call_at`` 回调（通常是 ``request_pause`` /
+    ``request_resume`` / ``request_stop``）在其时刻执行；每次查询状态前先补发已到期的
+    回调。暂停且不再有待触发的回调时视为停止，避免永远等待。
+    """
+
+    def __init__(self, clock: VirtualClock) -> None:
+        super().__init__(clock)
+        self._vclock = clock
+
+    @property
+    def paused(self) -> bool:
+        self._vclock.catch_up()
+        return self._paused
+
+    @property
+    def stopped(self) -> bool:
+        self._vclock.catch_up()
+        return self._stopped
+
+    def wait(self, timeout: float) -> bool:
+        if self.stopped or self.paused:
+            return True
+        self._vclock.sleep(timeout)
+        return self._stopped or self._paused
+
+    def wait_while_paused(self) -> float:
+        clock = self._vclock
+        started = clock()
+        while self._paused and not self._stopped:
+            nxt = clock.next_event()
+            if nxt is None:
+                self.request_stop()
+                break
+            clock.advance_to(nxt)
+        return clock() - started
+
+
+def run_virtual(
+    sequencer: Sequencer,
+    clock: VirtualClock,
+    until: Optional[float] = None,
+    control: Optional[VirtualControl] = None,
+) -> str:
+    """用 :func:`~clicker_core.engine.run_blocking` 在虚拟时间中驱动 ``sequencer``。
+
+    暂停、继续与停止应通过 ``control`` 的 ``request_*`` 方法（经 ``clock.call_at``
+    安排）发出，与真实的执行线程走同一条路径。给定 ``until`` 时到该时刻停止。
+    返回 :attr:`Sequencer.outcome`。
+    """
+    control = control or VirtualControl(clock)
+    if until is not None:
+        clock.call_at(until, control.request_stop)
+    return run_blocking(sequencer, control, PrecisionTimer(clock, spin_threshold=0.0))
@@ -0,0 +1,142 @@
+"""启动耗时剖析：分阶段计时 + 按模块统计导入耗时（``--profile-startup``）。"""
+
+from __future__ import annotations
+
+import importlib.abc
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from .timing import Clock
+
+
+@dataclass(slots=True)
+class ImportTiming:
+    """单个模块的导入耗时（秒）；``inclusive`` 含其间触发的子模块导入。"""
+
+    name: str
+    inclusive: float = 0.0
+    self_time: float = 0.0
+
+
+class _TimedLoader:
+    """包装真实 loader，只对 ``exec_module`` 计时，其余属性原样转发。"""
+
+    def __init__(self, loader: Any, profile: "StartupProfile") -> None:
+        self._loader = loader
+        self._profile = profile
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        profile = self._profile
+        if threading.get_ident() != profile._thread:
+            # 只统计安装钩子的线程；后台线程（如预热后端）的导入不计入报告
+            self._loader.exec_module(module)
+            return
+        profile._enter_import()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            profile._exit_import(module.__name__)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def __init__(self, profile: "StartupProfile") -> None:
+        self._profile = profile
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find = getattr(finder, "find_spec", None)
+            if find is None:
+                continue
+            spec = find(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self._profile)
+        return spec
+
+
+class StartupProfile:
+    """记录启动各阶段与各模块导入的耗时，结束时输出一份文本报告。
+
+    导入计时通过临时插入 ``sys.meta_path`` 的查找器实现，只在显式开启剖析时安装，
+    对正常启动没有任何开销；只统计安装钩子的线程中的导入。
+    """
+
+    def __init__(self, clock: Clock = time.perf_counter) -> None:
+        self._clock = clock
+        self._origin = clock()
+        self.phases: list[tuple[str, float, float]] = []
+        self.imports: dict[str, ImportTiming] = {}
+        self._stack: list[list[float]] = []
+        self._finder: Optional[_ImportTimer] = None
+        self._thread = threading.get_ident()
+
+    def install_import_hook(self) -> None:
+        """在当前线程开始统计导入耗时。"""
+        if self._finder is None:
+            self._thread = threading.get_ident()
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def remove_import_hook(self) -> None:
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = self._clock()
+        try:
+            yield
+        finally:
+            end = self._clock()
+            self.phases.append((name, start - self._origin, end - start))
+
+    def mark(self, name: str) -> None:
+        """记录一个时间点（相对剖析开始）。"""
+        self.phases.append((name, self._clock() - self._origin, 0.0))
+
+    def _enter_import(self) -> None:
+        # [开始时间, 子模块累计耗时]
+        self._stack.append([self._clock(), 0.0])
+
+    def _exit_import(self, name: str) -> None:
+        start, children = self._stack.pop()
+        inclusive = self._clock() - start
+        if self._stack:
+            self._stack[-1][1] += inclusive
+        timing = self.imports.get(name)
+        if timing is None:
+            timing = self.imports[name] = ImportTiming(name)
+        timing.inclusive += inclusive
+        timing.self_time += inclusive - children
+
+    def report(self, top: int = 15) -> str:
+        lines = ["启动阶段（ms）：", f"  {'开始':>9} {'耗时':>9}  阶段"]
+        for name, at, elapsed in self.phases:
+            lines.append(f"  {at * 1000:9.1f} {elapsed * 1000:9.1f}  {name}")
+        if self.imports:
+            total = sum(t.self_time for t in self.imports.values())
+            lines.append(f"模块导入（共 {len(self.imports)} 个，{total * 1000:.1f} ms；按自身耗时前 {top} 名）：")
+            lines.append(f"  {'自身':>9} {'含子模块':>9}  模块")
+            ranked = sorted(self.imports.values(), key=lambda t: t.self_time, reverse=True)[:top]
+            for t in ranked:
+                lines.append(f"  {t.self_time * 1000:9.1f} {t.inclusive * 1000:9.1f}  {t.name}")
+        return "\n".join(lines)
@@ -0,0 +1,327 @@
+"""增量读取 JSON 配置：边解析边产出坐标点，内存占用与文件大小无关。"""
+
+from __future__ import annotations
+
+import json
+import math
+import queue
+import threading
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, TextIO, TypeVar, Union
+
+from .model import (
+    AppConfig,
+    ClickPoint,
+    PointStore,
+    ScreenSize,
+    config_from_json_dict,
+    point_from_json,
+    screens_from_json,
+    settings_to_json,
+)
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+# 流式写出时每次拼接、写入的点数
+WRITE_CHUNK_POINTS = 4096
+# 单个 JSON 值（某个坐标点或 settings 对象）允许的最大字符数
+MAX_VALUE_CHARS = 8 << 20
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class ConfigStreamError(ValueError):
+    """配置文件不是合法的 JSON 对象，或结构不符合预期。"""
+
+
+class _ChunkReader:
+    """按块读取文本并用 ``raw_decode`` 逐个解析 JSON 值。
+
+    缓冲区只保留尚未消费的部分；单个值超过 :data:`MAX_VALUE_CHARS` 时报错，
+    避免损坏的文件被整体读入内存。
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int) -> None:
+        self._fp = fp
+        self._chunk_size = max(1, int(chunk_size))
+        self._buf = ""
+        self._pos = 0
+        self._consumed = 0
+        self._eof = False
+
+    @property
+    def offset(self) -> int:
+        return self._consumed + self._pos
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        data = self._fp.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        self._consumed += self._pos
+        self._buf = self._buf[self._pos :] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """跳过空白并返回下一个字符；文件结束时返回空串。"""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            n = len(buf)
+            while pos < n and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < n:
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        if self.peek() != ch:
+            raise ConfigStreamError(f"位置 {self.offset} 处应为 {ch!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if len(self._buf) - self._pos < MAX_VALUE_CHARS and self._fill():
+                    continue
+                raise ConfigStreamError(f"位置 {self.offset} 处解析失败：{exc.msg}") from exc
+            # 数字等值可能恰好被块边界截断，补读一块后重新解析
+            if end >= len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+class ConfigStream:
+    """逐步解析配置文件的顶层对象。
+
+    :meth:`points` 以生成器形式产出坐标点；``points`` 以外的键（version、settings、
+    meta 等）被完整解析后保存在 :attr:`header` 中。只有 version（v3 还有 screens）
+    位于 ``points`` 之前时才能边读边产出；否则先缓存整个坐标数组，读完整个对象后
+    再按正确的版本解释。
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._reader = _ChunkReader(fp, chunk_size)
+        self.header: dict[str, Any] = {}
+        self._started = False
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def points(self) -> Iterator[ClickPoint]:
+        if self._started:
+            raise ConfigStreamError("points() 只能迭代一次")
+        self._started = True
+
+        reader = self._reader
+        reader.expect("{")
+        if reader.peek() == "}":
+            reader.expect("}")
+            self._done = True
+            return
+
+        pending: Optional[list[Any]] = None
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise ConfigStreamError(f"位置 {reader.offset} 处应为字符串键")
+            reader.expect(":")
+            if key == "points" and reader.peek() == "[":
+                if self._header_ready():
+                    version = self._version()
+                    yield from self._iter_array(version, self._screens(version))
+                else:
+                    # version/screens 可能在 points 之后（如 sort_keys 写出的文件），先缓存原始值
+                    pending = list(self._iter_raw())
+            else:
+                self.header[key] = reader.value()
+
+            ch = reader.peek()
+            if ch == "}":
+                reader.expect("}")
+                break
+            reader.expect(",")
+
+        if pending is not None:
+            version = self._version()
+            screens = self._screens(version)
+            for raw in pending:
+                point = point_from_json(raw, version, screens)
+                if point is not None:
+                    yield point
+        self._done = True
+
+    def _header_ready(self) -> bool:
+        """``points`` 之前是否已读到解释坐标所需的 version（v3 还需 screens）。"""
+        if "version" not in self.header:
+            return False
+        return self._version() < 3 or "screens" in self.header
+
+    def _screens(self, version: int) -> list[Optional[ScreenSize]]:
+        return screens_from_json(self.header.get("screens")) if version >= 3 else []
+
+    def _version(self) -> int:
+        try:
+            return int(self.header.get("version", 1))
+        except (TypeError, ValueError):
+            return 1
+
+    def _iter_array(self, version: int, screens: list[Optional[ScreenSize]]) -> Iterator[ClickPoint]:
+        for raw in self._iter_raw():
+            point = point_from_json(raw, version, screens)
+            if point is not None:
+                yield point
+
+    def _iter_raw(self) -> Iterator[Any]:
+        reader = self._reader
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.expect("]")
+            return
+        while True:
+            yield reader.value()
+            if reader.peek() == "]":
+                reader.expect("]")
+                return
+            reader.expect(",")
+
+    def config(self, points: Optional[PointStore] = None) -> AppConfig:
+        """按已解析的头部生成 :class:`AppConfig`；应在 :meth:`points` 迭代完后调用。"""
+        base = config_from_json_dict(self.header)
+        return replace(base, points=points if points is not None else PointStore())
+
+
+def iter_points(path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[ClickPoint]:
+    """打开 ``path`` 并逐个产出坐标点；生成器关闭时文件随之关闭。"""
+    with open(path, "r", encoding="utf-8") as f:
+        yield from ConfigStream(f, chunk_size).points()
+
+
+def load_config_streaming(path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE) -> AppConfig:
+    """增量读取配置文件，坐标点直接写入 :class:`PointStore`，不构建中间 dict 树。"""
+    with open(path, "r", encoding="utf-8") as f:
+        stream = ConfigStream(f, chunk_size)
+        store = PointStore()
+        store.extend(stream.points())
+        return stream.config(store)
+
+
+def _num(v: float) -> str:
+    if v.is_integer() and -1e15 < v < 1e15:
+        return str(int(v))
+    return repr(v)
+
+
+def write_config_json(
+    fp: TextIO,
+    config: AppConfig,
+    screen: Optional[ScreenSize] = None,
+    chunk_points: int = WRITE_CHUNK_POINTS,
+) -> None:
+    """以 v3 格式流式写出配置。
+
+    不同的屏幕尺寸只在 ``screens`` 表中写一次，每个点写为
+    ``[x, y, 模式, 屏幕下标]`` 并独占一行；坐标点直接从 :class:`PointStore`
+    的列中按块格式化后写入 ``fp``，内存占用与点数无关。坐标含 NaN/inf 时在写出
+    任何内容之前抛出 :class:`ConfigStreamError`（JSON 无法表示非有限数）。
+    """
+    store = PointStore.from_points(config.points)
+    xs = store.xs
+    ys = store.ys
+    if not (all(map(math.isfinite, xs)) and all(map(math.isfinite, ys))):
+        i = next(i for i in range(len(store)) if not (math.isfinite(xs[i]) and math.isfinite(ys[i])))
+        raise ConfigStreamError(f"第 {i + 1} 个点坐标不是有限数值：({xs[i]},{ys[i]})")
+    fp.write('{\n  "version": 3,\n')
+    fp.write(f'  "settings": {json.dumps(settings_to_json(config), ensure_ascii=False)},\n')
+    if screen is not None:
+        meta = {"screen": {"w": int(screen.width), "h": int(screen.height)}}
+        fp.write(f'  "meta": {json.dumps(meta)},\n')
+    screens = [{"w": int(sc.width), "h": int(sc.height)} for sc in store.screens]
+    fp.write(f'  "screens": {json.dumps(screens)},\n')
+    fp.write('  "points": [')
+
+    modes = store.modes
+    sids = store.screen_ids
+    n = len(store)
+    chunk = max(1, int(chunk_points))
+    for start in range(0, n, chunk):
+        lines = [f"[{_num(xs[i])},{_num(ys[i])},{modes[i]},{sids[i]}]" for i in range(start, min(n, start + chunk))]
+        fp.write(("," if start else "") + "\n    " + ",\n    ".join(lines))
+    fp.write("\n  ]\n}\n" if n else "]\n}\n")
+
+
+_ITEMS = 0
+_END = 1
+_ERROR = 2
+
+
+def prefetch(iterable: Iterable[T], maxsize: int = 64, batch: int = 256) -> Iterator[T]:
+    """在后台线程中预先迭代 ``iterable``，经有界队列交给调用方。
+
+    第一个元素产出后立即交出，之后每次放入最多 ``batch`` 个元素，队列最多缓存
+    ``maxsize`` 批。生产方的异常
+    会在调用方重新抛出；调用方关闭生成器后生产方随之停止并关闭 ``iterable``。
+    """
+    q: queue.Queue[tuple[int, Any]] = queue.Queue(maxsize=max(1, int(maxsize)))
+    stop = threading.Event()
+    batch = max(1, int(batch))
+
+    def put(entry: tuple[int, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        it = iter(iterable)
+        try:
+            items: list[T] = []
+            # 第一个元素单独交出，调用方不必等满一批才能开始
+            limit = 1
+            for item in it:
+                items.append(item)
+                if len(items) >= limit:
+                    if not put((_ITEMS, items)):
+                        return
+                    items = []
+                    limit = batch
+            if items and not put((_ITEMS, items)):
+                return
+            put((_END, None))
+        except BaseException as exc:  # noqa: BLE001
+            put((_ERROR, exc))
+        finally:
+            close = getattr(it, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name="clicker-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, payload = q.get()
+            if kind == _ITEMS:
+                yield from payload
+            elif kind == _ERROR:
+                raise payload
+            else:
+                return
+    finally:
+        stop.set()
@@ -0,0 +1,155 @@
+"""逐次点击的时延遥测：预分配环形缓冲 + 全程直方图。"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+DEFAULT_CAPACITY = 4096
+# 全程直方图：0.05ms 一格，覆盖 0–200ms，超出部分计入最后一格
+_BIN_MS = 0.05
+_BINS = 4000
+
+
+@dataclass(frozen=True, slots=True)
+class Percentiles:
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class TelemetryStats:
+    """一组点击的统计；时延单位均为毫秒。
+
+    ``jitter`` 为实际发出时间相对计划时间的偏差，``latency`` 为后端调用耗时。
+    """
+
+    count: int = 0
+    cps: float = 0.0
+    jitter: Percentiles = Percentiles()
+    latency: Percentiles = Percentiles()
+    max_jitter: float = 0.0
+
+
+def _percentiles(sorted_ms: list[float]) -> Percentiles:
+    n = len(sorted_ms)
+    if n == 0:
+        return Percentiles()
+
+    def at(q: float) -> float:
+        return sorted_ms[min(n - 1, int(q * n))]
+
+    return Percentiles(p50=at(0.50), p95=at(0.95), p99=at(0.99))
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = array("q", bytes(8 * _BINS))
+        self.total = 0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        i = int(ms / _BIN_MS) if ms > 0.0 else 0
+        self.counts[i if i < _BINS else _BINS - 1] += 1
+        self.total += 1
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentiles(self) -> Percentiles:
+        if self.total == 0:
+            return Percentiles()
+        targets = [(0.50, "p50"), (0.95, "p95"), (0.99, "p99")]
+        found: dict[str, float] = {}
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if not c:
+                continue
+            seen += c
+            while targets and seen > targets[0][0] * self.total:
+                # 取所在格的上界，保守估计
+                found[targets.pop(0)[1]] = min((i + 1) * _BIN_MS, self.max_ms)
+            if not targets:
+                break
+        return Percentiles(**found)
+
+
+class ClickTelemetry:
+    """执行方逐次记录、界面方按需汇总的点击遥测。
+
+    最近 ``capacity`` 次点击的计划时间、后端调用开始/结束时间存于预分配的
+    ``array('d')`` 环形缓冲，记录时不分配内存；全程的偏差与耗时另计入定长直方图，
+    用于运行结束时的汇总。单一写者；读者与写者并发时最多读到一条不完整的样本。
+    """
+
+    __slots__ = ("_cap", "_scheduled", "_start", "_end", "_count", "_jitter_hist", "_latency_hist", "_first", "_last")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._cap = max(2, int(capacity))
+        zeros = bytes(8 * self._cap)
+        self._scheduled = array("d", zeros)
+        self._start = array("d", zeros)
+        self._end = array("d", zeros)
+        self._count = 0
+        self._jitter_hist = _Histogram()
+        self._latency_hist = _Histogram()
+        self._first: Optional[float] = None
+        self._last = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, scheduled: float, start: float, end: float) -> None:
+        """记录一次点击：``scheduled`` 计划时间，``start``/``end`` 后端调用起止（秒）。"""
+        i = self._count % self._cap
+        self._scheduled[i] = scheduled
+        self._start[i] = start
+        self._end[i] = end
+        self._jitter_hist.add((start - scheduled) * 1000.0)
+        self._latency_hist.add((end - start) * 1000.0)
+        if self._first is None:
+            self._first = start
+        self._last = start
+        self._count += 1
+
+    def window(self) -> TelemetryStats:
+        """最近 ``capacity`` 次点击的统计（用于实时面板）。"""
+        count = self._count
+        n = min(count, self._cap)
+        if n == 0:
+            return TelemetryStats()
+        head = count % self._cap
+        idx = range(n) if count <= self._cap else [(head + k) % self._cap for k in range(n)]
+        scheduled = self._scheduled
+        start = self._start
+        end = self._end
+        jitter = sorted((start[i] - scheduled[i]) * 1000.0 for i in idx)
+        latency = sorted((end[i] - start[i]) * 1000.0 for i in idx)
+        first = start[idx[0]]
+        last = start[idx[-1]]
+        cps = (n - 1) / (last - first) if n > 1 and last > first else 0.0
+        return TelemetryStats(
+            count=count,
+            cps=cps,
+            jitter=_percentiles(jitter),
+            latency=_percentiles(latency),
+            max_jitter=jitter[-1],
+        )
+
+    def summary(self) -> TelemetryStats:
+        """整次运行的统计（直方图近似，误差不超过 0.05ms）。"""
+        count = self._count
+        if count == 0 or self._first is None:
+            return TelemetryStats()
+        span = self._last - self._first
+        return TelemetryStats(
+            count=count,
+            cps=(count - 1) / span if count > 1 and span > 0 else 0.0,
+            jitter=self._jitter_hist.percentiles(),
+            latency=self._latency_hist.percentiles(),
+            max_jitter=self._jitter_hist.max_ms,
+        )
@@ -0,0 +1,187 @@
+"""高精度计时：单调时钟截止时间、粗睡眠+精自旋混合等待与绝对调度。"""
+
+from __future__ import annotations
+
+import atexit
+import sys
+import time
+from typing import Callable, Optional
+
+Clock = Callable[[], float]
+Waiter = Callable[[float], bool]
+
+
+# Windows 上是否已把系统定时器粒度调到 1ms；None 表示尚未尝试
+_win_period_set: Optional[bool] = None
+
+
+def _raise_win_timer_resolution() -> bool:
+    """调用 ``timeBeginPeriod(1)``（每进程一次，退出时恢复），成功时返回 True。"""
+    global _win_period_set
+    if _win_period_set is None:
+        _win_period_set = False
+        try:
+            import ctypes
+
+            winmm = ctypes.WinDLL("winmm")
+        except (ImportError, AttributeError, OSError):
+            return False
+        if winmm.timeBeginPeriod(1) == 0:  # TIMERR_NOERROR
+            atexit.register(winmm.timeEndPeriod, 1)
+            _win_period_set = True
+    return _win_period_set
+
+
+def default_spin_threshold() -> float:
+    """按平台返回“剩余多少秒时改为自旋”的阈值。
+
+    粗睡眠的唤醒误差取决于系统定时器粒度：Windows 3.11 起使用高精度可等待计时器；
+    3.11 之前默认约 15.6ms，因此首次调用时以 ``timeBeginPeriod(1)`` 把粒度调到 1ms，
+    只有调用失败时才退回 16ms 的自旋（占满一个核心）。macOS 与 Linux 通常在 1ms 以内。
+    """
+    if sys.platform.startswith("win"):
+        if sys.version_info >= (3, 11) or _raise_win_timer_resolution():
+            return 0.002
+        return 0.016
+    if sys.platform == "darwin":
+        return 0.0015
+    return 0.001
+
+
+def _plain_sleep(timeout: float) -> bool:
+    time.sleep(timeout)
+    return False
+
+
+class PrecisionTimer:
+    """基于单调时钟截止时间的混合等待。
+
+    先用可打断的粗睡眠等到截止前 ``spin_threshold`` 秒，再自旋到截止时间，
+    使唤醒误差落在亚毫秒级。
+    """
+
+    def __init__(self, clock: Clock = time.perf_counter, spin_threshold: Optional[float] = None) -> None:
+        self._clock = clock
+        self._spin = default_spin_threshold() if spin_threshold is None else max(0.0, float(spin_threshold))
+
+    @property
+    def spin_threshold(self) -> float:
+        return self._spin
+
+    def now(self) -> float:
+        return self._clock()
+
+    def wait_until(self, deadline: float, waiter: Optional[Waiter] = None) -> bool:
+        """等待到 ``deadline``。
+
+        ``waiter(timeout)`` 负责粗睡眠，返回 True 表示被打断；此时立即返回 False。
+        到达截止时间返回 True。
+        """
+        clock = self._clock
+        spin = self._spin
+        wait = waiter or _plain_sleep
+        while True:
+            remaining = deadline - clock()
+            if remaining <= 0.0:
+                return True
+            if remaining <= spin:
+                break
+            if wait(remaining - spin):
+                return False
+        while clock() < deadline:
+            pass
+        return True
+
+
+class Schedule:
+    """绝对时间调度：第 N 次触发时间为 ``t0 + 各间隔之和``，误差不会累积。
+
+    当落后超过 ``max_lag`` 秒（例如系统休眠、点击调用卡顿）时重新对齐到当前时间，
+    避免恢复后连续补发积压的点击。
+    """
+
+    def __init__(self, start: float, max_lag: float = 1.0) -> None:
+        self._next = float(start)
+        self._max_lag = max(0.0, float(max_lag))
+
+    @property
+    def deadline(self) -> float:
+        return self._next
+
+    def advance(self, delay: float, now: float) -> float:
+        self._next += max(0.0, float(delay))
+        if now - self._next > self._max_lag:
+            self._next = now
+        return self._next
+
+    def shift(self, delta: float) -> None:
+        """整体平移后续截止时间（用于扣除暂停时长）。"""
+        self._next += max(0.0, float(delta))
+
+    def reset(self, now: float) -> None:
+        """以 ``now`` 作为新的基准时间。"""
+        self._next = float(now)
+
+
+class TokenBucket:
+    """令牌桶限速器。
+
+    以 ``rate`` 个/秒补充令牌，最多积累 ``capacity`` 个。``reserve`` 立即扣除一个
+    令牌并返回该令牌可用的时间点，调用方等待到该时间点再执行即可。
+    """
+
+    def __init__(self, rate: float, now: float, capacity: float = 1.0) -> None:
+        self._rate = max(1e-9, float(rate))
+        self._capacity = max(1.0, float(capacity))
+        self._tokens = self._capacity
+        self._last = float(now)
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def set_rate(self, rate: float) -> None:
+        self._rate = max(1e-9, float(rate))
+
+    def reserve(self, now: float) -> float:
+        elapsed = now - self._last
+        if elapsed > 0.0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._last = now
+        self._tokens -= 1.0
+        if self._tokens >= 0.0:
+            return now
+        return now + (-self._tokens) / self._rate
+
+    def reset(self, now: float) -> None:
+        """从 ``now`` 重新计时，丢弃已积累的令牌与欠账（用于暂停恢复后）。"""
+        self._tokens = 0.0
+        self._last = float(now)
+
+
+class RateMeter:
+    """滑动窗口内的实际速率（次/秒）。"""
+
+    def __init__(self, window: float = 1.0) -> None:
+        self._window = max(1e-3, float(window))
+        self._count = 0
+        self._started: Optional[float] = None
+        self._rate = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def tick(self, now: float) -> bool:
+        """记录一次事件；窗口结束时更新速率并返回 True。"""
+        if self._started is None:
+            self._started = now
+            return False
+        self._count += 1
+        elapsed = now - self._started
+        if elapsed < self._window:
+            return False
+        self._rate = self._count / elapsed
+        self._count = 0
+        self._started = now
+        return True
@@ -0,0 +1,117 @@
+"""运行轨迹导出：Chrome ``trace_event`` JSON（chrome://tracing、Perfetto 均可直接打开）。"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Union
+
+from .persist import atomic_write
+
+PathLike = Union[str, Path]
+
+DEFAULT_MAX_EVENTS = 2_000_000
+TRACE_SUFFIX = ".json"
+
+# 事件种类：区间（ph=X）与瞬时事件（ph=i）
+_SPAN = 0
+_INSTANT = 1
+
+
+class TraceRecorder:
+    """单线程追加的事件记录器。
+
+    事件按列追加到 ``array``（种类、名称编号、起点、时长、步号），每条约 23 字节，
+    十分钟千次/秒的运行也只占几十 MB；超过 ``max_events`` 后丢弃并计数。时间参数与
+    ``origin`` 同为单调时钟秒数，导出时换算成相对 ``origin`` 的微秒。
+    """
+
+    __slots__ = ("origin", "max_events", "dropped", "_names", "_name_ids", "_kind", "_name", "_ts", "_dur", "_step", "_args")
+
+    def __init__(self, origin: float = 0.0, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        self.origin = float(origin)
+        self.max_events = max(0, int(max_events))
+        self.dropped = 0
+        self._names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self._kind = array("B")
+        self._name = array("H")
+        self._ts = array("d")
+        self._dur = array("d")
+        self._step = array("i")
+        self._args: dict[int, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._kind)
+
+    def span(self, name: str, start: float, end: float, step: int = -1) -> None:
+        """记录区间 ``[start, end]``；``step`` 为坐标点序号（-1 表示无）。"""
+        self._append(_SPAN, name, start, max(0.0, end - start), step, None)
+
+    def instant(self, name: str, at: float, **args: Any) -> None:
+        self._append(_INSTANT, name, at, 0.0, -1, args or None)
+
+    def _append(self, kind: int, name: str, ts: float, dur: float, step: int, args: Optional[dict[str, Any]]) -> None:
+        if len(self._kind) >= self.max_events:
+            self.dropped += 1
+            return
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._name_ids[name] = name_id
+        if args is not None:
+            self._args[len(self._kind)] = args
+        self._kind.append(kind)
+        self._name.append(name_id)
+        self._ts.append(ts)
+        self._dur.append(dur)
+        self._step.append(step)
+
+    def events(self, pid: int = 1, tid: int = 1) -> Iterator[dict[str, Any]]:
+        """逐条产出 trace_event 字典（时间单位微秒）。"""
+        origin = self.origin
+        names = self._names
+        for i in range(len(self._kind)):
+            event: dict[str, Any] = {
+                "name": names[self._name[i]],
+                "cat": "run",
+                "ts": round((self._ts[i] - origin) * 1e6, 3),
+                "pid": pid,
+                "tid": tid,
+            }
+            if self._kind[i] == _SPAN:
+                event["ph"] = "X"
+                event["dur"] = round(self._dur[i] * 1e6, 3)
+            else:
+                event["ph"] = "i"
+                event["s"] = "t"
+            args = self._args.get(i)
+            step = self._step[i]
+            if step >= 0:
+                args = dict(args or {}, step=step)
+            if args:
+                event["args"] = args
+            yield event
+
+    def write(self, fp: IO[str], metadata: Optional[dict[str, Any]] = None) -> None:
+        """以 JSON 对象格式写出，每行一个事件，不在内存中拼整份文本。"""
+        fp.write('{"displayTimeUnit":"ms",')
+        other = dict(metadata or {})
+        if self.dropped:
+            other["dropped_events"] = self.dropped
+        fp.write('"otherData":')
+        fp.write(json.dumps(other, ensure_ascii=False, sort_keys=True, default=str))
+        fp.write(',"traceEvents":[\n')
+        thread_name = {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "clicker-worker"}}
+        fp.write(json.dumps(thread_name, ensure_ascii=False))
+        for event in self.events():
+            fp.write(",\n")
+            fp.write(json.dumps(event, ensure_ascii=False, separators=(",", ":")))
+        fp.write("\n]}\n")
+
+
+def save_trace(path: PathLike, recorder: TraceRecorder, metadata: Optional[dict[str, Any]] = None) -> None:
+    """原子写出轨迹文件。"""
+    atomic_write(path, lambda f: recorder.write(f, metadata))
@@ -24,6 +24,7 @@ setup(
     description="基于PyQt6的跨平台桌面端顺序连点器",
     packages=find_packages(),
     install_requires=_read_requirements(),
+    extras_require={"fast": ["numpy>=1.22"]},
     python_requires=">=3.10",
     entry_points={"console_scripts": ["sequential-clicker=clicker.main:main"]},
 )
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from clicker_core.asyncrun import AsyncRunner
+from clicker_core.control import ParamBlock, RunParams
+from clicker_core.engine import COMPLETED, FAILSAFE, STOPPED, RunPlan, SequencerObserver
+from clicker_core.model import ClickPoint, LoopSettings, PointStore, ScreenSize
+from clicker_core.sim import RecordingBackend, VirtualClock
+
+
+def _backend(failsafe_after: int = -1) -> RecordingBackend:
+    # 序列使用事件循环时钟；记录的点击时间不参与断言
+    return RecordingBackend(VirtualClock(), ScreenSize(1000, 1000), failsafe_after=failsafe_after)
+
+
+def _plan(x: int, loops: int = 1, infinite: bool = False) -> RunPlan:
+    points = PointStore.from_points([ClickPoint("abs", x, 0), ClickPoint("abs", x, 1)])
+    return RunPlan(points=points, loop=LoopSettings(enabled=True, count=loops, infinite=infinite))
+
+
+def _params(interval_ms: int) -> ParamBlock:
+    return ParamBlock(RunParams(interval_ms=interval_ms, loop_interval_ms=0))
+
+
+class AsyncRunnerTests(unittest.TestCase):
+    def test_sequences_run_concurrently_on_one_loop(self) -> None:
+        async def scenario() -> tuple[list[str], RecordingBackend, float]:
+            backend = _backend()
+            runner = AsyncRunner(backend)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for x in range(12):
+                runner.start(_plan(x, loops=3), _params(5))
+            outcomes = await runner.join()
+            return outcomes, backend, loop.time() - start
+
+        outcomes, backend, elapsed = asyncio.run(scenario())
+        self.assertEqual(outcomes, [COMPLETED] * 12)
+        self.assertEqual(len(backend.clicks), 12 * 6)
+        # 各序列交错执行：总耗时约为单个序列的耗时，而非 12 倍
+        self.assertLess(elapsed, 0.5)
+        for x in range(12):
+            self.assertEqual([(c.x, c.y) for c in backend.clicks if c.x == x], [(x, 0), (x, 1)] * 3)
+
+    def test_pause_resume_and_stop_per_sequence(self) -> None:
+        async def scenario() -> tuple[list[str], int, int]:
+            backend = _backend()
+            runner = AsyncRunner(backend)
+            a = runner.start(_plan(1, infinite=True), _params(2), name="a")
+            b = runner.start(_plan(2, infinite=True), _params(2), name="b")
+            await asyncio.sleep(0.02)
+            a.pause()
+            paused_at = a.summary().clicks
+            await asyncio.sleep(0.02)
+            still = a.summary().clicks
+            a.resume()
+            await asyncio.sleep(0.01)
+            b.stop()
+            a.stop()
+            outcomes = [await a.done, await b.done]
+            self.assertGreater(a.summary().clicks, still)
+            self.assertEqual(runner.handles, [])
+            return outcomes, paused_at, still
+
+        outcomes, paused_at, still = asyncio.run(scenario())
+        self.assertEqual(outcomes, [STOPPED, STOPPED])
+        self.assertEqual(paused_at, still)
+
+    def test_never_clicks_early_or_wakes_without_clicking(self) -> None:
+        class _Early(SequencerObserver):
+            def __init__(self) -> None:
+                self.early = 0
+
+            def on_click(self, index: int, scheduled: float, sent: float, done: float) -> None:
+                self.early += sent < scheduled
+
+        class _CountingRunner(AsyncRunner):
+            wakes = 0
+
+            def _due(self, handle) -> None:  # type: ignore[no-untyped-def]
+                self.wakes += 1
+                super()._due(handle)
+
+        async def scenario() -> tuple[_CountingRunner, _Early, RecordingBackend]:
+            backend = _backend()
+            runner = _CountingRunner(backend)
+            # 模拟 Windows 上粗糙的单调时钟分辨率
+            runner._resolution = 0.016
+            observer = _Early()
+            runner.start(_plan(1, loops=5), _params(3), observer)
+            await runner.join()
+            return runner, observer, backend
+
+        runner, observer, backend = asyncio.run(scenario())
+        self.assertEqual(observer.early, 0)
+        self.assertEqual(len(backend.clicks), 10)
+        # 每次点击一次唤醒，另有每轮之间的一次轮间隔唤醒
+        self.assertLessEqual(runner.wakes, 10 + 5)
+
+    def test_failsafe_stops_every_sequence(self) -> None:
+        async def scenario() -> list[str]:
+            runner = AsyncRunner(_backend(failsafe_after=5))
+            runner.start(_plan(1, infinite=True), _params(1))
+            runner.start(_plan(2, infinite=True), _params(10))
+            return await runner.join()
+
+        # 第 6 次点击触发 FailSafe：无论落在哪个序列，另一个都随之停止
+        self.assertEqual(sorted(asyncio.run(scenario())), sorted([STOPPED, FAILSAFE]))
+
+
+if __name__ == "__main__":
+    unittest.main()
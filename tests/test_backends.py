@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import unittest
+
+from clicker_core import backends
+from clicker_core.backends import BackendUnavailable, InputBackend, load_backend, register_backend
+from clicker_core.model import ScreenSize
+
+
+class _NullBackend(InputBackend):
+    name = "null"
+
+    def screen_size(self) -> ScreenSize:
+        return ScreenSize(width=10, height=10)
+
+    def click(self, x: int, y: int) -> None:
+        pass
+
+
+def _unavailable() -> InputBackend:
+    raise BackendUnavailable("nope")
+
+
+class BackendRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._saved = dict(backends._REGISTRY)
+        backends._REGISTRY.clear()
+
+    def tearDown(self) -> None:
+        backends._REGISTRY.clear()
+        backends._REGISTRY.update(self._saved)
+
+    def test_auto_selects_first_available_by_priority(self) -> None:
+        register_backend("broken", f"{__name__}:_unavailable", priority=1)
+        register_backend("null", f"{__name__}:_NullBackend", priority=5)
+        self.assertEqual(backends.backend_names(), ["broken", "null"])
+        self.assertEqual(load_backend().name, "null")
+
+    def test_unknown_or_missing_module_is_unavailable(self) -> None:
+        register_backend("ghost", "clicker_core.no_such_module:Backend")
+        with self.assertRaises(BackendUnavailable):
+            load_backend("ghost")
+        with self.assertRaises(BackendUnavailable):
+            load_backend("missing")
+
+    def test_interface_is_abstract(self) -> None:
+        class _Partial(InputBackend):
+            def click(self, x: int, y: int) -> None:
+                pass
+
+        with self.assertRaises(TypeError):
+            _Partial()  # type: ignore[abstract]
+
+    def test_builtin_backends_are_registered(self) -> None:
+        self.assertIn("pyautogui", self._saved)
+        self.assertIn("xtest", self._saved)
+
+
+if __name__ == "__main__":
+    unittest.main()
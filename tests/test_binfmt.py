@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+
+from clicker_core.binfmt import ClkbError, clkb_to_json, is_clkb, json_to_clkb, load_clkb, save_clkb
+from clicker_core.model import (
+    AppConfig,
+    ClickPoint,
+    LoopSettings,
+    ScreenSize,
+    config_from_json_dict,
+    config_to_json_dict_v2,
+)
+from clicker_core.plan import PlanError, compile_plan
+
+
+class ClkbTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        screen = ScreenSize(width=1920, height=1080)
+        points = [ClickPoint.from_abs(i, i + 1, screen) for i in range(100)]
+        points.append(ClickPoint.from_ratio(0.25, 0.5))
+        self.config = AppConfig(points=points, interval_ms=250, loop=LoopSettings(enabled=True, count=3))
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._tmp.name, name)
+
+    def test_roundtrip_is_mapped_and_copy_on_write(self) -> None:
+        path = self._path("a.clkb")
+        save_clkb(path, self.config, ScreenSize(800, 600))
+        self.assertTrue(is_clkb(path))
+
+        loaded = load_clkb(path, use_mmap=True)
+        self.assertEqual(list(loaded.points), list(self.config.points))
+        self.assertEqual(loaded.interval_ms, 250)
+        self.assertEqual(loaded.loop, self.config.loop)
+        self.assertIsInstance(loaded.points.xs, memoryview)
+
+        loaded.points[0] = ClickPoint.from_abs(7, 7)
+        self.assertEqual(loaded.points[0], ClickPoint.from_abs(7, 7))
+        self.assertEqual(load_clkb(path).points[0], self.config.points[0])
+
+    def test_json_conversion_roundtrip(self) -> None:
+        src = self._path("a.json")
+        with open(src, "w", encoding="utf-8") as f:
+            json.dump(config_to_json_dict_v2(self.config, ScreenSize(800, 600)), f)
+        json_to_clkb(src, self._path("b.clkb"))
+        clkb_to_json(self._path("b.clkb"), self._path("c.json"))
+        with open(self._path("c.json"), encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(list(config_from_json_dict(data).points), list(self.config.points))
+        self.assertEqual(data["meta"]["screen"], {"w": 800, "h": 600})
+
+    def test_rejects_truncated_file(self) -> None:
+        path = self._path("t.clkb")
+        save_clkb(path, self.config)
+        with open(path, "rb") as f:
+            raw = f.read()
+        with open(path, "wb") as f:
+            f.write(raw[:-10])
+        with self.assertRaises(ClkbError):
+            load_clkb(path)
+
+    def test_small_file_is_read_into_memory(self) -> None:
+        path = self._path("s.clkb")
+        save_clkb(path, self.config)
+        loaded = load_clkb(path)
+        # 未映射时文件可立即被替换（Windows 上映射中的文件不行）
+        os.replace(self._path("s.clkb"), self._path("moved.clkb"))
+        self.assertEqual(list(loaded.points), list(self.config.points))
+
+    def test_rejects_corrupt_modes_and_screen_ids(self) -> None:
+        path = self._path("c.clkb")
+        save_clkb(path, self.config)
+        with open(path, "rb") as f:
+            raw = bytearray(f.read())
+        n = len(self.config.points)
+
+        bad_mode = bytearray(raw)
+        bad_mode[-1] = 7
+        ids_start = len(raw) - n - 4 * n
+        bad_screen = bytearray(raw)
+        bad_screen[ids_start : ids_start + 4] = (5).to_bytes(4, "little", signed=True)
+        for data, index in ((bad_mode, n - 1), (bad_screen, 0)):
+            with open(path, "wb") as f:
+                f.write(data)
+            with self.assertRaises(ClkbError):
+                load_clkb(path, use_mmap=False)
+
+            # 映射路径不逐点扫描：打开成功，取到损坏的点或编译计划时才报错
+            mapped = load_clkb(path, use_mmap=True)
+            with self.assertRaises(ValueError):
+                mapped.points[index]
+            with self.assertRaises(PlanError) as ctx:
+                compile_plan(mapped.points, ScreenSize(1920, 1080))
+            self.assertEqual(ctx.exception.index, index)
+            del mapped
+
+
+if __name__ == "__main__":
+    unittest.main()
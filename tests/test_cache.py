@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+from clicker_core.cache import ConfigCache
+from clicker_core.configio import load_config_file, save_config_file
+from clicker_core.model import AppConfig, ClickPoint
+
+
+class ConfigCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        self.loads: list[str] = []
+
+    def _write(self, name: str, n: int) -> str:
+        path = os.path.join(self._tmp.name, name)
+        save_config_file(path, AppConfig(points=[ClickPoint.from_abs(i, i) for i in range(n)]))
+        return path
+
+    def _loader(self, path: str) -> AppConfig:
+        self.loads.append(path)
+        return load_config_file(path)
+
+    def test_hit_until_file_changes(self) -> None:
+        cache = ConfigCache(loader=self._loader)
+        path = self._write("a.json", 3)
+        first = cache.get(path)
+        second = cache.get(path)
+        self.assertEqual(list(first.points), list(second.points))
+        self.assertEqual((cache.hits, len(self.loads)), (1, 1))
+
+        self._write("a.json", 4)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(len(cache.get(path).points), 4)
+        self.assertEqual(len(self.loads), 2)
+
+    def test_budget_evicts_lru_but_keeps_pinned(self) -> None:
+        a, b, c = (self._write(f"{n}.json", 1000) for n in "abc")
+        cache = ConfigCache(budget_bytes=50_000, loader=self._loader)
+        cache.pin(a)
+        for path in (a, b, c):
+            cache.get(path)
+        self.assertLessEqual(len(cache), 2)
+        cache.get(a)
+        self.assertEqual(self.loads.count(a), 1)
+        cache.get(b)
+        self.assertEqual(self.loads.count(b), 2)
+
+    def test_persisted_binary_copy_is_reused(self) -> None:
+        path = self._write("a.json", 5)
+        persist = os.path.join(self._tmp.name, "cache")
+        cache = ConfigCache(persist_dir=persist, loader=self._loader)
+        cache.get(path)
+        cache.close()
+
+        fresh = ConfigCache(persist_dir=persist, loader=self._loader)
+        self.assertEqual(len(fresh.get(path).points), 5)
+        self.assertEqual(len(self.loads), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from clicker.cli import EXIT_BACKEND, EXIT_CONFIG, EXIT_FAILSAFE, EXIT_RUN_ERROR, main, run_config
+from clicker_core.control import RunControl
+from clicker_core.model import AppConfig, BurstSettings, ClickPoint, LoopSettings, ScreenSize
+from clicker_core.sim import RecordingBackend, VirtualClock
+
+
+def _config(**kwargs) -> AppConfig:
+    points = [ClickPoint("abs", 1, 2), ClickPoint("abs", 3, 4)]
+    return AppConfig(points=points, interval_ms=0, **kwargs)
+
+
+class RunConfigTests(unittest.TestCase):
+    def test_runs_requested_loops(self) -> None:
+        backend = RecordingBackend(VirtualClock())
+        result = run_config(_config(loop=LoopSettings(enabled=True, count=3)), backend, RunControl())
+        self.assertEqual((result.status, result.exit_code, result.clicks, result.cycles), ("completed", 0, 6, 3))
+        self.assertEqual([(c.x, c.y) for c in backend.clicks[:2]], [(1, 2), (3, 4)])
+
+    def test_burst_mode_and_failsafe(self) -> None:
+        backend = RecordingBackend(VirtualClock(), failsafe_after=3)
+        config = _config(loop=LoopSettings(enabled=True, infinite=True), burst=BurstSettings(enabled=True, cps=1000))
+        result = run_config(config, backend, RunControl())
+        self.assertEqual((result.status, result.exit_code, result.clicks), ("failsafe", EXIT_FAILSAFE, 3))
+
+    def test_error_statuses_and_exit_codes(self) -> None:
+        no_display = RecordingBackend(VirtualClock())
+        broken = RecordingBackend(VirtualClock())
+        cases = [
+            (no_display, EXIT_BACKEND),
+            (RecordingBackend(VirtualClock(), ScreenSize(2, 2)), EXIT_CONFIG),
+            (broken, EXIT_RUN_ERROR),
+        ]
+        with (
+            mock.patch.object(no_display, "screen_size", side_effect=OSError("no display")),
+            mock.patch.object(broken, "click", side_effect=RuntimeError("x")),
+        ):
+            for backend, code in cases:
+                result = run_config(_config(), backend, RunControl())
+                self.assertEqual((result.status, result.exit_code), ("error", code))
+                self.assertTrue(result.message)
+
+    def test_stop_before_start(self) -> None:
+        control = RunControl()
+        control.request_stop()
+        result = run_config(_config(), RecordingBackend(VirtualClock()), control)
+        self.assertEqual((result.status, result.clicks), ("stopped", 0))
+
+
+class CliMainTests(unittest.TestCase):
+    def test_missing_config_reports_json(self) -> None:
+        path = os.path.join(tempfile.gettempdir(), "clicker-cli-missing.json")
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(["run", path, "--json"])
+        self.assertEqual(code, EXIT_CONFIG)
+        self.assertEqual(json.loads(out.getvalue())["status"], "error")
+
+    def test_invalid_coordinates_exit_with_config_code(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bad.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"version":2,"points":[{"mode":"abs","x":NaN,"y":1}]}')
+            out = io.StringIO()
+            with redirect_stdout(out), mock.patch("clicker.cli.load_backend", return_value=RecordingBackend(VirtualClock())):
+                code = main(["run", path, "--json"])
+        payload = json.loads(out.getvalue())
+        self.assertEqual((code, payload["status"]), (EXIT_CONFIG, "error"))
+
+    def test_does_not_import_qt(self) -> None:
+        code = "import sys, clicker.main, clicker.cli; print(any(m.startswith('PyQt6') for m in sys.modules))"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from clicker_core.control import ParamBlock, ProgressBlock, RunControl, RunParams
+
+
+class RunControlTests(unittest.TestCase):
+    def test_wait_times_out_when_untouched(self) -> None:
+        control = RunControl()
+        self.assertFalse(control.wait(0.01))
+
+    def test_stop_wakes_waiter_immediately(self) -> None:
+        control = RunControl()
+        woke: list[float] = []
+
+        def sleeper() -> None:
+            started = time.perf_counter()
+            control.wait(10.0)
+            woke.append(time.perf_counter() - started)
+
+        t = threading.Thread(target=sleeper)
+        t.start()
+        time.sleep(0.02)
+        control.request_stop()
+        t.join(2.0)
+        self.assertFalse(t.is_alive())
+        self.assertLess(woke[0], 1.0)
+        control.acknowledge_stop()
+        self.assertIsNotNone(control.stop_latency)
+        self.assertLess(control.stop_latency or 0.0, 1.0)
+
+    def test_pause_then_resume(self) -> None:
+        control = RunControl()
+        control.request_pause()
+        self.assertTrue(control.wait(10.0))
+        threading.Timer(0.02, control.request_resume).start()
+        paused = control.wait_while_paused()
+        self.assertGreater(paused, 0.0)
+        self.assertFalse(control.paused)
+
+    def test_stop_releases_pause(self) -> None:
+        control = RunControl()
+        control.request_pause()
+        threading.Timer(0.02, control.request_stop).start()
+        control.wait_while_paused()
+        self.assertTrue(control.stopped)
+        self.assertFalse(control.paused)
+
+
+class ProgressBlockTests(unittest.TestCase):
+    def test_snapshot_version_changes_only_on_write(self) -> None:
+        block = ProgressBlock()
+        first = block.snapshot()
+        self.assertEqual(block.snapshot().version, first.version)
+        block.set_cycle(1, 0)
+        block.set_step(3, 10)
+        snap = block.snapshot()
+        self.assertNotEqual(snap.version, first.version)
+        self.assertEqual((snap.step, snap.total, snap.cycle, snap.cycles_total), (3, 10, 1, 0))
+
+    def test_concurrent_writer_yields_consistent_snapshots(self) -> None:
+        block = ProgressBlock()
+        done = threading.Event()
+
+        def writer() -> None:
+            for i in range(1, 20001):
+                block.set_step(i, i)
+            done.set()
+
+        t = threading.Thread(target=writer)
+        t.start()
+        while not done.is_set():
+            snap = block.snapshot()
+            self.assertEqual(snap.step, snap.total)
+        t.join()
+
+
+class ParamBlockTests(unittest.TestCase):
+    def test_publish_replaces_snapshot(self) -> None:
+        block = ParamBlock()
+        before = block.current
+        block.publish(RunParams(interval_ms=120, loop_interval_ms=5, burst_cps=300))
+        self.assertEqual(before.interval_ms, 500)
+        self.assertEqual(block.current.interval_ms, 120)
+        self.assertEqual(block.current.burst_cps, 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
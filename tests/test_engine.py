@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import unittest
+
+from clicker_core.control import ParamBlock, RunControl, RunParams
+from clicker_core.engine import (
+    COMPLETED,
+    FAILSAFE,
+    PLAN_ERROR,
+    STOPPED,
+    RunPlan,
+    Sequencer,
+    SequencerObserver,
+    run_blocking,
+)
+from clicker_core.model import BurstSettings, ClickPoint, LoopSettings, PointStore, ScreenSize
+from clicker_core.sim import RecordingBackend, VirtualClock
+
+SCREEN = ScreenSize(200, 100)
+
+
+class _Events(SequencerObserver):
+    def __init__(self) -> None:
+        self.cycles: list[tuple[int, int]] = []
+        self.pauses: list[tuple[float, float]] = []
+        self.errors: list[str] = []
+
+    def on_cycle(self, cycle: int, cycles_total: int) -> None:
+        self.cycles.append((cycle, cycles_total))
+
+    def on_pause(self, start: float, end: float) -> None:
+        self.pauses.append((start, end))
+
+    def on_error(self, message: str, at: float) -> None:
+        self.errors.append(message)
+
+
+def _plan(loop: LoopSettings = LoopSettings(), burst: BurstSettings = BurstSettings(), rel: bool = False) -> RunPlan:
+    mode = "ratio" if rel else "abs"
+    if rel:
+        points = [ClickPoint(mode, 0.5, 0.5), ClickPoint(mode, 0.25, 0.25)]
+    else:
+        points = [ClickPoint(mode, 10, 20), ClickPoint(mode, 30, 40)]
+    return RunPlan(points=PointStore.from_points(points), loop=loop, burst=burst)
+
+
+def _xy(backend: RecordingBackend) -> list[tuple[int, int]]:
+    return [(c.x, c.y) for c in backend.clicks]
+
+
+def _params(interval_ms: int = 100, loop_interval_ms: int = 0, burst_cps: int = 100) -> ParamBlock:
+    return ParamBlock(RunParams(interval_ms=interval_ms, loop_interval_ms=loop_interval_ms, burst_cps=burst_cps))
+
+
+class SequencerTests(unittest.TestCase):
+    def test_steps_follow_interval_and_loop_interval(self) -> None:
+        clock = VirtualClock()
+        backend = RecordingBackend(clock, SCREEN)
+        events = _Events()
+        seq = Sequencer(_plan(LoopSettings(enabled=True, count=2)), backend, _params(100, 500), events, clock)
+
+        wakes = []
+        deadline = seq.start()
+        while deadline is not None:
+            clock.advance_to(deadline)
+            wakes.append(round(deadline, 6))
+            deadline = seq.step()
+
+        self.assertEqual(seq.outcome, COMPLETED)
+        self.assertEqual(_xy(backend), [(10, 20), (30, 40)] * 2)
+        self.assertEqual(events.cycles, [(1, 2), (2, 2)])
+        # 点击 0、0.1；第二个点之后再等一个间隔 + 轮间隔 0.5 → 0.7 开始第二轮
+        self.assertEqual(wakes, [0.0, 0.1, 0.7, 0.7, 0.8])
+        self.assertEqual((seq.summary().clicks, seq.summary().cycles), (4, 2))
+
+    def test_step_before_due_does_not_click(self) -> None:
+        clock = VirtualClock()
+        backend = RecordingBackend(clock, SCREEN)
+        seq = Sequencer(_plan(), backend, _params(100), clock=clock)
+        seq.start()
+        seq.step()
+        clock.advance_to(0.05)
+        self.assertAlmostEqual(seq.step(), 0.1)
+        self.assertEqual(len(backend.clicks), 1)
+
+    def test_pause_shifts_schedule(self) -> None:
+        clock = VirtualClock()
+        events = _Events()
+        seq = Sequencer(_plan(), RecordingBackend(clock, SCREEN), _params(100), events, clock)
+        seq.start()
+        seq.step()
+        clock.advance_to(0.05)
+        seq.pause()
+        self.assertIsNone(seq.step())
+        clock.advance_to(1.05)
+        seq.resume()
+        self.assertAlmostEqual(seq.next_wake(), 1.1)
+        self.assertEqual(events.pauses, [(0.05, 1.05)])
+
+    def test_screen_change_recompiles_relative_points(self) -> None:
+        clock = VirtualClock()
+        backend = RecordingBackend(clock, SCREEN)
+        seq = Sequencer(_plan(rel=True), backend, _params(0), clock=clock)
+        seq.start()
+        seq.step()
+        backend.set_screen(ScreenSize(400, 200))
+        seq.notify_screen_changed()
+        seq.step()
+        self.assertEqual(_xy(backend), [(100, 50), (100, 50)])
+
+    def test_burst_uses_token_bucket(self) -> None:
+        clock = VirtualClock()
+        backend = RecordingBackend(clock, SCREEN)
+        plan = _plan(LoopSettings(enabled=True, infinite=True), BurstSettings(enabled=True))
+        seq = Sequencer(plan, backend, _params(burst_cps=50), clock=clock)
+        deadline = seq.start()
+        while len(backend.clicks) < 10:
+            clock.advance_to(deadline)
+            deadline = seq.step()
+        self.assertAlmostEqual(clock.now, 9 / 50, delta=0.021)
+        seq.stop()
+        self.assertEqual(seq.outcome, STOPPED)
+
+    def test_failsafe_and_plan_errors(self) -> None:
+        events = _Events()
+        clock = VirtualClock()
+        seq = Sequencer(_plan(), RecordingBackend(clock, SCREEN, failsafe_after=1), _params(0), events, clock)
+        seq.start()
+        while seq.step() is not None:
+            pass
+        self.assertEqual(seq.outcome, FAILSAFE)
+        self.assertEqual(len(events.errors), 1)
+
+        seq = Sequencer(_plan(), RecordingBackend(clock, ScreenSize(20, 20)), _params(0), clock=clock)
+        self.assertIsNone(seq.start())
+        self.assertEqual(seq.outcome, PLAN_ERROR)
+
+
+class RunBlockingTests(unittest.TestCase):
+    def test_runs_to_completion_and_honours_stop(self) -> None:
+        backend = RecordingBackend(VirtualClock(), SCREEN)
+        seq = Sequencer(_plan(LoopSettings(enabled=True, count=3)), backend, _params(0))
+        self.assertEqual(run_blocking(seq, RunControl()), COMPLETED)
+        self.assertEqual(len(backend.clicks), 6)
+
+        control = RunControl()
+        control.request_stop()
+        seq = Sequencer(_plan(), RecordingBackend(VirtualClock(), SCREEN), _params(0))
+        self.assertEqual(run_blocking(seq, control), STOPPED)
+        self.assertIsNotNone(control.stop_latency)
+
+
+if __name__ == "__main__":
+    unittest.main()
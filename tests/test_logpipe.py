@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import tempfile
+import unittest
+
+from clicker_core.logpipe import DroppingQueueHandler, LogPipeline, log_event
+
+
+class DroppingQueueHandlerTests(unittest.TestCase):
+    def test_drops_when_full_and_reports_later(self) -> None:
+        q: queue.Queue = queue.Queue(maxsize=2)
+        handler = DroppingQueueHandler(q)
+        logger = logging.Logger("test_drop")
+        logger.addHandler(handler)
+        for i in range(5):
+            logger.info("msg %s", i)
+        self.assertEqual(handler.dropped, 3)
+
+        q.get_nowait()
+        q.get_nowait()
+        logger.info("after")
+        messages = [q.get_nowait().getMessage() for _ in range(2)]
+        self.assertEqual(messages, ["log_dropped count=3", "after"])
+
+
+class LogPipelineTests(unittest.TestCase):
+    def test_writes_structured_event(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.log")
+            logger = logging.Logger("test_pipeline")
+            pipeline = LogPipeline(logger, path, capacity=8)
+            log_event(logger, "run_summary", clicks=3, outcome="completed")
+            pipeline.stop()
+            with open(path, encoding="utf-8") as f:
+                line = f.read().strip()
+        event, payload = line.split(" ", 3)[3].split(" ", 1)
+        self.assertEqual(event, "run_summary")
+        self.assertEqual(json.loads(payload), {"clicks": 3, "outcome": "completed"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import random
 import unittest
+from unittest import mock
 
 from clicker_core.model import (
     AppConfig,
+    BurstSettings,
     ClickPoint,
     HotkeySettings,
     LoopSettings,
+    PointStore,
     ScreenSize,
+    apply_row_move,
     config_from_json_dict,
     config_to_json_dict_v2,
+    resolve_pixels,
+    row_moves,
+    row_ranges,
+    to_absolute,
     validate_point,
+    validate_points,
 )
+from clicker_core.model import _numpy
 
 
 class ModelTests(unittest.TestCase):
@@ -52,6 +63,18 @@ class ModelTests(unittest.TestCase):
         self.assertEqual(cfg2.loop.count, 2)
         self.assertTrue(cfg2.hotkeys.enabled)
 
+    def test_burst_roundtrip_and_clamp(self) -> None:
+        cfg = AppConfig(points=[ClickPoint.from_abs(1, 2)], burst=BurstSettings(enabled=True, cps=250))
+        cfg2 = config_from_json_dict(config_to_json_dict_v2(cfg))
+        self.assertTrue(cfg2.burst.enabled)
+        self.assertEqual(cfg2.burst.cps, 250)
+
+        data = config_to_json_dict_v2(cfg)
+        data["settings"]["burst"]["cps"] = 10**6
+        self.assertEqual(config_from_json_dict(data).burst.cps, 1000)
+        del data["settings"]["burst"]
+        self.assertFalse(config_from_json_dict(data).burst.enabled)
+
     def test_read_v1_compat(self) -> None:
         v1 = {
             "version": 1,
@@ -65,5 +88,145 @@ class ModelTests(unittest.TestCase):
         self.assertEqual(int(cfg.points[0].y), 20)
 
 
+class RowMoveTests(unittest.TestCase):
+    def _move(self, n: int, rows: list[int], dest: int) -> list[int]:
+        seq = list(range(n))
+        for first, last, to in row_moves(rows, dest):
+            self.assertFalse(first <= to <= last + 1)
+            apply_row_move(seq, first, last, to)
+        return seq
+
+    def test_single_row_down_and_up(self) -> None:
+        self.assertEqual(self._move(5, [1], 4), [0, 2, 3, 1, 4])
+        self.assertEqual(self._move(5, [3], 0), [3, 0, 1, 2, 4])
+
+    def test_scattered_selection_stays_ordered(self) -> None:
+        self.assertEqual(self._move(10, [1, 2, 3, 6, 7, 8], 7), [0, 4, 5, 1, 2, 3, 6, 7, 8, 9])
+
+    def test_noop_move_emits_nothing(self) -> None:
+        self.assertEqual(row_moves([2, 3], 4), [])
+        self.assertEqual(row_moves([2, 3], 2), [])
+
+    def test_row_ranges_bottom_up(self) -> None:
+        self.assertEqual(row_ranges([1, 2, 4, 5, 6, 9, 99, -1], 8), [(4, 6), (1, 2)])
+        self.assertEqual(row_ranges([], 3), [])
+
+
+class PointStoreTests(unittest.TestCase):
+    def _store(self) -> PointStore:
+        screen = ScreenSize(width=1920, height=1080)
+        return PointStore.from_points(
+            [
+                ClickPoint.from_abs(1, 2, screen=screen),
+                ClickPoint.from_ratio(0.5, 0.25),
+                ClickPoint.from_abs(3, 4, screen=ScreenSize(width=1920, height=1080)),
+            ]
+        )
+
+    def test_roundtrip_and_screen_interning(self) -> None:
+        store = self._store()
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store[1], ClickPoint.from_ratio(0.5, 0.25))
+        self.assertEqual(store[-1].screen, ScreenSize(width=1920, height=1080))
+        self.assertEqual(len(store.screens), 1)
+        self.assertEqual(list(store.screen_ids), [0, -1, 0])
+        self.assertEqual(store.nbytes, 3 * 21)
+
+    def test_snapshot_is_copy_on_write(self) -> None:
+        store = self._store()
+        snap = store.snapshot()
+        self.assertIs(snap.xs, store.xs)
+        store.append(ClickPoint.from_abs(9, 9))
+        store[0] = ClickPoint.from_abs(7, 7)
+        self.assertEqual(len(snap), 3)
+        self.assertEqual(snap[0].x, 1.0)
+        self.assertEqual(len(store), 4)
+        self.assertIsNot(snap.xs, store.xs)
+
+    def test_remove_and_move(self) -> None:
+        store = PointStore.from_points(ClickPoint.from_abs(i, i) for i in range(6))
+        store.remove_rows([1, 2, 4, 99])
+        self.assertEqual([int(p.x) for p in store], [0, 3, 5])
+        for first, last, to in row_moves([0], 3):
+            store.move(first, last, to)
+        self.assertEqual([int(p.x) for p in store], [3, 5, 0])
+
+    def test_config_from_json_returns_store(self) -> None:
+        cfg = config_from_json_dict({"version": 2, "points": [{"mode": "abs", "x": 1, "y": 2}]})
+        self.assertIsInstance(cfg.points, PointStore)
+
+
+class BulkResolveTests(unittest.TestCase):
+    def _random_store(self) -> PointStore:
+        rng = random.Random(7)
+        points = []
+        for _ in range(500):
+            if rng.random() < 0.5:
+                points.append(ClickPoint.from_ratio(rng.uniform(-0.1, 1.1), rng.uniform(-0.1, 1.1)))
+            else:
+                points.append(ClickPoint(mode="abs", x=rng.uniform(-5, 110), y=rng.uniform(-5, 110)))
+        return PointStore.from_points(points)
+
+    def _check_matches_scalar(self) -> None:
+        store = self._random_store()
+        screen = ScreenSize(width=100, height=100)
+        mask, failures = validate_points(store, screen, limit=5)
+        expected = [validate_point(p, screen)[0] for p in store]
+        self.assertEqual([bool(v) for v in mask], expected)
+        self.assertEqual(failures, [i for i, ok in enumerate(expected) if not ok][:5])
+
+        xs, ys = resolve_pixels(store, screen)
+        self.assertEqual(list(zip(xs, ys)), [p.to_pixels(screen) for p in store])
+
+    def test_matches_scalar_pure_python(self) -> None:
+        with mock.patch("clicker_core.model._numpy", return_value=None):
+            self._check_matches_scalar()
+
+    def test_non_finite_points_are_invalid_without_numpy(self) -> None:
+        screen = ScreenSize(width=100, height=100)
+        points = [
+            ClickPoint(mode="abs", x=1, y=1),
+            ClickPoint(mode="abs", x=float("nan"), y=1),
+            ClickPoint(mode="abs", x=1, y=float("inf")),
+            ClickPoint(mode="ratio", x=float("nan"), y=0.5),
+        ]
+        with mock.patch("clicker_core.model._numpy", return_value=None):
+            mask, failures = validate_points(PointStore.from_points(points), screen)
+        self.assertEqual(list(mask), [1, 0, 0, 0])
+        self.assertEqual(failures, [1, 2, 3])
+        self.assertEqual([validate_point(p, screen)[0] for p in points], [True, False, False, False])
+
+    @unittest.skipUnless(_numpy(), "NumPy 未安装，向量化实现无法测试")
+    def test_matches_scalar_numpy(self) -> None:
+        self._check_matches_scalar()
+
+    def test_out_of_range_pixels_raise_in_both_backends(self) -> None:
+        screen = ScreenSize(width=100, height=100)
+        backends = [None] + ([_numpy()] if _numpy() else [])
+        for value in (1e12, -1e12, float("nan"), float("inf")):
+            store = PointStore.from_points([ClickPoint(mode="abs", x=1, y=1), ClickPoint(mode="abs", x=value, y=1)])
+            for np in backends:
+                with self.subTest(value=value, numpy=np is not None):
+                    with mock.patch("clicker_core.model._numpy", return_value=np):
+                        with self.assertRaises(OverflowError):
+                            resolve_pixels(store, screen)
+
+    def test_to_absolute_assigns_screen(self) -> None:
+        screen = ScreenSize(width=101, height=101)
+        other = ScreenSize(width=50, height=50)
+        store = PointStore.from_points(
+            [ClickPoint.from_ratio(0.5, 0.5), ClickPoint.from_abs(1, 2, screen=other), ClickPoint.from_abs(3, 4)]
+        )
+        result = to_absolute(store, screen)
+        self.assertEqual(
+            list(result),
+            [
+                ClickPoint.from_abs(50, 50, screen=screen),
+                ClickPoint.from_abs(1, 2, screen=other),
+                ClickPoint.from_abs(3, 4, screen=screen),
+            ],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
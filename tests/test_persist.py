@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import unittest
+
+from clicker_core.configio import load_config_file, save_config_file
+from clicker_core.model import AppConfig, ClickPoint, PointStore
+from clicker_core.persist import BackgroundSaver, SaveResult, atomic_write
+
+
+class AtomicWriteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "a.json")
+
+    def test_failed_write_keeps_original(self) -> None:
+        atomic_write(self.path, lambda f: f.write("old"))
+
+        def broken(f) -> None:
+            f.write("partial")
+            raise OSError("disk full")
+
+        with self.assertRaises(OSError):
+            atomic_write(self.path, broken)
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "old")
+        self.assertEqual(os.listdir(self._tmp.name), ["a.json"])
+
+    @unittest.skipUnless(os.name == "posix", "文件权限位仅在 POSIX 上有意义")
+    def test_keeps_existing_mode_and_honours_umask(self) -> None:
+        atomic_write(self.path, lambda f: f.write("a"))
+        mask = os.umask(0)
+        os.umask(mask)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o666 & ~mask)
+
+        os.chmod(self.path, 0o640)
+        atomic_write(self.path, lambda f: f.write("b"))
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+
+
+class BackgroundSaverTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "a.json")
+
+    def test_saves_snapshot_and_reports(self) -> None:
+        results: list[SaveResult] = []
+        saver = BackgroundSaver(save_config_file, on_done=results.append)
+        self.addCleanup(saver.close)
+        store = PointStore.from_points([ClickPoint.from_abs(1, 2)])
+        saver.save(self.path, AppConfig(points=store))
+        # 提交后的修改不影响本次保存的内容
+        store.append(ClickPoint.from_abs(3, 4))
+        self.assertTrue(saver.flush(timeout=5))
+        self.assertEqual(list(load_config_file(self.path).points), [ClickPoint.from_abs(1, 2)])
+        self.assertEqual([r.error for r in results], [None])
+
+    def test_coalesces_pending_saves_for_same_path(self) -> None:
+        gate = threading.Event()
+        calls: list[int] = []
+
+        def slow_save(path, config, screen) -> None:
+            gate.wait(5)
+            calls.append(len(config.points))
+
+        saver = BackgroundSaver(slow_save)
+        self.addCleanup(saver.close)
+        saver.save("busy", AppConfig(points=[]))
+        for n in range(1, 6):
+            saver.save(self.path, AppConfig(points=[ClickPoint.from_abs(0, 0)] * n), autosave=True)
+        gate.set()
+        self.assertTrue(saver.flush(timeout=5))
+        self.assertEqual(sorted(calls), [0, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import unittest
+
+from clicker_core.model import ClickPoint, ScreenSize
+from clicker_core.plan import PlanError, StreamingPlan, compile_plan
+
+
+class CompilePlanTests(unittest.TestCase):
+    def test_resolves_abs_and_ratio_points(self) -> None:
+        screen = ScreenSize(width=101, height=201)
+        plan = compile_plan([ClickPoint.from_abs(3, 4), ClickPoint.from_ratio(0.5, 1.0)], screen)
+        self.assertEqual(len(plan), 2)
+        self.assertEqual(list(plan.xs), [3, 50])
+        self.assertEqual(list(plan.ys), [4, 200])
+        self.assertEqual(plan.xs.typecode, "i")
+
+    def test_out_of_bounds_reports_index(self) -> None:
+        screen = ScreenSize(width=100, height=100)
+        with self.assertRaises(PlanError) as ctx:
+            compile_plan([ClickPoint.from_abs(1, 1), ClickPoint.from_abs(100, 5)], screen)
+        self.assertEqual(ctx.exception.index, 1)
+
+
+class StreamingPlanTests(unittest.TestCase):
+    def test_grows_while_iterating_and_rescreens(self) -> None:
+        plan = StreamingPlan(iter([ClickPoint.from_ratio(0.5, 0.5), ClickPoint.from_abs(9, 9)]), ScreenSize(101, 101))
+        steps = plan.steps()
+        self.assertEqual(next(steps), 0)
+        self.assertEqual((len(plan), plan.xs[0]), (1, 50))
+        plan.rescreen(ScreenSize(201, 201))
+        self.assertEqual(next(steps), 1)
+        self.assertEqual(list(plan.xs), [100, 9])
+        self.assertEqual(list(steps), [])
+        self.assertTrue(plan.done)
+
+    def test_without_history_keeps_only_current_point(self) -> None:
+        points = [ClickPoint.from_abs(i, i) for i in range(5)] + [ClickPoint.from_ratio(0.5, 0.5), ClickPoint.from_abs(80, 80)]
+        plan = StreamingPlan(iter(points), ScreenSize(101, 101), keep=False)
+        steps = plan.steps()
+        for i in range(5):
+            self.assertEqual(next(steps), i)
+            self.assertEqual(plan.pixel(i), (i, i))
+            self.assertEqual((len(plan.points), len(plan.xs)), (1, 1))
+        self.assertEqual(len(plan), 5)
+
+        self.assertEqual(next(steps), 5)
+        plan.rescreen(ScreenSize(201, 201))
+        self.assertEqual(plan.pixel(5), (100, 100))
+        self.assertEqual(next(steps), 6)
+        with self.assertRaises(PlanError) as ctx:
+            plan.rescreen(ScreenSize(50, 50))
+        self.assertEqual(ctx.exception.index, 6)
+        self.assertEqual(list(steps), [])
+        self.assertEqual((len(plan), len(plan.xs)), (7, 1))
+
+    def test_out_of_bounds_while_streaming(self) -> None:
+        plan = StreamingPlan(iter([ClickPoint.from_abs(1, 1), ClickPoint.from_abs(50, 0)]), ScreenSize(10, 10))
+        with self.assertRaises(PlanError) as ctx:
+            list(plan.steps())
+        self.assertEqual(ctx.exception.index, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
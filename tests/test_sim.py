@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+import unittest
+
+from clicker_core.control import ParamBlock, ProgressBlock, RunParams
+from clicker_core.engine import COMPLETED, FAILSAFE, STOPPED, InstrumentObserver, RunPlan, Sequencer
+from clicker_core.model import BurstSettings, ClickPoint, LoopSettings, PointStore, ScreenSize
+from clicker_core.sim import RecordingBackend, VirtualClock, VirtualControl, run_virtual
+from clicker_core.telemetry import ClickTelemetry
+from clicker_core.timing import PrecisionTimer
+
+HOUR = 3600.0
+
+
+def _plan(infinite: bool = True, burst: bool = False) -> RunPlan:
+    points = [ClickPoint("ratio", 0.0, 0.0), ClickPoint("ratio", 0.5, 0.5), ClickPoint("ratio", 1.0, 1.0)]
+    return RunPlan(
+        points=PointStore.from_points(points),
+        loop=LoopSettings(enabled=True, infinite=infinite, count=2),
+        burst=BurstSettings(enabled=burst),
+    )
+
+
+class VirtualClockTests(unittest.TestCase):
+    def test_events_fire_in_order_and_interrupt_sleep(self) -> None:
+        clock = VirtualClock()
+        fired: list[tuple[str, float]] = []
+        clock.call_at(2.0, lambda: fired.append(("b", clock())))
+        clock.call_at(1.0, lambda: fired.append(("a", clock())))
+        self.assertTrue(clock.sleep(5.0))
+        self.assertEqual((clock(), fired), (1.0, [("a", 1.0)]))
+        self.assertTrue(clock.advance(10.0))
+        self.assertEqual(clock(), 11.0)
+        self.assertEqual(fired[-1], ("b", 2.0))
+        self.assertFalse(clock.sleep(1.0))
+
+    def test_precision_timer_never_spins_on_virtual_time(self) -> None:
+        clock = VirtualClock()
+        timer = PrecisionTimer(clock, spin_threshold=0.0)
+        self.assertTrue(timer.wait_until(42.0, clock.sleep))
+        self.assertEqual(clock(), 42.0)
+
+
+class SimulatedRunTests(unittest.TestCase):
+    def _simulate(self) -> tuple[Sequencer, RecordingBackend, ClickTelemetry, ProgressBlock]:
+        clock = VirtualClock()
+        backend = RecordingBackend(clock, ScreenSize(1001, 501), click_cost=0.0002)
+        params = ParamBlock(RunParams(interval_ms=100, loop_interval_ms=400))
+        telemetry = ClickTelemetry()
+        progress = ProgressBlock()
+        seq = Sequencer(_plan(), backend, params, InstrumentObserver(progress, telemetry), clock)
+        control = VirtualControl(clock)
+
+        clock.call_at(600.0, control.request_pause)
+        clock.call_at(900.0, control.request_resume)
+        clock.call_at(1200.0, lambda: params.publish(RunParams(interval_ms=50, loop_interval_ms=0)))
+
+        def rescreen() -> None:
+            backend.set_screen(ScreenSize(2001, 1001))
+            seq.notify_screen_changed()
+
+        clock.call_at(1800.0, rescreen)
+        clock.call_at(2400.0, control.request_pause)
+        clock.call_at(2400.5, control.request_resume)
+        run_virtual(seq, clock, until=HOUR, control=control)
+        return seq, backend, telemetry, progress
+
+    def test_hour_with_pauses_param_and_screen_changes(self) -> None:
+        started = time.perf_counter()
+        seq, backend, telemetry, progress = self._simulate()
+        self.assertLess(time.perf_counter() - started, 5.0)
+
+        self.assertEqual(seq.outcome, STOPPED)
+        clicks = backend.clicks
+        self.assertEqual(len(clicks), seq.clicks)
+        self.assertFalse(any(600.0 <= c.at < 900.0 for c in clicks))
+        self.assertFalse(any(2400.0 <= c.at < 2400.5 for c in clicks))
+        self.assertLess(clicks[-1].at, HOUR)
+
+        # 每轮 3 个点：前 20 分钟（扣除 5 分钟暂停）周期 0.1+0.1+0.1+0.4=0.7s
+        before = [c for c in clicks if c.at < 600.0]
+        self.assertAlmostEqual(len(before), 600.0 / 0.7 * 3, delta=3)
+        # 改参数后每点 50ms、无轮间隔
+        window = [c for c in clicks if 1500.0 <= c.at < 1600.0]
+        self.assertAlmostEqual(len(window), 100.0 / 0.05, delta=2)
+
+        self.assertIn((500, 250), {(c.x, c.y) for c in clicks if c.at < 1800.0})
+        late = {(c.x, c.y) for c in clicks if c.at > 1800.0}
+        self.assertEqual(late, {(0, 0), (1000, 500), (2000, 1000)})
+
+        # 虚拟时间下没有调度误差
+        self.assertEqual(telemetry.summary().max_jitter, 0.0)
+        self.assertEqual(progress.snapshot().cycle, seq.cycle)
+
+    def test_simulation_is_deterministic(self) -> None:
+        first = self._simulate()[1].clicks
+        second = self._simulate()[1].clicks
+        self.assertEqual(first, second)
+
+    def test_finite_loops_complete_and_failsafe_stops(self) -> None:
+        clock = VirtualClock()
+        backend = RecordingBackend(clock)
+        seq = Sequencer(_plan(infinite=False), backend, ParamBlock(RunParams(interval_ms=10)), clock=clock)
+        self.assertEqual(run_virtual(seq, clock), COMPLETED)
+        self.assertEqual((len(backend.clicks), seq.cycle), (6, 2))
+
+        clock = VirtualClock()
+        backend = RecordingBackend(clock, failsafe_after=1000)
+        seq = Sequencer(_plan(burst=True), backend, ParamBlock(RunParams(burst_cps=200)), clock=clock)
+        self.assertEqual(run_virtual(seq, clock, until=HOUR), FAILSAFE)
+        self.assertEqual(len(backend.clicks), 1000)
+        self.assertAlmostEqual(clock(), 1000 / 200, delta=0.05)
+
+    def test_pause_without_resume_ends_run(self) -> None:
+        clock = VirtualClock()
+        backend = RecordingBackend(clock)
+        seq = Sequencer(_plan(), backend, ParamBlock(RunParams(interval_ms=100)), clock=clock)
+        control = VirtualControl(clock)
+        clock.call_at(0.95, control.request_pause)
+        self.assertEqual(run_virtual(seq, clock, control=control), STOPPED)
+        self.assertEqual(len(backend.clicks), 10)
+        self.assertIsNotNone(control.stop_latency)
+
+    def test_stop_during_slow_click_is_not_lost(self) -> None:
+        clock = VirtualClock()
+        backend = RecordingBackend(clock, click_cost=0.5)
+        seq = Sequencer(_plan(infinite=False), backend, ParamBlock(RunParams(interval_ms=0)), clock=clock)
+        control = VirtualControl(clock)
+        # 停止请求落在第一次点击途中：该次点击完成后不再继续
+        clock.call_at(0.1, control.request_stop)
+        self.assertEqual(run_virtual(seq, clock, control=control), STOPPED)
+        self.assertEqual(len(backend.clicks), 1)
+        self.assertEqual(clock(), 0.5)
+
+    def test_finish_keeps_first_outcome(self) -> None:
+        class _StopOnClick(RecordingBackend):
+            sequencer: Sequencer
+
+            def click(self, x: int, y: int) -> None:
+                super().click(x, y)
+                self.sequencer.stop()
+
+        clock = VirtualClock()
+        backend = _StopOnClick(clock)
+        points = PointStore.from_points([ClickPoint("abs", 1, 1)])
+        seq = Sequencer(RunPlan(points=points, loop=LoopSettings()), backend, clock=clock)
+        backend.sequencer = seq
+        seq.start()
+        self.assertIsNone(seq.step())
+        # 回调中的停止先生效，本轮随后的自然结束不覆盖它
+        self.assertEqual(seq.outcome, STOPPED)
+
+if __name__ == "__main__":
+    unittest.main()
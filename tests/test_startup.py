@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+import unittest
+
+from clicker_core.startup import StartupProfile
+
+
+class StartupProfileTests(unittest.TestCase):
+    def test_records_phases_and_import_times(self) -> None:
+        profile = StartupProfile()
+        sys.modules.pop("colorsys", None)
+        profile.install_import_hook()
+        try:
+            with profile.phase("import"):
+                import colorsys  # noqa: F401
+        finally:
+            profile.remove_import_hook()
+        profile.mark("done")
+
+        self.assertEqual([p[0] for p in profile.phases], ["import", "done"])
+        self.assertIn("colorsys", profile.imports)
+        timing = profile.imports["colorsys"]
+        self.assertGreaterEqual(timing.inclusive, timing.self_time)
+        self.assertIn("colorsys", profile.report())
+        self.assertFalse(any(type(f).__name__ == "_ImportTimer" for f in sys.meta_path))
+
+    def test_ignores_imports_on_other_threads(self) -> None:
+        profile = StartupProfile()
+        sys.modules.pop("graphlib", None)
+        profile.install_import_hook()
+        try:
+            worker = threading.Thread(target=importlib.import_module, args=("graphlib",))
+            worker.start()
+            worker.join()
+        finally:
+            profile.remove_import_hook()
+        self.assertIn("graphlib", sys.modules)
+        self.assertNotIn("graphlib", profile.imports)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+import unittest
+
+from clicker_core.model import (
+    AppConfig,
+    BurstSettings,
+    ClickPoint,
+    ScreenSize,
+    config_from_json_dict,
+    config_to_json_dict_v2,
+)
+from clicker_core.stream import ConfigStream, ConfigStreamError, prefetch, write_config_json
+
+
+class ConfigStreamTests(unittest.TestCase):
+    def _config(self) -> AppConfig:
+        points = [ClickPoint.from_abs(i, i * 2) for i in range(500)]
+        points.append(ClickPoint.from_ratio(0.25, 0.75))
+        return AppConfig(points=points, interval_ms=321, burst=BurstSettings(enabled=True, cps=250))
+
+    def test_matches_full_parse_with_tiny_chunks(self) -> None:
+        data = config_to_json_dict_v2(self._config(), ScreenSize(width=800, height=600))
+        text = json.dumps(data, indent=2)
+        stream = ConfigStream(io.StringIO(text), chunk_size=7)
+        points = list(stream.points())
+        expected = config_from_json_dict(data)
+        self.assertEqual(points, list(expected.points))
+        self.assertEqual(stream.config().burst, expected.burst)
+        self.assertEqual(stream.config().interval_ms, 321)
+
+    def test_settings_after_points(self) -> None:
+        text = '{"version": 1, "points": [{"x": 1, "y": 2}, "bad"], "settings": {"interval_ms": 900}}'
+        stream = ConfigStream(io.StringIO(text), chunk_size=5)
+        self.assertEqual(list(stream.points()), [ClickPoint.from_abs(1, 2)])
+        self.assertTrue(stream.done)
+        self.assertEqual(stream.config().interval_ms, 900)
+
+    def test_version_after_points(self) -> None:
+        data = {"points": [{"mode": "ratio", "x": 0.5, "y": 0.25}], "settings": {}, "version": 2}
+        text = json.dumps(data, sort_keys=True)
+        stream = ConfigStream(io.StringIO(text), chunk_size=5)
+        self.assertEqual(list(stream.points()), list(config_from_json_dict(data).points))
+        self.assertEqual(list(ConfigStream(io.StringIO(text)).points()), [ClickPoint.from_ratio(0.5, 0.25)])
+
+    def test_truncated_file_raises(self) -> None:
+        stream = ConfigStream(io.StringIO('{"version": 2, "points": [{"x": 1, "y": 2},'), chunk_size=4)
+        with self.assertRaises(ConfigStreamError):
+            list(stream.points())
+
+
+class WriteConfigJsonTests(unittest.TestCase):
+    def test_v3_roundtrip_with_screens_table(self) -> None:
+        wide = ScreenSize(width=1920, height=1080)
+        points = [ClickPoint.from_abs(i, i + 1, wide) for i in range(10)]
+        points += [ClickPoint.from_ratio(0.125, 0.5), ClickPoint(mode="abs", x=1.5, y=2.0, screen=ScreenSize(800, 600))]
+        config = AppConfig(points=points, interval_ms=123, burst=BurstSettings(enabled=True, cps=40))
+
+        buf = io.StringIO()
+        write_config_json(buf, config, wide, chunk_points=3)
+        data = json.loads(buf.getvalue())
+        self.assertEqual(data["version"], 3)
+        self.assertEqual(data["screens"], [{"w": 1920, "h": 1080}, {"w": 800, "h": 600}])
+
+        parsed = config_from_json_dict(data)
+        self.assertEqual(list(parsed.points), points)
+        self.assertEqual((parsed.interval_ms, parsed.burst), (123, config.burst))
+        streamed = ConfigStream(io.StringIO(buf.getvalue()), chunk_size=11)
+        self.assertEqual(list(streamed.points()), points)
+
+    def test_empty_points(self) -> None:
+        buf = io.StringIO()
+        write_config_json(buf, AppConfig(points=[]))
+        self.assertEqual(json.loads(buf.getvalue())["points"], [])
+
+    def test_rejects_non_finite_coordinates_before_writing(self) -> None:
+        screen = ScreenSize(width=1920, height=1080)
+        for bad in (float("nan"), float("inf"), float("-inf")):
+            points = [ClickPoint.from_abs(1, 2, screen), ClickPoint(mode="abs", x=3.0, y=bad, screen=screen)]
+            buf = io.StringIO()
+            with self.assertRaisesRegex(ConfigStreamError, "第 2 个点"):
+                write_config_json(buf, AppConfig(points=points))
+            self.assertEqual(buf.getvalue(), "")
+
+
+class PrefetchTests(unittest.TestCase):
+    def test_preserves_order_and_errors(self) -> None:
+        self.assertEqual(list(prefetch(range(1000), maxsize=2, batch=7)), list(range(1000)))
+
+        def broken():
+            yield 1
+            raise OSError("boom")
+
+        it = prefetch(broken())
+        with self.assertRaises(OSError):
+            list(it)
+
+    def test_first_item_is_not_held_for_a_batch(self) -> None:
+        release = threading.Event()
+
+        def slow():
+            yield 0
+            release.wait(5)
+            yield 1
+
+        it = prefetch(slow(), batch=256)
+        started = time.perf_counter()
+        try:
+            self.assertEqual(next(it), 0)
+            self.assertLess(time.perf_counter() - started, 2.0)
+        finally:
+            release.set()
+        self.assertEqual(list(it), [1])
+
+    def test_close_stops_producer(self) -> None:
+        closed: list[bool] = []
+
+        def endless():
+            try:
+                n = 0
+                while True:
+                    yield n
+                    n += 1
+            finally:
+                closed.append(True)
+
+        it = prefetch(endless(), maxsize=1, batch=4)
+        self.assertEqual(next(it), 0)
+        it.close()
+        for _ in range(100):
+            if closed:
+                break
+            time.sleep(0.01)
+        self.assertEqual(closed, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
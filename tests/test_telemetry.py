@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import unittest
+
+from clicker_core.telemetry import ClickTelemetry
+
+
+class ClickTelemetryTests(unittest.TestCase):
+    def test_empty(self) -> None:
+        t = ClickTelemetry()
+        self.assertEqual(t.window().count, 0)
+        self.assertEqual(t.summary().count, 0)
+
+    def test_window_percentiles_after_wraparound(self) -> None:
+        t = ClickTelemetry(capacity=100)
+        # 前 100 次偏差 50ms，之后 100 次偏差为 0..99 × 0.01ms，环形缓冲只保留后者
+        for i in range(100):
+            s = i * 0.01
+            t.record(s, s + 0.050, s + 0.051)
+        for i in range(100):
+            s = 1.0 + i * 0.01
+            t.record(s, s + i * 1e-5, s + i * 1e-5 + 0.002)
+        stats = t.window()
+        self.assertEqual(stats.count, 200)
+        self.assertAlmostEqual(stats.jitter.p50, 0.50, places=6)
+        self.assertAlmostEqual(stats.jitter.p99, 0.99, places=6)
+        self.assertAlmostEqual(stats.latency.p95, 2.0, places=6)
+        self.assertAlmostEqual(stats.cps, 100.0, delta=0.5)
+
+    def test_summary_covers_whole_run(self) -> None:
+        t = ClickTelemetry(capacity=10)
+        for i in range(1000):
+            s = i * 0.001
+            jitter = 0.020 if i % 200 == 100 else 0.0001
+            t.record(s, s + jitter, s + jitter + 0.0005)
+        stats = t.summary()
+        self.assertEqual(stats.count, 1000)
+        self.assertLessEqual(abs(stats.jitter.p50 - 0.1), 0.05 + 1e-9)
+        self.assertLessEqual(abs(stats.jitter.p99 - 0.1), 0.05 + 1e-9)
+        self.assertAlmostEqual(stats.max_jitter, 20.0, places=6)
+        self.assertLessEqual(abs(stats.latency.p95 - 0.5), 0.05 + 1e-9)
+        self.assertAlmostEqual(stats.cps, 1000.0, delta=5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from clicker_core import timing
+from clicker_core.timing import PrecisionTimer, RateMeter, Schedule, TokenBucket, default_spin_threshold
+
+
+class ScheduleTests(unittest.TestCase):
+    def test_absolute_deadlines_do_not_drift(self) -> None:
+        schedule = Schedule(100.0)
+        for i in range(1, 1001):
+            # 即使每次都“晚到”一些，后续截止时间仍以 t0 为基准累加
+            deadline = schedule.advance(0.5, now=schedule.deadline + 0.004)
+            self.assertAlmostEqual(deadline, 100.0 + 0.5 * i, places=6)
+
+    def test_resync_after_large_lag(self) -> None:
+        schedule = Schedule(0.0, max_lag=1.0)
+        self.assertEqual(schedule.advance(0.1, now=50.0), 50.0)
+
+    def test_shift_excludes_pause(self) -> None:
+        schedule = Schedule(0.0)
+        schedule.advance(1.0, now=0.0)
+        schedule.shift(3.0)
+        self.assertEqual(schedule.deadline, 4.0)
+
+
+class PrecisionTimerTests(unittest.TestCase):
+    def test_wait_until_reaches_deadline(self) -> None:
+        timer = PrecisionTimer()
+        deadline = timer.now() + 0.02
+        self.assertTrue(timer.wait_until(deadline))
+        self.assertGreaterEqual(time.perf_counter(), deadline)
+
+    def test_waiter_can_interrupt(self) -> None:
+        timer = PrecisionTimer(spin_threshold=0.001)
+        calls: list[float] = []
+
+        def waiter(timeout: float) -> bool:
+            calls.append(timeout)
+            return True
+
+        self.assertFalse(timer.wait_until(timer.now() + 10.0, waiter))
+        self.assertEqual(len(calls), 1)
+
+
+    def test_old_windows_raises_timer_resolution_instead_of_spinning(self) -> None:
+        old_windows = SimpleNamespace(platform="win32", version_info=(3, 10))
+        with mock.patch.object(timing, "sys", old_windows):
+            with mock.patch.object(timing, "_raise_win_timer_resolution", return_value=True) as raise_res:
+                self.assertEqual(default_spin_threshold(), 0.002)
+            raise_res.assert_called_once_with()
+            # 无法调整粒度时才退回整段自旋
+            with mock.patch.object(timing, "_raise_win_timer_resolution", return_value=False):
+                self.assertEqual(default_spin_threshold(), 0.016)
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_enforces_rate_after_initial_capacity(self) -> None:
+        bucket = TokenBucket(rate=100.0, now=0.0, capacity=2.0)
+        now = 0.0
+        fired: list[float] = []
+        for _ in range(202):
+            now = bucket.reserve(now)
+            fired.append(now)
+        # 前 2 个令牌立即可用，其后严格按 100/s 放行
+        self.assertEqual(fired[:2], [0.0, 0.0])
+        self.assertAlmostEqual(fired[-1], 2.0, places=6)
+
+    def test_reset_drops_accumulated_tokens(self) -> None:
+        bucket = TokenBucket(rate=10.0, now=0.0, capacity=5.0)
+        bucket.reset(100.0)
+        self.assertAlmostEqual(bucket.reserve(100.0), 100.1, places=6)
+
+
+class RateMeterTests(unittest.TestCase):
+    def test_reports_rate_per_window(self) -> None:
+        meter = RateMeter(window=1.0)
+        updated = [meter.tick(i * 0.01) for i in range(101)]
+        self.assertTrue(updated[-1])
+        self.assertAlmostEqual(meter.rate, 100.0, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
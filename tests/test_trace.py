@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import io
+import json
+import unittest
+
+from clicker_core.trace import TraceRecorder
+
+
+class TraceRecorderTests(unittest.TestCase):
+    def test_writes_chrome_trace_events(self) -> None:
+        trace = TraceRecorder(origin=10.0)
+        trace.span("wait", 10.0, 10.5)
+        trace.span("click", 10.5, 10.501, step=3)
+        trace.instant("error", 10.6, message="点击失败")
+        buf = io.StringIO()
+        trace.write(buf, {"points": 4})
+
+        data = json.loads(buf.getvalue())
+        self.assertEqual(data["otherData"], {"points": 4})
+        events = [e for e in data["traceEvents"] if e["ph"] != "M"]
+        self.assertEqual([e["name"] for e in events], ["wait", "click", "error"])
+        wait, click, error = events
+        self.assertEqual((wait["ph"], wait["ts"], wait["dur"]), ("X", 0.0, 500000.0))
+        self.assertEqual(click["args"], {"step": 3})
+        self.assertAlmostEqual(click["dur"], 1000.0, places=3)
+        self.assertEqual(error["ph"], "i")
+        self.assertEqual(error["args"], {"message": "点击失败"})
+
+    def test_drops_beyond_capacity(self) -> None:
+        trace = TraceRecorder(max_events=2)
+        for i in range(5):
+            trace.span("click", i, i + 0.001, step=i)
+        self.assertEqual(len(trace), 2)
+        self.assertEqual(trace.dropped, 3)
+        buf = io.StringIO()
+        trace.write(buf)
+        self.assertEqual(json.loads(buf.getvalue())["otherData"], {"dropped_events": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()